@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
 class AgentConfig:
     # Runner controls
-    max_steps: int = 6
+    max_steps: int = 7
     include_trace: bool = True
-    include_baseline: bool = True
+    # Baseline judge (debug output): off unless a client asks for it
+    include_baseline: bool = False
+
+    # Evidence collection: max concurrent fetches per ceremony
+    collect_concurrency: int = 5
+
+    # Ceremony-wide time budget (seconds) shared by every fetch; None = unbounded.
+    # A request may override it with "budget_s".
+    ceremony_budget_s: Optional[float] = 30.0
 
     # --- LLM augmentation (optional) ---
     enable_llm: bool = False
@@ -1,10 +1,13 @@
 # src/siva_guard/agent/runner.py
 from __future__ import annotations
 
+import inspect
 from typing import Any, Dict, List, Optional, Union
 
 from siva_guard.agent.config import AgentConfig
 from siva_guard.agent.state import CeremonyState
+from siva_guard.core.deadline import Deadline
+from siva_guard.pipeline.judge import judge_identity_set
 
 
 def _trace_event(tool_name: str, status: str = "ok", detail: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -19,10 +22,22 @@ def _trace_event(tool_name: str, status: str = "ok", detail: Optional[Dict[str,
     return ev
 
 
+def _takes_cfg(tool: Any) -> bool:
+    # Legacy tools implement run(state); a TypeError raised inside run() must not be
+    # mistaken for that and retried.
+    try:
+        params = list(inspect.signature(tool.run).parameters.values())
+    except (TypeError, ValueError):
+        return True
+    return sum(1 for p in params if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)) >= 2 or any(
+        p.kind == p.VAR_POSITIONAL for p in params
+    )
+
+
 class SivaAgentRunner:
     def __init__(self, tools: List[Any], cfg: Optional[AgentConfig] = None):
         self.tools = tools
-        self.cfg = cfg or AgentConfig(max_steps=6, include_trace=True, include_baseline=True)
+        self.cfg = cfg or AgentConfig(max_steps=7, include_trace=True, include_baseline=False)
 
     def run(self, request_payload: Union[Dict[str, Any], List[Any]]) -> Dict[str, Any]:
         if isinstance(request_payload, list):
@@ -35,12 +50,28 @@ class SivaAgentRunner:
         state.claims = claims
         state.identities = claims
 
-        if not getattr(self.cfg, "include_baseline", True):
+        if not getattr(self.cfg, "include_baseline", False):
             state.baseline = {}
 
+        # Ceremony-wide time budget: request "budget_s" overrides the config default.
+        budget_s = request_payload.get("budget_s")
+        if budget_s is None:
+            budget_s = getattr(self.cfg, "ceremony_budget_s", None)
+        state.deadline = Deadline.after(budget_s)
+
+        # Follow-up round of a ceremony session: reuse unchanged identities.
+        refresh = bool(request_payload.get("refresh"))
+        session = request_payload.get("session")
+        if session is not None:
+            state.session = session
+            state.reuse = session.reusable(claims, refresh=refresh)
+            state.ceremony_id = session.session_id
+            refresh = refresh or session.refresh_pending
+        state.refresh = refresh
+
         agent_trace: List[Dict[str, Any]] = []
         steps_run = 0
-        max_steps = getattr(self.cfg, "max_steps", 6)
+        max_steps = getattr(self.cfg, "max_steps", 7)
         include_trace = getattr(self.cfg, "include_trace", True)
 
         # expose counters to tools
@@ -58,9 +89,9 @@ class SivaAgentRunner:
                 if tool_name in state.tool_cache:
                     summary = state.tool_cache[tool_name]
                 else:
-                    try:
+                    if _takes_cfg(tool):
                         summary = tool.run(state, self.cfg)
-                    except TypeError:
+                    else:
                         summary = tool.run(state)
                     state.tool_cache[tool_name] = summary
 
@@ -85,6 +116,10 @@ class SivaAgentRunner:
         # runner footer
         state.result = state.result or {}
         state.result["agentic"] = {"steps_run": steps_run, "max_steps": max_steps}
+        state.result["budget"] = state.deadline.summary()
+        if state.session is not None:
+            state.session.commit(state)
+            state.result["session"] = state.session.summary(reused=len(state.reuse))
         if include_trace:
             state.result["agent_trace"] = agent_trace
 
@@ -92,24 +127,35 @@ class SivaAgentRunner:
         if state.trace:
             state.result["trace"] = list(state.trace)
 
-        # baseline debug (only if enabled and non-empty)
-        if getattr(self.cfg, "include_baseline", True) and state.baseline:
-            state.result["baseline"] = state.baseline
+        # baseline debug (opt-in): computed only now, from the graph's pairwise scores
+        if getattr(self.cfg, "include_baseline", False):
+            evidences = getattr(state, "evidences", None)
+            if not state.baseline and evidences:
+                state.baseline = judge_identity_set(
+                    evidences,
+                    features=state.identity_features,
+                    graph=state.graph_result,
+                ).model_dump()
+            if state.baseline:
+                state.result["baseline"] = state.baseline
 
         return state.result
 
 
 def build_default_runner(
     *,
-    max_steps: int = 6,
+    max_steps: int = 7,
     include_trace: bool = True,
-    include_baseline: bool = True,
+    include_baseline: bool = False,
     enable_llm: bool = False,
     llm_model: str = "gpt-4.1-mini",
     llm_max_planner_steps: int = 3,
+    collect_concurrency: int = 5,
+    ceremony_budget_s: Optional[float] = 30.0,
 ) -> SivaAgentRunner:
     from siva_guard.agent.tools.collect_evidence import CollectEvidenceTool
     from siva_guard.agent.tools.build_per_identity import BuildPerIdentityTool
+    from siva_guard.agent.tools.enrich_evidence import EnrichEvidenceTool
     from siva_guard.agent.tools.build_graph import BuildGraphTool
     from siva_guard.agent.tools.score_risk import ScoreRiskTool
     from siva_guard.agent.tools.decide_action import DecideActionTool
@@ -117,6 +163,7 @@ def build_default_runner(
     tools: List[Any] = [
         CollectEvidenceTool(),
         BuildPerIdentityTool(),
+        EnrichEvidenceTool(),
         BuildGraphTool(),
     ]
 
@@ -162,6 +209,8 @@ def build_default_runner(
         enable_llm=enable_llm,
         llm_model=llm_model,
         llm_max_planner_steps=llm_max_planner_steps,
+        collect_concurrency=collect_concurrency,
+        ceremony_budget_s=ceremony_budget_s,
     )
 
     return SivaAgentRunner(tools=tools, cfg=cfg)
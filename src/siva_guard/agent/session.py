@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from siva_guard.core.deadline import BUDGET_EXHAUSTED
+from siva_guard.pipeline.next_steps import PROFILE_EDIT_STEPS
+
+from .state import CeremonyState
+
+# Idle sessions are dropped after this long; the store keeps at most MAX_SESSIONS, and
+# at most MAX_SESSION_BYTES of (approximate) session state.
+SESSION_TTL_S = 15 * 60
+MAX_SESSIONS = 1024
+MAX_SESSION_BYTES = 256 * 1024 * 1024
+
+# Rough in-memory cost of one reused graph edge (columns + feature dicts).
+_EDGE_BYTES = 256
+
+
+def claim_key(claim: Any) -> str:
+    """
+    per_identity key for a claim (its claimed identifier).
+    """
+    if isinstance(claim, dict):
+        return str(claim.get("claimed") or "unknown_claimed")
+    return str(getattr(claim, "claimed", None) or "unknown_claimed")
+
+
+def claim_fingerprint(claim: Any) -> str:
+    data = claim.model_dump(mode="json") if hasattr(claim, "model_dump") else claim
+    return json.dumps(data, sort_keys=True, default=str)
+
+
+def approx_size(st: CeremonyState) -> int:
+    """
+    Approximate bytes a session keeps for this round: serialized evidence and
+    per-identity items, plus the graph's edges.
+    """
+    n = len(json.dumps(st.per_identity or {}, default=str))
+    for ev in st.evidences or []:
+        n += len(ev.model_dump_json()) if hasattr(ev, "model_dump_json") else len(json.dumps(ev, default=str))
+    edges = getattr(st.graph_result, "edges", None)
+    if edges is not None:
+        n += _EDGE_BYTES * len(edges)
+    return n
+
+
+@dataclass
+class CeremonySession:
+    """
+    Server-side state for a multi-round ceremony (/verify called again after
+    next_steps such as add_second_identity). Keeps the previous round's evidence,
+    per-identity items and features, enrichment and graph so a follow-up round only fetches and
+    scores identities that were added or changed.
+
+    When the round's next_steps asked for profile edits (PROFILE_EDIT_STEPS, e.g. a
+    temporary bio crosslink) the follow-up round re-fetches every identity: the claims
+    are resubmitted unchanged, but the profiles behind them are not.
+    """
+
+    session_id: str
+    created_at: float = field(default_factory=time.monotonic)
+    updated_at: float = field(default_factory=time.monotonic)
+    rounds: int = 0
+
+    fingerprints: Dict[str, str] = field(default_factory=dict)
+    evidences: Dict[str, Any] = field(default_factory=dict)
+    per_identity: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    identity_features: Dict[str, Any] = field(default_factory=dict)
+    enrichment: Any = None  # pipeline.enrichment.EnrichmentResult
+    graph: Any = None  # pipeline.evidence_graph_v2.GraphV2Result
+    refresh_pending: bool = False
+    size_bytes: int = 0
+
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def reusable(self, claims: List[Any], refresh: bool = False) -> Set[str]:
+        """
+        Claim keys unchanged since the last round. Identities cut short by the
+        ceremony budget are collected again rather than reused; nothing is reused
+        with `refresh` or after a round that asked for profile edits.
+        """
+        out: Set[str] = set()
+        if refresh or self.refresh_pending:
+            return out
+        for c in claims:
+            key = claim_key(c)
+            if self.fingerprints.get(key) != claim_fingerprint(c):
+                continue
+            item = self.per_identity.get(key)
+            if item is None or key not in self.evidences:
+                continue
+            if any(str(e).startswith(BUDGET_EXHAUSTED) for e in (item.get("errors") or [])):
+                continue
+            out.add(key)
+        return out
+
+    def commit(self, st: CeremonyState) -> None:
+        """
+        Remember this round's artifacts for the next one.
+        """
+        self.fingerprints = {claim_key(c): claim_fingerprint(c) for c in st.claims}
+        self.evidences = {claim_key(ev.claim): ev for ev in (st.evidences or [])}
+        self.per_identity = dict(st.per_identity or {})
+        self.identity_features = dict(st.identity_features or {})
+        self.enrichment = st.enrichment
+        self.graph = st.graph_result
+        steps = (st.result or {}).get("next_steps") or []
+        self.refresh_pending = any((s or {}).get("code") in PROFILE_EDIT_STEPS for s in steps)
+        self.size_bytes = approx_size(st)
+        self.rounds += 1
+        self.updated_at = time.monotonic()
+
+    def summary(self, reused: int = 0) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "round": self.rounds,
+            "reused_identities": reused,
+        }
+
+
+class SessionStore:
+    """
+    In-process LRU of ceremony sessions with an idle TTL, bounded by count and by
+    approximate size (sizes are updated by CeremonySession.commit and enforced on the
+    next get_or_create; the session being returned is never evicted).
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = MAX_SESSIONS,
+        ttl_s: float = SESSION_TTL_S,
+        max_bytes: int = MAX_SESSION_BYTES,
+    ):
+        self.max_sessions = max_sessions
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, CeremonySession]" = OrderedDict()
+
+    def _expired(self, s: CeremonySession, now: float) -> bool:
+        return now - s.updated_at > self.ttl_s
+
+    def get_or_create(self, session_id: Optional[str] = None) -> CeremonySession:
+        """
+        The live session for `session_id`, or a new session (fresh id) when it is
+        missing, unknown or expired.
+        """
+        now = time.monotonic()
+        with self._lock:
+            s = self._sessions.get(session_id) if session_id else None
+            if s is not None and self._expired(s, now):
+                del self._sessions[session_id]
+                s = None
+            if s is None:
+                s = CeremonySession(session_id=uuid.uuid4().hex)
+                self._sessions[s.session_id] = s
+            self._sessions.move_to_end(s.session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+            total = sum(x.size_bytes for x in self._sessions.values())
+            while total > self.max_bytes and len(self._sessions) > 1:
+                _, evicted = self._sessions.popitem(last=False)
+                total -= evicted.size_bytes
+            return s
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+__all__ = [
+    "CeremonySession",
+    "MAX_SESSION_BYTES",
+    "MAX_SESSIONS",
+    "SESSION_TTL_S",
+    "SessionStore",
+    "approx_size",
+    "claim_fingerprint",
+    "claim_key",
+]
@@ -36,8 +36,11 @@
 # src/siva_guard/agent/state.py
 from __future__ import annotations
 
+import uuid
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
+
+from siva_guard.core.deadline import Deadline
 
 from .trace import TraceLog
 
@@ -74,7 +77,14 @@ class CeremonyState:
     # Pipeline artifacts populated by tools
     evidence: Any = None
     per_identity: Optional[Dict[str, Any]] = None
+    identity_features: Dict[str, Any] = field(default_factory=dict)  # pipeline.identity_features.IdentityFeatures
+    # Identity analysis cache (pipeline/identity_cache.py): key per fresh identity, and
+    # the analyses found for them (their enrichment / node features / risk are skipped).
+    analysis_keys: Dict[str, Any] = field(default_factory=dict)
+    analysis_hits: Dict[str, Any] = field(default_factory=dict)
+    enrichment: Any = None  # pipeline.enrichment.EnrichmentResult
     evidence_graph: Optional[Dict[str, Any]] = None
+    graph_result: Any = None  # pipeline.evidence_graph_v2.GraphV2Result
 
     # Common outputs (score_risk / build_graph tools may populate these)
     substitution_risk: Optional[float] = None
@@ -95,3 +105,18 @@ class CeremonyState:
 
     # Runner caching
     tool_cache: Dict[str, Any] = field(default_factory=dict)
+
+    # Ceremony time budget (set by the runner; None = unbounded)
+    deadline: Optional[Deadline] = None
+
+    # Incremental ceremony sessions (agent/session.py): claim keys unchanged since
+    # the previous round, whose evidence / features / edges are reused.
+    session: Any = None
+    reuse: Set[str] = field(default_factory=set)
+
+    # Revalidate cached profile fetches (explicit "refresh", or the previous session
+    # round asked for profile edits).
+    refresh: bool = False
+
+    # Cross-ceremony identity index key (the session id for multi-round ceremonies).
+    ceremony_id: str = field(default_factory=lambda: uuid.uuid4().hex)
@@ -1,5 +1,6 @@
 from .collect_evidence import CollectEvidenceTool
 from .build_per_identity import BuildPerIdentityTool
+from .enrich_evidence import EnrichEvidenceTool
 from .build_graph import BuildGraphTool
 from .score_risk import ScoreRiskTool
 from .decide_action import DecideActionTool
@@ -8,6 +9,7 @@ from .next_steps import NextStepsTool
 __all__ = [
     "CollectEvidenceTool",
     "BuildPerIdentityTool",
+    "EnrichEvidenceTool",
     "BuildGraphTool",
     "ScoreRiskTool",
     "DecideActionTool",
@@ -14,13 +14,25 @@ class BuildGraphTool(Tool):
     name = "build_graph"
 
     def run(self, st: CeremonyState, cfg: AgentConfig) -> Dict[str, Any]:
-        g2 = build_evidence_graph_v2(st.per_identity)
+        # Pure CPU when enrich_evidence ran first; otherwise the builder enriches itself.
+        # Session follow-up rounds only score edges touching added / changed identities.
+        g2 = build_evidence_graph_v2(
+            st.per_identity,
+            features=st.identity_features,
+            nodes={k: a.node for k, a in st.analysis_hits.items()},
+            deadline=st.deadline,
+            enrichment=st.enrichment,
+            previous=(st.session.graph if st.session is not None else None),
+            reuse=st.reuse,
+        )
+        st.graph_result = g2
 
         st.graph_metrics = dict(g2.metrics)
         st.evidence_graph = {
             "nodes": g2.nodes_out,
             "edges": g2.edges_out,
             "metrics": g2.metrics,
+            "clusters": g2.clusters,
         }
 
         st.trace.add(
@@ -33,6 +45,8 @@ class BuildGraphTool(Tool):
                     "public_coverage": st.graph_metrics.get("public_coverage"),
                     "confusable_pairs": st.graph_metrics.get("confusable_pairs"),
                     "crosslink_hits": st.graph_metrics.get("crosslink_hits"),
+                    "clusters": st.graph_metrics.get("clusters"),
+                    "suspect_identities": st.graph_metrics.get("suspect_identities"),
                 },
             )
         )
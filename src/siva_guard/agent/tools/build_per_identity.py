@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import Any, Dict, List
 
 from siva_guard.core.schema import IdentityEvidence
+from siva_guard.pipeline.identity_cache import analysis_key, get_identity_cache
+from siva_guard.pipeline.identity_features import build_identity_features
 
 from ..trace import AgentTraceEvent
 from ..state import CeremonyState
@@ -54,13 +56,46 @@ class BuildPerIdentityTool(Tool):
     def run(self, st: CeremonyState, cfg: AgentConfig) -> Dict[str, Any]:
         st.per_identity = _evidence_to_per_identity(st.evidences)
 
+        # Reused identities keep last round's item (incl. enrichment errors).
+        if st.session is not None:
+            for key in st.reuse:
+                if key in st.per_identity and key in st.session.per_identity:
+                    st.per_identity[key] = st.session.per_identity[key]
+
+        # Identities analysed in an earlier ceremony (same platform, handle and evidence)
+        # come from the identity analysis cache. A refresh round analyses them again; the
+        # keys are still set, so score_risk stores the fresh analyses.
+        cache = get_identity_cache()
+        st.analysis_keys = {}
+        st.analysis_hits = {}
+        for key, item in st.per_identity.items():
+            if key in st.reuse:
+                continue
+            akey = st.analysis_keys[key] = analysis_key(key, item or {})
+            if st.refresh:
+                continue
+            hit = cache.get(akey)
+            if hit is not None:
+                st.analysis_hits[key] = hit
+
+        # Features are derived once here and shared by the judge, graph and risk scorers.
+        prev_features = st.session.identity_features if st.session is not None else {}
+        st.identity_features = {}
+        for key, item in st.per_identity.items():
+            if key in st.reuse and key in prev_features:
+                st.identity_features[key] = prev_features[key]
+            elif key in st.analysis_hits:
+                st.identity_features[key] = st.analysis_hits[key].features
+            else:
+                st.identity_features[key] = build_identity_features(key, item or {})
+
         st.trace.add(
             AgentTraceEvent(
                 step=st.steps_run,
                 tool=self.name,
                 decision="built",
                 inputs={"num_evidences": len(st.evidences)},
-                outputs={"num_per_identity": len(st.per_identity)},
+                outputs={"num_per_identity": len(st.per_identity), "analysis_cache_hits": len(st.analysis_hits)},
             )
         )
-        return {"num_per_identity": len(st.per_identity)}
+        return {"num_per_identity": len(st.per_identity), "analysis_cache_hits": len(st.analysis_hits)}
@@ -4,7 +4,9 @@ from typing import Any, Dict, List
 
 from siva_guard.core.schema import IdentityEvidence
 from siva_guard.connectors.social_url import SocialUrlConnector
-from siva_guard.pipeline.judge import judge_identity_set
+from siva_guard.connectors.fanout import collect_claims
+
+from ..session import claim_key
 
 from ..trace import AgentTraceEvent
 from ..state import CeremonyState
@@ -16,33 +18,32 @@ class CollectEvidenceTool(Tool):
     name = "collect_evidence"
 
     def run(self, st: CeremonyState, cfg: AgentConfig) -> Dict[str, Any]:
-        connectors = [SocialUrlConnector()]
-        evidences: List[IdentityEvidence] = []
-
-        for claim in st.claims:
-            collected = None
-            for c in connectors:
-                if c.supports(claim):
-                    collected = c.collect(claim)
-                    break
-            if collected is None:
-                collected = IdentityEvidence(claim=claim)  # in-app only
-            evidences.append(collected)
+        connectors = [SocialUrlConnector(deadline=st.deadline, refresh=st.refresh)]
 
-        st.evidences = evidences
+        # Session follow-up rounds: only added / changed identities are fetched.
+        prev = st.session.evidences if st.session is not None else {}
+        todo = [c for c in st.claims if claim_key(c) not in st.reuse]
 
-        # Keep baseline continuity (your current server returns this)
-        if cfg.include_baseline:
-            baseline_result = judge_identity_set(evidences)
-            st.baseline = baseline_result.model_dump()
+        # Concurrent fan-out (bounded per ceremony); evidence keeps claim order.
+        collected = iter(collect_claims(todo, connectors, concurrency=cfg.collect_concurrency))
+        evidences: List[IdentityEvidence] = [
+            prev[claim_key(c)] if claim_key(c) in st.reuse else next(collected) for c in st.claims
+        ]
+
+        st.evidences = evidences
 
         st.trace.add(
             AgentTraceEvent(
                 step=st.steps_run,
                 tool=self.name,
                 decision="collected",
-                inputs={"num_identities": len(st.claims)},
-                outputs={"num_evidences": len(st.evidences), "baseline_included": bool(st.baseline)},
+                inputs={
+                    "num_identities": len(st.claims),
+                    "num_reused": len(st.claims) - len(todo),
+                    "concurrency": cfg.collect_concurrency,
+                    "budget_remaining_s": (st.deadline.remaining() if st.deadline else None),
+                },
+                outputs={"num_evidences": len(st.evidences)},
             )
         )
         return {"num_evidences": len(st.evidences)}
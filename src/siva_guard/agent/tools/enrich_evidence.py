@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from siva_guard.core.deadline import BUDGET_EXHAUSTED
+from siva_guard.pipeline.enrichment import enrich_per_identity, enrichment_urls
+
+from ..trace import AgentTraceEvent
+from ..state import CeremonyState
+from ..config import AgentConfig
+from .base import Tool
+
+
+class EnrichEvidenceTool(Tool):
+    """
+    Network enrichment for the whole ceremony (avatar hashes + reverse website links),
+    deduped and fetched concurrently, so build_graph is pure CPU.
+    """
+
+    name = "enrich_evidence"
+
+    def run(self, st: CeremonyState, cfg: AgentConfig) -> Dict[str, Any]:
+        per_identity = st.per_identity or {}
+        # Session follow-up rounds: reused identities keep last round's enrichment;
+        # identity analysis cache hits already carry theirs.
+        fresh = {k: v for k, v in per_identity.items() if k not in st.reuse and k not in st.analysis_hits}
+        enrichment = enrich_per_identity(
+            fresh,
+            concurrency=cfg.collect_concurrency,
+            deadline=st.deadline,
+        )
+        if st.session is not None and st.session.enrichment is not None and st.reuse:
+            enrichment = st.session.enrichment.merged(enrichment)
+        st.enrichment = enrichment
+
+        # Enrichment the budget didn't cover is reported per identity.
+        skipped = 0
+        for item in fresh.values():
+            avatar_url, reverse_url = enrichment_urls(item or {})
+            av = enrichment.avatar(avatar_url)
+            rr = enrichment.reverse(reverse_url)
+            if av is not None and av.error == BUDGET_EXHAUSTED:
+                item.setdefault("errors", []).append(f"{BUDGET_EXHAUSTED}:avatar_hash")
+                skipped += 1
+            if rr is not None and rr.error == BUDGET_EXHAUSTED:
+                item.setdefault("errors", []).append(f"{BUDGET_EXHAUSTED}:reverse_links")
+                skipped += 1
+
+        st.trace.add(
+            AgentTraceEvent(
+                step=st.steps_run,
+                tool=self.name,
+                decision="enriched",
+                inputs={
+                    "num_identities": len(per_identity),
+                    "concurrency": cfg.collect_concurrency,
+                    "budget_remaining_s": (st.deadline.remaining() if st.deadline else None),
+                },
+                outputs={
+                    "avatar_urls": len(enrichment.avatars),
+                    "reverse_link_urls": len(enrichment.reverse_links),
+                    "skipped_by_budget": skipped,
+                },
+            )
+        )
+        return {"avatar_urls": len(enrichment.avatars), "reverse_link_urls": len(enrichment.reverse_links)}
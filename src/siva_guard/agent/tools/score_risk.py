@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+from siva_guard.pipeline.identity_cache import get_identity_cache
+from siva_guard.pipeline.identity_index import get_identity_index
 from siva_guard.pipeline.risk_v2 import compute_risk_v2
+from siva_guard.pipeline.single_identity_risk import score_identity_features, score_single_identity
 
 from ..trace import AgentTraceEvent
 from ..state import CeremonyState
@@ -14,7 +17,42 @@ class ScoreRiskTool(Tool):
     name = "score_risk"
 
     def run(self, st: CeremonyState, cfg: AgentConfig) -> Dict[str, Any]:
-        risk2 = compute_risk_v2(st.graph_metrics, st.per_identity)
+        # Cross-ceremony reuse only when the identity index is enabled (SIVA_IDENTITY_INDEX).
+        index = get_identity_index()
+        g2 = st.graph_result
+        reuse = None
+        if index is not None and g2 is not None:
+            reuse = index.lookup(g2.node_ids, g2.node_features, st.ceremony_id)
+
+        # Single-identity risk: from the identity analysis cache, or scored now.
+        single = {}
+        for key, item in (st.per_identity or {}).items():
+            hit = st.analysis_hits.get(key)
+            f = st.identity_features.get(key)
+            if hit is not None:
+                single[key] = hit.risk
+            else:
+                single[key] = score_identity_features(f) if f is not None else score_single_identity(item)
+
+        risk2 = compute_risk_v2(
+            st.graph_metrics,
+            st.per_identity,
+            cross_ceremony_reuse=reuse,
+            features=st.identity_features,
+            single_risks=single,
+        )
+
+        # Newly analysed identities go into the cache for later ceremonies.
+        if g2 is not None:
+            cache = get_identity_cache()
+            nodes = g2.features_by_id()
+            for key, akey in st.analysis_keys.items():
+                if key not in st.analysis_hits and key in nodes and key in st.identity_features:
+                    cache.put(akey, st.identity_features[key], nodes[key], single[key])
+
+        # Indexed after scoring; lookups exclude this ceremony either way.
+        if index is not None and g2 is not None:
+            index.record(st.ceremony_id, g2.node_features)
 
         st.substitution_risk = risk2.substitution_risk
         st.authenticity_risk = risk2.authenticity_risk
@@ -36,6 +74,8 @@ class ScoreRiskTool(Tool):
                 "reasons": st.reasons,
             }
         )
+        if reuse and reuse.get("identities"):
+            result["cross_ceremony_reuse"] = reuse
         st.result = result
 
         st.trace.add(
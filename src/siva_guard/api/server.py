@@ -210,19 +210,37 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from fastapi import FastAPI
 from pydantic import BaseModel
 
 from siva_guard.agent.runner import build_default_runner
+from siva_guard.agent.session import SessionStore
 from siva_guard.core.schema import IdentityClaim
 from siva_guard.pipeline.judge_v1 import judge_from_siva_output
 
 app = FastAPI(title="SIVA Guard", version="0.2.0")
 
+# Ceremony sessions for incremental follow-up /verify rounds.
+SESSIONS = SessionStore()
+
 
 class VerifyRequest(BaseModel):
     # IMPORTANT: must be IdentityClaim objects, not dicts
     identities: list[IdentityClaim]
+    # Optional ceremony time budget (seconds); defaults to AgentConfig.ceremony_budget_s
+    budget_s: Optional[float] = None
+    # Start a ceremony session (returned in result["session"]) for follow-up rounds.
+    session: bool = False
+    # Follow-up round of an earlier ceremony (result["session"]["session_id"]):
+    # unchanged identities are reused, only added / changed ones are fetched and scored.
+    session_id: Optional[str] = None
+    # Fetch every identity again (revalidating cached pages) instead of reusing the
+    # previous round, e.g. after the person edited a bio outside of next_steps.
+    refresh: bool = False
+    # Also return the baseline judge (debug); computed only when asked for.
+    include_baseline: bool = False
 
 
 class JudgeRequest(BaseModel):
@@ -239,18 +257,24 @@ def health():
 def verify(req: VerifyRequest):
     """
     Runs deterministic SIVA pipeline (agent tools):
-      collect_evidence -> build_per_identity -> build_graph -> score_risk -> decide_action -> next_steps
+      collect_evidence -> build_per_identity -> enrich_evidence -> build_graph -> score_risk -> decide_action -> next_steps
     Returns the full structured SIVA output.
     """
     runner = build_default_runner(
-        max_steps=6,
+        max_steps=7,
         include_trace=True,
-        include_baseline=True,
+        include_baseline=req.include_baseline,
         enable_llm=False,
     )
 
     # req.identities is a list[IdentityClaim] (Pydantic objects)
-    result = runner.run({"identities": req.identities})
+    payload = {"identities": req.identities, "budget_s": req.budget_s, "refresh": req.refresh}
+    if not (req.session or req.session_id):
+        return runner.run(payload)
+
+    session = SESSIONS.get_or_create(req.session_id)
+    with session.lock:
+        result = runner.run({**payload, "session": session})
     return result
 
 
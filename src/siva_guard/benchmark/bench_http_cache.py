@@ -0,0 +1,106 @@
+"""
+HTTP cache backend throughput vs. worker processes.
+
+Each worker process opens its own backend on a shared folder (as uvicorn workers
+do), then runs a write phase (cache fills) and a read phase (cache hits).
+Reports aggregate ops/s per phase and how many operations failed with
+"database is locked".
+
+    python -m siva_guard.benchmark.bench_http_cache --workers 1 2 4 8 --ops 400
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import random
+import sqlite3
+import tempfile
+import time
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from requests_cache import CachedResponse, SQLiteCache
+
+from siva_guard.connectors.cache_backend import ShardedSQLiteCache
+
+BODY = b"<html><head><title>x</title></head><body>" + b"p" * 48 * 1024 + b"</body></html>"
+
+
+def _open(backend: str, folder: str):
+    if backend == "sqlite":
+        # Previous default: one file, rollback journal, no busy timeout.
+        return SQLiteCache(str(Path(folder) / "siva_http_cache.sqlite"))
+    if backend == "sqlite-wal":
+        return SQLiteCache(str(Path(folder) / "siva_http_cache.sqlite"), wal=True, busy_timeout=10_000)
+    return ShardedSQLiteCache(Path(folder) / "siva_http_cache")
+
+
+def _key(worker: int, i: int) -> str:
+    return sha256(f"{worker}:{i}".encode()).hexdigest()
+
+
+def _worker(backend: str, folder: str, worker: int, ops: int, start, out) -> None:
+    cache = _open(backend, folder)
+    resp = CachedResponse(status_code=200, content=BODY, url=f"https://example.com/{worker}")
+    keys = [_key(worker, i) for i in range(ops)]
+    start.wait()
+
+    res: Dict[str, float] = {"write_s": 0.0, "read_s": 0.0, "errors": 0, "hits": 0}
+    t0 = time.perf_counter()
+    for k in keys:
+        try:
+            cache.responses[k] = resp
+        except sqlite3.OperationalError:
+            res["errors"] += 1
+    res["write_s"] = time.perf_counter() - t0
+
+    rng = random.Random(worker)
+    t0 = time.perf_counter()
+    for _ in range(ops):
+        try:
+            if cache.responses.get(rng.choice(keys)) is not None:
+                res["hits"] += 1
+        except sqlite3.OperationalError:
+            res["errors"] += 1
+    res["read_s"] = time.perf_counter() - t0
+    cache.close()
+    out.put(res)
+
+
+def run(backend: str, workers: int, ops: int) -> Tuple[float, float, int]:
+    ctx = mp.get_context("spawn")
+    with tempfile.TemporaryDirectory() as folder:
+        _open(backend, folder).close()  # create schema before workers race on it
+        start = ctx.Barrier(workers)
+        out = ctx.Queue()
+        procs = [ctx.Process(target=_worker, args=(backend, folder, w, ops, start, out)) for w in range(workers)]
+        for p in procs:
+            p.start()
+        results: List[Dict[str, float]] = [out.get() for _ in procs]
+        for p in procs:
+            p.join()
+
+    total = workers * ops
+    write_ops = total / max(r["write_s"] for r in results)
+    read_ops = total / max(r["read_s"] for r in results)
+    errors = int(sum(r["errors"] for r in results))
+    return write_ops, read_ops, errors
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--backends", nargs="+", default=["sqlite", "sqlite-wal", "sharded"])
+    ap.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4, 8])
+    ap.add_argument("--ops", type=int, default=400, help="writes and reads per worker")
+    args = ap.parse_args()
+
+    print(f"{'backend':<12} {'workers':>7} {'write ops/s':>12} {'read ops/s':>12} {'locked':>7}")
+    for backend in args.backends:
+        for w in args.workers:
+            write_ops, read_ops, errors = run(backend, w, args.ops)
+            print(f"{backend:<12} {w:>7} {write_ops:>12.0f} {read_ops:>12.0f} {errors:>7}")
+
+
+if __name__ == "__main__":
+    main()
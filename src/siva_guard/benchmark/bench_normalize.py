@@ -0,0 +1,90 @@
+"""
+Identifier normalization: confusable skeleton vs. the legacy ASCII-only normalizer.
+
+Reports ns per call on ASCII handles (the common case, where both must agree
+byte-for-byte) and on mixed-script / full-width handles (which only the skeleton
+folds), plus how many of the spoofed handles each version maps back to the original.
+
+    python -m siva_guard.benchmark.bench_normalize --n 20000 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import string
+import time
+from typing import Callable, List
+
+from siva_guard.pipeline.confusables import ASCII_HOMOGLYPHS, CONFUSABLES, skeleton
+
+
+def legacy_normalize_identifier(s: str) -> str:
+    # The pre-skeleton implementation, kept here as the baseline.
+    s = (s or "").strip().lower()
+    s = re.sub(r"\s+", "", s)
+    for k, v in ASCII_HOMOGLYPHS.items():
+        s = s.replace(k, v)
+    return s
+
+
+def _ascii_handles(rng: random.Random, n: int) -> List[str]:
+    alphabet = string.ascii_letters + string.digits + "._-@$ "
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(4, 20))) for _ in range(n)]
+
+
+def _spoof(rng: random.Random, handle: str) -> str:
+    # Swap a few letters for Cyrillic / Greek lookalikes or full-width forms.
+    lookalikes = {}
+    for src, dst in CONFUSABLES.items():
+        if len(dst) == 1:
+            lookalikes.setdefault(dst, []).append(src)
+    out = []
+    for ch in handle:
+        r = rng.random()
+        if r < 0.3 and ch in lookalikes:
+            out.append(rng.choice(lookalikes[ch]))
+        elif r < 0.4 and ch.isalnum():
+            out.append(chr(ord(ch) + 0xFEE0))  # full-width
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _ns_per_call(fn: Callable[[str], str], data: List[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter_ns()
+        for s in data:
+            fn(s)
+        best = min(best, (time.perf_counter_ns() - t0) / len(data))
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--n", type=int, default=20000)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    ascii_data = _ascii_handles(rng, args.n)
+    mismatches = sum(1 for s in ascii_data if skeleton(s) != legacy_normalize_identifier(s))
+
+    originals = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 14))) for _ in range(args.n)]
+    spoofed = [_spoof(rng, s) for s in originals]
+
+    print(f"ascii handles: n={args.n} legacy/skeleton mismatches={mismatches}")
+    for name, fn in (("legacy", legacy_normalize_identifier), ("skeleton", skeleton)):
+        t_ascii = _ns_per_call(fn, ascii_data, args.repeat)
+        t_spoof = _ns_per_call(fn, spoofed, args.repeat)
+        folded = sum(1 for o, s in zip(originals, spoofed) if fn(s) == o)
+        print(
+            f"{name:9s} ascii={t_ascii:7.0f} ns/call  spoofed={t_spoof:7.0f} ns/call  "
+            f"spoofs folded={folded}/{len(spoofed)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
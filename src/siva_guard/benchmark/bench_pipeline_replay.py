@@ -0,0 +1,71 @@
+"""
+End-to-end pipeline timing from a fetch archive (no network needed on replay).
+
+Record once (live web, every fetch written to the archive):
+    python -m siva_guard.benchmark.bench_pipeline_replay --archive runs/arc --claims claims.json --record
+
+Replay anywhere, with synthetic per-host latency:
+    python -m siva_guard.benchmark.bench_pipeline_replay --archive runs/arc --claims claims.json \
+        --latency "*.github.com=0.15,*=0.05" --runs 5
+
+claims.json: a list of ceremonies, each a list of IdentityClaim objects
+(or a single ceremony as a flat list), e.g.
+    [[{"platform": "github", "claimed": "octocat", "ui": {"display_name": "Octo"}}]]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, List
+
+from siva_guard.agent.runner import build_default_runner
+from siva_guard.connectors.archive import parse_latency, use_archive
+from siva_guard.connectors.evidence_cache import get_evidence_cache
+from siva_guard.connectors.http_client import get_cached_session
+from siva_guard.core.schema import IdentityClaim
+
+
+def _load_ceremonies(path: str) -> List[List[IdentityClaim]]:
+    with open(path, "r", encoding="utf-8") as f:
+        data: Any = json.load(f)
+    if data and isinstance(data[0], dict):
+        data = [data]
+    return [[IdentityClaim(**c) for c in ceremony] for ceremony in data]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--archive", required=True)
+    ap.add_argument("--claims", required=True)
+    ap.add_argument("--record", action="store_true", help="fetch live and write the archive")
+    ap.add_argument("--latency", default="", help='replay latency, e.g. "*.github.com=0.15,*=0.05"')
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args()
+
+    session = get_cached_session()
+    mode = "record" if args.record else "replay"
+    ceremonies = _load_ceremonies(args.claims)
+    runs = 1 if args.record else max(1, args.runs)
+
+    timings: List[float] = []
+    for _ in range(runs):
+        # Cold start per run: fresh in-memory HTTP cache, negative cache and evidence cache.
+        archive = use_archive(session, mode, args.archive, latency=parse_latency(args.latency))
+        get_evidence_cache().clear()
+        for claims in ceremonies:
+            runner = build_default_runner(include_trace=False)
+            t0 = time.perf_counter()
+            runner.run({"identities": claims})
+            timings.append(time.perf_counter() - t0)
+
+    print(f"mode={mode} archive_entries={len(archive)} ceremonies={len(ceremonies)} runs={runs}")
+    print(
+        f"per-ceremony seconds: median={statistics.median(timings):.3f} "
+        f"min={min(timings):.3f} max={max(timings):.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
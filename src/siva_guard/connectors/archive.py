@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+from urllib.parse import urlsplit
+
+from siva_guard.connectors.fetch_policy import host_matches
+from siva_guard.connectors.streaming import CappedHTTPAdapter, RESOURCE_HEADER
+
+# Archive layout (one folder, append-only, safe to copy between machines):
+#   index.jsonl             one JSON record per fetch, last record per key wins
+#   blobs/ab/abcdef...      zlib-compressed bodies, named by sha256 of the body
+INDEX_FILE = "index.jsonl"
+BLOB_DIR = "blobs"
+
+# Transport headers that describe the wire body, not the decoded body we store.
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def archive_key(method: str, resource: Optional[str], url: str) -> str:
+    # request.url is already normalized by requests' prepare step, identically on
+    # record and replay; the resource class selects the byte caps, so it's part of the key.
+    return f"{method.upper()} {resource or '-'} {url}"
+
+
+class FetchArchive:
+    """
+    Content-addressed store of fetched responses with a URL index.
+
+    Records are plain dicts:
+      {"key", "url", "status", "reason", "headers", "sha256"}   for responses
+      {"key", "url", "error", "message"}                        for transport failures
+    """
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        self.root = Path(root)
+        (self.root / BLOB_DIR).mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._load_index()
+
+    def _load_index(self) -> None:
+        path = self.root / INDEX_FILE
+        if not path.exists():
+            return
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue  # torn last line from an interrupted recording
+                self._index[rec["key"]] = rec
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _blob_path(self, sha: str) -> Path:
+        return self.root / BLOB_DIR / sha[:2] / sha
+
+    def put_blob(self, content: bytes) -> str:
+        sha = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(sha)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".tmp{os.getpid()}.{threading.get_ident()}")
+            tmp.write_bytes(zlib.compress(content, 6))
+            os.replace(tmp, path)
+        return sha
+
+    def get_blob(self, sha: str) -> bytes:
+        return zlib.decompress(self._blob_path(sha).read_bytes())
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._index.get(key)
+
+    def add(self, rec: Dict[str, Any]) -> None:
+        line = json.dumps(rec, sort_keys=True, ensure_ascii=False)
+        with self._lock:
+            self._index[rec["key"]] = rec
+            with (self.root / INDEX_FILE).open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class RecordingAdapter(CappedHTTPAdapter):
+    """
+    Live transport (same byte caps as production) that also writes every
+    response / transport failure into a FetchArchive.
+    """
+
+    def __init__(self, archive: FetchArchive, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.archive = archive
+
+    def send(self, request, stream=False, **kwargs):  # type: ignore[override]
+        key = archive_key(request.method, request.headers.get(RESOURCE_HEADER), request.url)
+        try:
+            r = super().send(request, stream=stream, **kwargs)
+        except requests.RequestException as e:
+            self.archive.add({"key": key, "url": request.url, "error": type(e).__name__, "message": str(e)[:300]})
+            raise
+
+        if stream or request.method == "HEAD":
+            return r  # body not read here; nothing to archive
+
+        headers = {k: v for k, v in r.headers.items() if k.lower() not in _DROP_HEADERS}
+        self.archive.add({
+            "key": key,
+            "url": request.url,
+            "status": r.status_code,
+            "reason": r.reason,
+            "headers": headers,
+            "sha256": self.archive.put_blob(r.content or b""),
+        })
+        return r
+
+
+class ArchiveMiss(requests.ConnectionError):
+    """Replay mode: the request isn't in the archive (treated like an unreachable host)."""
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    Offline transport serving responses from a FetchArchive, with synthetic
+    per-host latency. Never opens a socket.
+
+    latency: {host glob: seconds}, first match wins; "*" is the default.
+    """
+
+    def __init__(self, archive: FetchArchive, latency: Optional[Dict[str, float]] = None, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.archive = archive
+        self.latency = dict(latency or {})
+
+    def latency_for(self, url: str) -> float:
+        host = (urlsplit(url).hostname or "").lower()
+        for pattern, seconds in self.latency.items():
+            if host_matches(pattern, host):
+                return float(seconds)
+        return 0.0
+
+    def send(self, request, stream=False, timeout=None, **kwargs):  # type: ignore[override]
+        delay = self.latency_for(request.url)
+        if delay > 0:
+            time.sleep(delay)
+
+        key = archive_key(request.method, request.headers.get(RESOURCE_HEADER), request.url)
+        rec = self.archive.lookup(key)
+        if rec is None:
+            raise ArchiveMiss(f"not in archive: {key}", request=request)
+
+        if "error" in rec:
+            etype = getattr(requests.exceptions, rec["error"], None)
+            if not (isinstance(etype, type) and issubclass(etype, requests.RequestException)):
+                etype = requests.ConnectionError
+            raise etype(rec.get("message") or rec["error"], request=request)
+
+        content = self.archive.get_blob(rec["sha256"])
+        raw = HTTPResponse(
+            body=io.BytesIO(content),
+            headers=rec.get("headers") or {},
+            status=int(rec["status"]),
+            reason=rec.get("reason"),
+            preload_content=False,
+            decode_content=False,
+            request_method=request.method,
+            request_url=request.url,
+        )
+        r = self.build_response(request, raw)
+        if not stream:
+            r._content = content
+            r._content_consumed = True
+        return r
+
+
+def use_archive(
+    session,
+    mode: str,
+    root: Union[str, Path],
+    *,
+    latency: Optional[Dict[str, float]] = None,
+) -> FetchArchive:
+    """
+    Switch a CoalescingCachedSession to "record" or "replay".
+
+    Both modes swap the persistent HTTP cache for a fresh in-memory one (so a
+    recording captures every fetch, and a replay run starts cold and repeatable)
+    and reset the session's negative cache.
+    """
+    from requests_cache.backends import BaseCache
+
+    if mode not in ("record", "replay"):
+        raise ValueError(f"unknown archive mode: {mode!r}")
+
+    archive = FetchArchive(root)
+    adapter: HTTPAdapter = RecordingAdapter(archive) if mode == "record" else ReplayAdapter(archive, latency)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    settings = session.settings
+    session.cache = BaseCache(cache_name=f"siva_archive_{mode}")
+    session.settings = settings
+    # Background stale-while-revalidate refreshes would make replays timing-dependent.
+    session.settings.stale_while_revalidate = False
+
+    negative = getattr(session, "negative", None)
+    if negative is not None:
+        negative.clear()
+    return archive
+
+
+def parse_latency(spec: Optional[str]) -> Dict[str, float]:
+    """
+    "*.github.com=0.2,*=0.05" -> {"*.github.com": 0.2, "*": 0.05}
+    """
+    out: Dict[str, float] = {}
+    for part in (spec or "").split(","):
+        if "=" not in part:
+            continue
+        pattern, _, seconds = part.partition("=")
+        try:
+            out[pattern.strip().lower()] = float(seconds)
+        except ValueError:
+            continue
+    return out
+
+
+def configure_from_env(session) -> Optional[FetchArchive]:
+    """
+    SIVA_FETCH_ARCHIVE=<dir>  SIVA_FETCH_ARCHIVE_MODE=record|replay
+    SIVA_FETCH_ARCHIVE_LATENCY="<host glob>=<seconds>,..."  (replay only)
+    """
+    root = os.getenv("SIVA_FETCH_ARCHIVE", "").strip()
+    if not root:
+        return None
+    mode = os.getenv("SIVA_FETCH_ARCHIVE_MODE", "replay").strip().lower()
+    return use_archive(session, mode, root, latency=parse_latency(os.getenv("SIVA_FETCH_ARCHIVE_LATENCY")))
+
+
+__all__ = [
+    "ArchiveMiss",
+    "FetchArchive",
+    "RecordingAdapter",
+    "ReplayAdapter",
+    "archive_key",
+    "configure_from_env",
+    "parse_latency",
+    "use_archive",
+]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from siva_guard.core.schema import IdentityClaim, IdentityEvidence
 
@@ -16,3 +17,11 @@ class Connector(ABC):
         Must not raise exceptions; store errors in IdentityEvidence.errors.
         """
         ...
+
+    async def acollect(self, claim: IdentityClaim) -> IdentityEvidence:
+        """
+        Async collection (same contract as collect()).
+        Default runs the blocking collect() in a worker thread so every connector
+        can take part in concurrent fan-out; override for a natively async client.
+        """
+        return await asyncio.to_thread(self.collect, claim)
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import os
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from requests_cache.backends import BaseCache, BaseStorage
+from requests_cache.backends.sqlite import SQLiteDict
+from requests_cache.serializers import pickle_serializer
+
+# Writers wait on a busy shard instead of failing with "database is locked".
+DEFAULT_BUSY_TIMEOUT_MS = 10_000
+DEFAULT_SHARDS = 8
+MAX_SHARDS = 256
+
+
+def shard_index(key: str, n: int) -> int:
+    """
+    Stable shard for a cache key (same in every process; not Python's salted hash()).
+    requests-cache keys are hex digests, so their prefix is already uniform.
+    """
+    try:
+        return int(key[:8], 16) % n
+    except ValueError:
+        return zlib.crc32(key.encode("utf-8")) % n
+
+
+def shard_count(value: Optional[str], default: int = DEFAULT_SHARDS) -> int:
+    """
+    Shard count from a config string (SIVA_HTTP_CACHE_SHARDS): `default` when it is
+    missing, not an integer or outside 1..MAX_SHARDS.
+    """
+    try:
+        n = int(str(value).strip())
+    except (TypeError, ValueError):
+        return default
+    return n if 1 <= n <= MAX_SHARDS else default
+
+
+class ShardedSQLiteDict(BaseStorage):
+    """
+    One logical table spread over N SQLite files, each opened in WAL mode with a
+    busy timeout. Readers never block writers, and writers in different processes
+    only contend when their keys land on the same shard.
+    """
+
+    def __init__(self, shard_paths: List[Path], table_name: str, serializer=pickle_serializer, **kwargs) -> None:
+        super().__init__(serializer=None)
+        kwargs.setdefault("busy_timeout", DEFAULT_BUSY_TIMEOUT_MS)
+        kwargs["wal"] = True
+        locks = kwargs.pop("locks", None) or [None] * len(shard_paths)
+        self.shards: List[SQLiteDict] = []
+        for path, lock in zip(shard_paths, locks):
+            skw = dict(kwargs)
+            if lock is not None:
+                skw["lock"] = lock
+            self.shards.append(SQLiteDict(path, table_name=table_name, serializer=serializer, **skw))
+        self.serializer = self.shards[0].serializer
+        self.table_name = table_name
+
+    def _shard(self, key: str) -> SQLiteDict:
+        return self.shards[shard_index(key, len(self.shards))]
+
+    def __getitem__(self, key):
+        return self._shard(key)[key]
+
+    def __setitem__(self, key, value):
+        self._shard(key)[key] = value
+
+    def __delitem__(self, key):
+        del self._shard(key)[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._shard(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for s in self.shards:
+            yield from s
+
+    def __len__(self) -> int:
+        return sum(s.count() for s in self.shards)
+
+    def count(self, expired: bool = True) -> int:
+        return sum(s.count(expired=expired) for s in self.shards)
+
+    def bulk_delete(self, keys: Optional[Iterable[str]] = None, values=None) -> None:
+        if values:
+            for s in self.shards:
+                s.bulk_delete(values=values)
+        if not keys:
+            return
+        grouped: Dict[int, List[str]] = {}
+        for k in keys:
+            grouped.setdefault(shard_index(k, len(self.shards)), []).append(k)
+        for i, ks in grouped.items():
+            self.shards[i].bulk_delete(ks)
+
+    def clear(self) -> None:
+        for s in self.shards:
+            s.clear()
+
+    def close(self) -> None:
+        for s in self.shards:
+            s.close()
+
+    def _forget_connections(self) -> None:
+        # After fork the child must not reuse the parent's SQLite handles; drop them
+        # (without closing, which would touch the parent's file locks) and reopen lazily.
+        for s in self.shards:
+            s._connection = None
+            s._active_transaction = False
+
+
+class ShardedSQLiteCache(BaseCache):
+    """
+    requests-cache backend for several uvicorn workers sharing one cache directory:
+    <cache_dir>/shard-00.sqlite ... shard-NN.sqlite, responses and redirects tables
+    in each, all in WAL mode.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = "siva_http_cache",
+        *,
+        shards: int = DEFAULT_SHARDS,
+        busy_timeout: int = DEFAULT_BUSY_TIMEOUT_MS,
+        **kwargs,
+    ) -> None:
+        super().__init__(cache_name=str(cache_dir), **kwargs)
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        paths = [self.cache_dir / f"shard-{i:02d}.sqlite" for i in range(max(1, int(shards)))]
+
+        skwargs = {k: v for k, v in kwargs.items() if k not in ("serializer",)}
+        self.responses = ShardedSQLiteDict(
+            paths,
+            table_name="responses",
+            serializer=kwargs.get("serializer") or pickle_serializer,
+            busy_timeout=busy_timeout,
+            **skwargs,
+        )
+        # Same files, same per-shard lock (SQLite allows one writer per file anyway).
+        self.redirects = ShardedSQLiteDict(
+            paths,
+            table_name="redirects",
+            serializer=None,
+            busy_timeout=busy_timeout,
+            locks=[s._lock for s in self.responses.shards],
+            **skwargs,
+        )
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    @property
+    def db_path(self) -> Path:
+        return self.cache_dir
+
+    def _after_fork(self) -> None:
+        self.responses._forget_connections()
+        self.redirects._forget_connections()
+
+    def count(self, expired: bool = True) -> int:
+        return self.responses.count(expired=expired)
+
+
+__all__ = [
+    "DEFAULT_BUSY_TIMEOUT_MS",
+    "DEFAULT_SHARDS",
+    "MAX_SHARDS",
+    "ShardedSQLiteCache",
+    "ShardedSQLiteDict",
+    "shard_count",
+    "shard_index",
+]
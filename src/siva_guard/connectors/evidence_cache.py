@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from siva_guard.connectors.http_client import canonical_url
+from siva_guard.connectors.streaming import fetch_status
+from siva_guard.core.schema import PublicEvidence
+
+# Bump whenever SocialUrlConnector's extraction changes (fields, caps, fallbacks):
+# entries written by an older extractor then stop matching.
+EXTRACTOR_VERSION = "social_url/1"
+
+
+def http_entry_stamp(r) -> Tuple[str, str, str]:
+    """
+    Identity of the HTTP entry a PublicEvidence was extracted from:
+    final URL, fetch status and a digest of the (already in-memory) body.
+
+    A refreshed / re-downloaded entry with different content gets a different
+    stamp; a fresh hit, a stale hit or a 304 revalidation of the same body keeps it.
+    """
+    body = getattr(r, "content", None) or b""
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    return (str(getattr(r, "url", "") or ""), fetch_status(r), digest)
+
+
+@dataclass
+class _Entry:
+    stamp: Tuple[str, str, str]
+    public: PublicEvidence
+
+
+class EvidenceCache:
+    """
+    Second-level, in-process LRU of finished PublicEvidence objects.
+
+    Key: (canonical URL, extractor version). An entry is only served when the
+    HTTP response for the same fetch carries the same stamp, so its lifetime
+    follows the HTTP cache entry (TTL, stale-while-revalidate, revalidation).
+    Callers get a deep copy and may mutate it freely.
+    """
+
+    def __init__(self, max_entries: int = 2048, version: str = EXTRACTOR_VERSION) -> None:
+        self.max_entries = max_entries
+        self.version = version
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, url: str) -> Tuple[str, str]:
+        return (canonical_url(url), self.version)
+
+    def get(self, url: str, stamp: Tuple[str, str, str]) -> Optional[PublicEvidence]:
+        key = self._key(url)
+        with self._lock:
+            e = self._entries.get(key)
+            if e is None or e.stamp != stamp:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            public = e.public
+        return public.model_copy(deep=True)
+
+    def put(self, url: str, stamp: Tuple[str, str, str], public: PublicEvidence) -> None:
+        key = self._key(url)
+        entry = _Entry(stamp=stamp, public=public.model_copy(deep=True))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+EVIDENCE_CACHE = EvidenceCache()
+
+
+def get_evidence_cache() -> EvidenceCache:
+    return EVIDENCE_CACHE
+
+
+__all__ = [
+    "EXTRACTOR_VERSION",
+    "EvidenceCache",
+    "get_evidence_cache",
+    "http_entry_stamp",
+]
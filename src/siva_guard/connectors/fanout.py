@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Coroutine, List, Sequence, TypeVar
+
+from siva_guard.core.schema import IdentityClaim, IdentityEvidence
+from siva_guard.connectors.base import Connector
+
+T = TypeVar("T")
+
+
+async def _acollect_one(
+    claim: IdentityClaim,
+    connectors: Sequence[Connector],
+    sem: asyncio.Semaphore,
+) -> IdentityEvidence:
+    for c in connectors:
+        if c.supports(claim):
+            async with sem:
+                try:
+                    return await c.acollect(claim)
+                except Exception as e:
+                    # Connectors must not raise; keep one bad claim from sinking the ceremony.
+                    ev = IdentityEvidence(claim=claim)
+                    ev.errors.append(f"collect_failed: {type(e).__name__}: {e}")
+                    return ev
+    return IdentityEvidence(claim=claim)  # in-app only
+
+
+async def acollect_claims(
+    claims: Sequence[IdentityClaim],
+    connectors: Sequence[Connector],
+    *,
+    concurrency: int = 5,
+) -> List[IdentityEvidence]:
+    """
+    Concurrent fan-out over all claims.
+    - at most `concurrency` collections in flight (per call = per ceremony)
+    - first supporting connector wins (same rule as the sequential loop)
+    - evidence is returned in the original claim order
+    """
+    sem = asyncio.Semaphore(max(1, int(concurrency or 1)))
+    return list(await asyncio.gather(*(_acollect_one(c, connectors, sem) for c in claims)))
+
+
+def run_coro(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from sync code.
+    If the caller already runs an event loop (e.g. an async endpoint), the coroutine
+    gets its own loop on a helper thread instead of nesting loops.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    box: dict = {}
+
+    def _target() -> None:
+        try:
+            box["value"] = asyncio.run(coro)
+        except BaseException as e:  # re-raised in the caller thread
+            box["error"] = e
+
+    t = threading.Thread(target=_target, name="siva-fanout")
+    t.start()
+    t.join()
+    if "error" in box:
+        raise box["error"]
+    return box["value"]
+
+
+def collect_claims(
+    claims: Sequence[IdentityClaim],
+    connectors: Sequence[Connector],
+    *,
+    concurrency: int = 5,
+) -> List[IdentityEvidence]:
+    """
+    Sync entry point for tools: ceremony latency tracks the slowest fetch, not the sum.
+    """
+    return run_coro(acollect_claims(claims, connectors, concurrency=concurrency))
+
+
+__all__ = ["acollect_claims", "collect_claims", "run_coro"]
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+
+# -------------------------
+# TTL policy (successful responses)
+# -------------------------
+
+@dataclass(frozen=True)
+class TTLRule:
+    resource: str  # "profile" | "website" | "avatar" | "*"
+    host: str      # glob on hostname; "*.example.com" also matches "example.com"
+    ttl_s: int
+
+
+# First matching rule wins: keep specific hosts above the per-resource defaults.
+TTL_POLICY: List[TTLRule] = [
+    # Avatar images are content-stable (new picture -> new URL on most CDNs).
+    TTLRule("avatar", "*", 7 * 24 * 3600),
+    # Profiles change (bio edits, temporary crosslinks during a ceremony): keep short.
+    TTLRule("profile", "*.github.com", 15 * 60),
+    TTLRule("profile", "*", 30 * 60),
+    # Personal websites used for reverse links change rarely.
+    TTLRule("website", "*", 6 * 3600),
+    TTLRule("*", "*", 3600),
+]
+
+
+def host_matches(pattern: str, host: str) -> bool:
+    if fnmatchcase(host, pattern):
+        return True
+    return pattern.startswith("*.") and host == pattern[2:]
+
+
+def ttl_for(resource: Optional[str], url: str, policy: Optional[List[TTLRule]] = None) -> int:
+    """
+    TTL (seconds) for a successful response of this resource class from this host.
+    """
+    host = (urlsplit(url).hostname or "").lower()
+    res = resource or "*"
+    for rule in policy or TTL_POLICY:
+        if rule.resource in ("*", res) and host_matches(rule.host, host):
+            return rule.ttl_s
+    return 3600
+
+
+# -------------------------
+# Negative caching (failures)
+# -------------------------
+
+# Short, per-failure-kind TTLs: long enough to stop hammering, short enough to recover.
+NEGATIVE_TTL_S: Dict[str, int] = {
+    "http_404": 15 * 60,
+    "http_410": 6 * 3600,
+    "http_429": 5 * 60,   # Retry-After (clamped) takes precedence when present
+    "http_5xx": 60,
+    "timeout": 2 * 60,
+    "connection": 2 * 60,
+}
+
+_RETRY_AFTER_BOUNDS = (30, 15 * 60)
+
+
+def classify_failure(response: Any = None, error: Optional[BaseException] = None) -> Optional[str]:
+    """
+    Failure kind worth negative-caching, or None.
+    """
+    if error is not None:
+        if isinstance(error, requests.Timeout):
+            return "timeout"
+        if isinstance(error, requests.ConnectionError):
+            return "connection"
+        return None
+
+    code = int(getattr(response, "status_code", 0) or 0)
+    if code in (404, 410, 429):
+        return f"http_{code}"
+    if 500 <= code <= 599:
+        return "http_5xx"
+    return None
+
+
+def _retry_after_s(response: Any) -> Optional[int]:
+    raw = (getattr(response, "headers", None) or {}).get("Retry-After")
+    try:
+        v = int(str(raw).strip())
+    except (TypeError, ValueError):
+        return None
+    lo, hi = _RETRY_AFTER_BOUNDS
+    return max(lo, min(hi, v))
+
+
+@dataclass
+class NegativeEntry:
+    kind: str
+    expires_at: float
+    response: Any = None                       # replayed for HTTP failures
+    error_type: Optional[type] = None          # re-raised for network failures
+    error_message: str = ""
+
+    def replay(self) -> Any:
+        if self.response is not None:
+            return self.response
+        etype = self.error_type or requests.RequestException
+        try:
+            err = etype(f"negative_cache:{self.kind}: {self.error_message}")
+        except Exception:
+            err = requests.RequestException(f"negative_cache:{self.kind}: {self.error_message}")
+        raise err
+
+
+class NegativeCache:
+    """
+    Bounded in-process LRU of recent fetch failures with per-kind TTLs.
+
+    Keys are (resource, canonical_url); 429s are also recorded per host so a
+    throttling host is left alone for every URL until its backoff expires.
+    """
+
+    def __init__(self, max_entries: int = 4096, ttls: Optional[Dict[str, int]] = None) -> None:
+        self.max_entries = max_entries
+        self.ttls = dict(ttls or NEGATIVE_TTL_S)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, NegativeEntry]" = OrderedDict()
+        self.hits = 0
+
+    def _put(self, key: Hashable, entry: NegativeEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _live(self, key: Hashable, now: float) -> Optional[NegativeEntry]:
+        e = self._entries.get(key)
+        if e is None:
+            return None
+        if e.expires_at <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return e
+
+    def lookup(self, key: Tuple[Optional[str], str], host: str) -> Optional[NegativeEntry]:
+        now = time.monotonic()
+        with self._lock:
+            e = self._live(key, now) or self._live(("host", host), now)
+            if e is not None:
+                self.hits += 1
+            return e
+
+    def record(
+        self,
+        key: Tuple[Optional[str], str],
+        host: str,
+        *,
+        response: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> Optional[str]:
+        kind = classify_failure(response, error)
+        if kind is None:
+            return None
+
+        ttl = self.ttls.get(kind, 60)
+        if kind == "http_429":
+            ttl = _retry_after_s(response) or ttl
+
+        entry = NegativeEntry(kind=kind, expires_at=time.monotonic() + ttl, response=response)
+        if error is not None:
+            entry.error_type = type(error)
+            entry.error_message = str(error)[:200]
+
+        with self._lock:
+            self._put(key, entry)
+            if kind == "http_429" and host:
+                self._put(("host", host), entry)
+        return kind
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"negative_hits": self.hits, "negative_entries": len(self._entries)}
+
+
+__all__ = [
+    "NEGATIVE_TTL_S",
+    "NegativeCache",
+    "NegativeEntry",
+    "TTLRule",
+    "TTL_POLICY",
+    "classify_failure",
+    "host_matches",
+    "ttl_for",
+]
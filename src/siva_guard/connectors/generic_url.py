@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import re
 import requests
-from bs4 import BeautifulSoup
 
 from siva_guard.core.schema import (
     IdentityClaim, IdentityEvidence, PublicEvidence,
     CollectionMode, Platform
 )
 from siva_guard.connectors.base import Connector
+from siva_guard.connectors.page_analysis import analyze_page
 
 
 _URL_RE = re.compile(r"^https?://", re.IGNORECASE)
@@ -41,36 +41,35 @@ class GenericUrlConnector(Connector):
                 field_confidence={"canonical_url": 0.9, "raw_excerpt": 0.3},
             )
 
-            # Parse basic metadata
-            soup = BeautifulSoup(r.text or "", "lxml")
+            # Parse basic metadata (single pass)
+            page = analyze_page(r.text or "", base_url=str(r.url))
 
-            title = soup.title.string.strip() if soup.title and soup.title.string else None
-            if title:
-                ev_public.display_name = title
+            if page.title:
+                ev_public.display_name = page.title
                 ev_public.field_confidence["display_name"] = 0.4
 
             # meta description
-            desc_tag = soup.find("meta", attrs={"name": "description"})
-            if desc_tag and desc_tag.get("content"):
-                ev_public.bio = desc_tag.get("content").strip()
+            desc = page.meta("description")
+            if desc:
+                ev_public.bio = desc
                 ev_public.field_confidence["bio"] = 0.4
 
             # og:image (often profile image / page image)
-            og_img = soup.find("meta", attrs={"property": "og:image"})
-            if og_img and og_img.get("content"):
-                ev_public.avatar_url = og_img.get("content").strip()
+            og_img = page.og("og:image")
+            if og_img:
+                ev_public.avatar_url = og_img
                 ev_public.field_confidence["avatar_url"] = 0.3
 
             # og:title may be better than <title>
-            og_title = soup.find("meta", attrs={"property": "og:title"})
-            if og_title and og_title.get("content"):
-                ev_public.display_name = og_title.get("content").strip()
+            og_title = page.og("og:title")
+            if og_title:
+                ev_public.display_name = og_title
                 ev_public.field_confidence["display_name"] = 0.5
 
             # og:description may be better
-            og_desc = soup.find("meta", attrs={"property": "og:description"})
-            if og_desc and og_desc.get("content"):
-                ev_public.bio = og_desc.get("content").strip()
+            og_desc = page.og("og:description")
+            if og_desc:
+                ev_public.bio = og_desc
                 ev_public.field_confidence["bio"] = 0.5
 
             ev.public = ev_public
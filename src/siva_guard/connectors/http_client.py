@@ -1,13 +1,198 @@
 from __future__ import annotations
 
+import copy
+import os
+from typing import Dict, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
 import requests_cache
+from requests_cache.backends import init_backend
+
+from siva_guard.connectors.archive import configure_from_env
+from siva_guard.connectors.cache_backend import DEFAULT_BUSY_TIMEOUT_MS, ShardedSQLiteCache, shard_count
+from siva_guard.connectors.fetch_policy import NegativeCache, ttl_for
+from siva_guard.connectors.singleflight import SingleFlight
+from siva_guard.connectors.streaming import CappedHTTPAdapter, DEADLINE_HEADER, RESOURCE_HEADER
+from siva_guard.core.deadline import BudgetExhausted, Deadline
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def canonical_url(url: str) -> str:
+    """
+    Canonical form used as the coalescing key:
+    lowercase scheme/host, default port dropped, empty path -> "/", fragment removed.
+    """
+    u = urlsplit((url or "").strip())
+    scheme = (u.scheme or "").lower()
+    host = (u.hostname or "").lower()
+    port = u.port
+    netloc = host
+    if port is not None and str(port) != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{port}"
+    if u.username or u.password:
+        netloc = f"{u.username or ''}{':' + u.password if u.password else ''}@{netloc}"
+    return urlunsplit((scheme, netloc, u.path or "/", u.query, ""))
+
+
+class CoalescingCachedSession(requests_cache.CachedSession):
+    """
+    requests-cache session with a single-flight layer on GET:
+    concurrent requests for the same canonical URL share one in-flight fetch
+    (cache lookup + network) and all receive the same response object.
+
+    Streaming / params requests bypass coalescing (their bodies can't be shared safely).
+
+    resource="profile" | "website" | "avatar" selects the byte caps applied by
+    CappedHTTPAdapter (see connectors/streaming.py) and the cache TTL from
+    fetch_policy.TTL_POLICY (an explicit expire_after= still wins).
+
+    Failures (404/410, 429, 5xx, timeouts, connection errors) are remembered in a
+    bounded negative cache with short per-kind TTLs and replayed without a request.
+
+    deadline= (core/deadline.py) clamps the timeout to the ceremony's remaining budget;
+    the transport re-checks it before each redirect hop and between body chunks. Once
+    the budget is spent only stored responses are served; otherwise BudgetExhausted is
+    raised. Timeouts caused by a clamped budget aren't negative-cached, nor shared with
+    coalesced callers, whose wait is bounded by their own deadline.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.flights = SingleFlight()
+        self.negative = NegativeCache()
+        adapter = CappedHTTPAdapter()
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def get(  # type: ignore[override]
+        self,
+        url: str,
+        params=None,
+        *,
+        resource: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+        **kwargs,
+    ):
+        clamped = False
+        cache_only = False
+        if deadline is not None:
+            default_timeout = float(kwargs.get("timeout") or DEFAULT_TIMEOUT_S)
+            try:
+                kwargs["timeout"] = deadline.timeout(default_timeout)
+                clamped = kwargs["timeout"] < default_timeout
+            except BudgetExhausted:
+                # No time for the network, but a stored response costs nothing.
+                kwargs["only_if_cached"] = True
+                cache_only = True
+
+        markers: Dict[str, str] = {}
+        if resource:
+            markers[RESOURCE_HEADER] = resource
+        expires_at = deadline.expires_at() if deadline is not None else None
+        if expires_at is not None and not cache_only:
+            # Lets the transport check the budget between redirect hops / body chunks.
+            markers[DEADLINE_HEADER] = repr(expires_at)
+        if markers:
+            headers = dict(kwargs.pop("headers", None) or {})
+            headers.update(markers)
+            kwargs["headers"] = headers
+
+        if "expire_after" not in kwargs:
+            kwargs["expire_after"] = ttl_for(resource, url)
+
+        if params or kwargs.get("stream"):
+            return super().get(url, params=params, **kwargs)
+
+        key = (resource, canonical_url(url))
+        host = (urlsplit(key[1]).hostname or "").lower()
+        refresh = bool(kwargs.get("refresh"))
+        neg = None if refresh else self.negative.lookup(key, host)
+        if neg is not None:
+            return neg.replay()
+
+        if cache_only:
+            kwargs.pop("refresh", None)
+            r = super().get(url, **kwargs)
+            if r.status_code == 504:  # requests-cache's answer to only_if_cached on a miss
+                raise BudgetExhausted(f"budget_exhausted: {key[1]} not cached")
+            return r
+
+        parent_get = super().get
+
+        def _budget_caused(e: BaseException) -> bool:
+            # Out of budget mid-fetch, or a timeout we shortened to fit the budget: says
+            # nothing about the host, nor about what a caller with more time would get.
+            return isinstance(e, BudgetExhausted) or (clamped and isinstance(e, requests.Timeout))
+
+        def _fetch():
+            try:
+                r = parent_get(url, **kwargs)
+            except requests.RequestException as e:
+                if not _budget_caused(e):
+                    self.negative.record(key, host, error=e)
+                raise
+            _ = r.content  # materialize the body before it's shared across callers
+            if not getattr(r, "from_cache", False):
+                self.negative.record(key, host, response=r)
+            return r
+
+        # A refresh must not be answered by a concurrent plain (possibly cached) fetch.
+        # Callers wait at most their own budget; a fetch cut short by the leader's budget
+        # isn't shared, the waiting callers fetch again themselves.
+        r, _shared = self.flights.do(
+            key + ("refresh",) if refresh else key,
+            _fetch,
+            deadline=deadline,
+            share_error=lambda e: not _budget_caused(e),
+        )
+        return r
+
+    def _resend_async(self, request, actions, cached_response, **kwargs):  # type: ignore[override]
+        # stale_while_revalidate: the stale entry is also what the caller gets back.
+        # Revalidate a copy, so the background 304 can't flip its revalidated / expires /
+        # headers under cache_status() and the parsed-evidence stamp.
+        background = copy.copy(cached_response)
+        background.headers = cached_response.headers.copy()
+        return super()._resend_async(request, actions, background, **kwargs)
+
+
+# Default freshness window (per-resource TTLs come from fetch_policy.TTL_POLICY); after
+# it, entries with ETag/Last-Modified are revalidated with a conditional GET (304 keeps
+# the stored body) instead of being downloaded again.
+CACHE_TTL_S = 3600  # seconds (1 hour)
+
+# Timeout assumed for deadline clamping when the caller didn't pass one.
+DEFAULT_TIMEOUT_S = 30.0
+
+# Expired entries younger than TTL + this window are served immediately and refreshed
+# in the background; older ones block on revalidation.
+STALE_WHILE_REVALIDATE_S = 24 * 3600
+
+# Cache backend, shared by every worker process started from the same folder:
+#   "sharded" (default) siva_http_cache/shard-NN.sqlite, WAL + busy timeout per shard
+#   "sqlite"            single siva_http_cache.sqlite file (WAL + busy timeout)
+#   "memory"            per-process, nothing on disk
+CACHE_BACKEND = os.getenv("SIVA_HTTP_CACHE_BACKEND", "sharded").strip().lower()
+CACHE_SHARDS = shard_count(os.getenv("SIVA_HTTP_CACHE_SHARDS"))
+
+
+def _make_backend(name: str):
+    if name == "sharded":
+        return ShardedSQLiteCache("siva_http_cache", shards=CACHE_SHARDS)
+    if name == "sqlite":
+        return requests_cache.SQLiteCache("siva_http_cache", wal=True, busy_timeout=DEFAULT_BUSY_TIMEOUT_MS)
+    return init_backend("siva_http_cache", name)
+
 
 # A small on-disk cache so repeated checks are fast and reduce block risk.
-# Cache lives in project folder as siva_http_cache.sqlite
-SESSION = requests_cache.CachedSession(
-    cache_name="siva_http_cache",
-    backend="sqlite",
-    expire_after=3600,  # seconds (1 hour)
+SESSION = CoalescingCachedSession(
+    backend=_make_backend(CACHE_BACKEND),
+    expire_after=CACHE_TTL_S,
+    stale_while_revalidate=STALE_WHILE_REVALIDATE_S,
+    # Resource class is part of the key: a capped profile body must not satisfy a full fetch.
+    match_headers=[RESOURCE_HEADER],
 )
 
 DEFAULT_HEADERS = {
@@ -19,9 +204,43 @@ DEFAULT_HEADERS = {
 # ✅ NEW: make headers apply globally to this session
 SESSION.headers.update(DEFAULT_HEADERS)
 
+# Offline record/replay of every fetch (see connectors/archive.py); no-op unless
+# SIVA_FETCH_ARCHIVE is set.
+configure_from_env(SESSION)
+
 
 def get_cached_session() -> requests_cache.CachedSession:
     """
     Phase 5+ uses this accessor so all modules share the same cached session + headers.
     """
     return SESSION
+
+
+def fetch_stats() -> Dict[str, int]:
+    """
+    Single-flight + negative-cache counters for the shared session:
+      original         = fetches that actually ran (cache lookup + network if needed)
+      coalesced        = callers that received another caller's in-flight result
+      negative_hits    = calls answered from a remembered failure (no request made)
+      negative_entries = failures currently remembered
+    """
+    return {**SESSION.flights.stats(), **SESSION.negative.stats()}
+
+
+def cache_status(r) -> Optional[str]:
+    """
+    How a response was served:
+      "fresh"       cache hit within TTL
+      "stale"       expired entry served immediately (background revalidation started)
+      "revalidated" expired entry confirmed unchanged by a conditional GET (304)
+      "miss"        downloaded from the origin
+    None for objects that aren't cache-aware responses.
+    """
+    from_cache = getattr(r, "from_cache", None)
+    if from_cache is None:
+        return None
+    if getattr(r, "revalidated", False):
+        return "revalidated"
+    if not from_cache:
+        return "miss"
+    return "stale" if getattr(r, "is_expired", False) else "fresh"
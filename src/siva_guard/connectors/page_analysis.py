@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+from urllib.parse import urljoin, urlparse
+
+from lxml import etree
+
+# Raw URLs in text nodes / attribute values (same pattern reverse_links used on raw HTML).
+_URL_RE = re.compile(r"(https?://[^\s\"'<>]+)", re.IGNORECASE)
+
+_SKIP_HREF_PREFIXES = ("javascript:", "mailto:", "tel:")
+
+# Bounds so a hostile page can't make the artifact itself large.
+_MAX_HREFS = 2000
+_MAX_TEXT_URLS = 500
+
+
+@dataclass
+class PageAnalysis:
+    """
+    Result of parsing one HTML document once.
+
+    Every extractor (OG metadata, outbound links, reverse links, raw-text URLs)
+    reads from this artifact instead of building its own soup.
+    """
+
+    base_url: str
+    title: Optional[str] = None
+    meta_property: Dict[str, str] = field(default_factory=dict)  # first <meta property=...> wins
+    meta_name: Dict[str, str] = field(default_factory=dict)      # first <meta name=...> wins
+    hrefs: List[str] = field(default_factory=list)               # stripped <a href> values, document order
+    text_urls: List[str] = field(default_factory=list)           # raw http(s) URLs in text / attribute values
+
+    def og(self, prop: str) -> Optional[str]:
+        v = self.meta_property.get(prop)
+        return v.strip() if v and v.strip() else None
+
+    def meta(self, name: str) -> Optional[str]:
+        v = self.meta_name.get(name)
+        return v.strip() if v and v.strip() else None
+
+    def links(self, *, limit: int = 80) -> List[str]:
+        """
+        Absolute http(s) anchor URLs (relative hrefs joined to base_url), fragments dropped,
+        deduped in first-seen order. Skips #fragments, javascript:, mailto: and tel:.
+        """
+        out: List[str] = []
+        seen: Set[str] = set()
+        for href in self.hrefs:
+            if len(out) >= limit:
+                break
+            if href.startswith("#") or href.lower().startswith(_SKIP_HREF_PREFIXES):
+                continue
+            p = urlparse(urljoin(self.base_url, href))
+            if p.scheme not in ("http", "https"):
+                continue
+            norm = p._replace(fragment="").geturl()
+            if norm not in seen:
+                seen.add(norm)
+                out.append(norm)
+        return out
+
+    def external_links(self, *, cap: int = 50) -> List[str]:
+        """
+        links() restricted to hosts other than base_url's host.
+        """
+        base_host = (urlparse(self.base_url).netloc or "").lower()
+        out: List[str] = []
+        for u in self.links(limit=len(self.hrefs)):
+            if len(out) >= cap:
+                break
+            host = (urlparse(u).netloc or "").lower()
+            if host and host != base_host:
+                out.append(u)
+        return out
+
+    def absolute_hrefs(self, *, limit: int = 80) -> List[str]:
+        """
+        Anchors written as absolute http(s) URLs, verbatim (no joining / normalization).
+        """
+        out: List[str] = []
+        for href in self.hrefs:
+            if href.startswith("http://") or href.startswith("https://"):
+                out.append(href)
+                if len(out) >= limit:
+                    break
+        return out
+
+
+class _Collector:
+    """
+    lxml parser target: one streaming pass, no tree is built.
+    """
+
+    def __init__(self, page: PageAnalysis) -> None:
+        self.page = page
+        self._in_title = False
+        self._title_done = False
+        self._title_parts: List[str] = []
+        self._text: List[str] = []
+
+    def _scan(self, s: str) -> None:
+        if len(self.page.text_urls) < _MAX_TEXT_URLS and "http" in s:
+            for m in _URL_RE.findall(s):
+                self.page.text_urls.append(m)
+                if len(self.page.text_urls) >= _MAX_TEXT_URLS:
+                    break
+
+    def _flush_text(self) -> None:
+        if self._text:
+            self._scan("".join(self._text))
+            self._text = []
+
+    def start(self, tag, attrib) -> None:
+        self._flush_text()
+        page = self.page
+
+        if tag == "a":
+            href = attrib.get("href")
+            if href is not None and len(page.hrefs) < _MAX_HREFS:
+                href = href.strip()
+                if href:
+                    page.hrefs.append(href)
+        elif tag == "meta":
+            content = attrib.get("content")
+            prop = attrib.get("property")
+            name = attrib.get("name")
+            if prop is not None and prop not in page.meta_property:
+                page.meta_property[prop] = content or ""
+            if name is not None and name not in page.meta_name:
+                page.meta_name[name] = content or ""
+        elif tag == "title" and not self._title_done:
+            self._in_title = True
+
+        for v in attrib.values():
+            self._scan(v)
+
+    def end(self, tag) -> None:
+        self._flush_text()
+        if tag == "title" and self._in_title:
+            self._in_title = False
+            self._title_done = True
+            t = "".join(self._title_parts).strip()
+            self.page.title = t or None
+
+    def data(self, data: str) -> None:
+        if self._in_title:
+            self._title_parts.append(data)
+        self._text.append(data)
+
+    def comment(self, text) -> None:
+        pass
+
+    def close(self) -> PageAnalysis:
+        self._flush_text()
+        return self.page
+
+
+def analyze_page(html: Optional[str], *, base_url: str) -> PageAnalysis:
+    """
+    Parse an HTML document once and return the shared PageAnalysis artifact.
+    Best-effort: malformed or empty input yields whatever was collected so far.
+    """
+    page = PageAnalysis(base_url=base_url)
+    if not html:
+        return page
+
+    collector = _Collector(page)
+    parser = etree.HTMLParser(target=collector)
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception:
+        collector.close()
+    return page
+
+
+__all__ = ["PageAnalysis", "analyze_page"]
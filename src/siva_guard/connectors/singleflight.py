@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from siva_guard.core.deadline import BUDGET_EXHAUSTED, BudgetExhausted, Deadline
+
+
+@dataclass
+class _Call:
+    done: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: Optional[BaseException] = None
+    shared_error: bool = True  # False: the error is the leader's own (e.g. its budget)
+    waiters: int = 0
+
+
+class SingleFlight:
+    """
+    Duplicate-call suppression: concurrent calls with the same key share one
+    in-flight execution and all receive its result (or its exception).
+
+    Nothing is memoized once the call finishes; the HTTP cache behind it handles reuse.
+    Thread-based, so it works for the async fan-out too (fetches run in worker threads).
+
+    Callers may run under different deadlines: a waiting caller gives up when its own
+    deadline runs out, and an error the leader's share_error() rejects (one caused by
+    the leader's budget, say) isn't handed on -- waiting callers run the call again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.original = 0   # executions that actually ran
+        self.coalesced = 0  # callers served by someone else's execution
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        deadline: Optional[Deadline] = None,
+        share_error: Optional[Callable[[BaseException], bool]] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        Returns (value, shared). shared=True when this caller piggybacked on another call.
+
+        deadline: bounds this caller's wait for another caller's execution
+        (BudgetExhausted once it runs out). share_error: whether an exception raised by
+        fn() in this caller's execution may be handed to the callers waiting on it.
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is not None:
+                    call.waiters += 1
+                    self.coalesced += 1
+                    leader = False
+                else:
+                    call = _Call()
+                    self._calls[key] = call
+                    self.original += 1
+                    leader = True
+
+            if leader:
+                break
+            if not call.done.wait(deadline.remaining() if deadline is not None else None):
+                raise BudgetExhausted(f"{BUDGET_EXHAUSTED}: gave up waiting for an in-flight call")
+            if call.error is None:
+                return call.value, True
+            if call.shared_error:
+                raise call.error
+            with self._lock:
+                self.coalesced -= 1  # not served after all: run it ourselves
+
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            call.shared_error = share_error is None or share_error(e)
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return call.value, False
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "original": self.original,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
+
+
+__all__ = ["SingleFlight"]
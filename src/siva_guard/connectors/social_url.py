@@ -1,9 +1,7 @@
 # src/siva_guard/connectors/social_url.py
 from __future__ import annotations
 
-from urllib.parse import urljoin, urlparse
-
-from bs4 import BeautifulSoup
+from typing import Optional
 
 from siva_guard.core.schema import (
     IdentityClaim, IdentityEvidence, PublicEvidence,
@@ -11,7 +9,11 @@ from siva_guard.core.schema import (
 )
 from siva_guard.connectors.base import Connector
 from siva_guard.connectors.resolver import resolve_to_url
-from siva_guard.connectors.http_client import get_cached_session
+from siva_guard.connectors.evidence_cache import get_evidence_cache, http_entry_stamp
+from siva_guard.connectors.http_client import cache_status, get_cached_session
+from siva_guard.connectors.page_analysis import analyze_page
+from siva_guard.connectors.streaming import fetch_status
+from siva_guard.core.deadline import BUDGET_EXHAUSTED, Deadline
 
 
 SUPPORTED = {
@@ -35,43 +37,58 @@ def _extract_external_links(html: str, *, base_url: str, cap: int = 50) -> list[
       - http/https only
       - excludes same-host links, fragments, mailto/javascript/tel
       - strips URL fragments
+
+    Kept for callers holding raw HTML; collect() reads the shared PageAnalysis instead.
     """
     if not html:
         return []
+    return analyze_page(html, base_url=base_url).external_links(cap=cap)
+
 
-    soup = BeautifulSoup(html, "lxml")
-    base_host = (urlparse(base_url).netloc or "").lower()
+def _extract_public(r) -> PublicEvidence:
+    """
+    Build PublicEvidence from a fetched profile page (one parse via PageAnalysis).
+    Output must depend only on the response; see evidence_cache.EXTRACTOR_VERSION.
+    """
+    html = r.text or ""
+    # Parse once; OG meta, <title> and outbound links all come from this artifact.
+    page = analyze_page(html, base_url=str(r.url))
 
-    out: list[str] = []
-    seen: set[str] = set()
+    public = PublicEvidence(
+        canonical_url=str(r.url),
+        raw_excerpt=(html[:2000] if html else None),
+        field_confidence={"canonical_url": 0.9, "raw_excerpt": 0.3},
+    )
 
-    for a in soup.find_all("a", href=True):
-        if len(out) >= cap:
-            break
+    og_title = page.og("og:title")
+    og_desc = page.og("og:description")
+    og_img = page.og("og:image")
 
-        href = (a.get("href") or "").strip()
-        if not href:
-            continue
+    if og_title:
+        public.display_name = og_title
+        public.field_confidence["display_name"] = 0.55
 
-        low = href.lower()
-        if href.startswith("#") or low.startswith("javascript:") or low.startswith("mailto:") or low.startswith("tel:"):
-            continue
+    if og_desc:
+        public.bio = og_desc
+        public.field_confidence["bio"] = 0.55
 
-        abs_url = urljoin(base_url, href)
-        p = urlparse(abs_url)
-        if p.scheme not in ("http", "https"):
-            continue
+    if og_img:
+        public.avatar_url = og_img
+        public.field_confidence["avatar_url"] = 0.45
 
-        host = (p.netloc or "").lower()
-        if not host or host == base_host:
-            continue
+    # Fallback: <title>
+    if not getattr(public, "display_name", None) and page.title:
+        public.display_name = page.title
+        public.field_confidence["display_name"] = 0.35
 
-        norm = p._replace(fragment="").geturl()
-        if norm not in seen:
-            seen.add(norm)
-            out.append(norm)
+    # Phase 7.2: external_links (best-effort)
+    try:
+        public.external_links = page.external_links(cap=50)  # type: ignore[attr-defined]
+        public.field_confidence["external_links"] = 0.35 if public.external_links else 0.0
+    except Exception:
+        public.field_confidence["external_links"] = 0.0
 
-    return out
+    return public
 
 
 class SocialUrlConnector(Connector):
@@ -84,11 +101,30 @@ class SocialUrlConnector(Connector):
     Phase 6.3 additions:
     - Records cache metadata (r.from_cache) into PublicEvidence.fetch_cached
       (and also keeps a numeric signal in field_confidence for backward compatibility).
+    - PublicEvidence.fetch_cache_status separates fresh / stale-served / revalidated hits.
 
     Phase 7.2 additions:
     - Populates PublicEvidence.external_links using bounded <a href> parsing.
+
+    Streaming fetch (resource="profile"):
+    - non-HTML / oversized bodies are skipped before download (recorded as errors)
+    - reading stops after </head> plus a bounded link-scan window
+
+    Parsed-evidence cache (connectors/evidence_cache.py):
+    - PublicEvidence is reused while the underlying HTTP entry is unchanged
+
+    Ceremony budget:
+    - with a deadline, the fetch timeout is clamped to the remaining budget; a fetch
+      skipped or cut short by it is recorded as "budget_exhausted:collect"
+
+    refresh=True revalidates cached pages with the origin (e.g. after the person was
+    asked to add a bio crosslink) instead of serving them within their TTL.
     """
 
+    def __init__(self, deadline: Optional[Deadline] = None, refresh: bool = False) -> None:
+        self.deadline = deadline
+        self.refresh = refresh
+
     def supports(self, claim: IdentityClaim) -> bool:
         return claim.platform in SUPPORTED and bool((claim.claimed or "").strip())
 
@@ -99,62 +135,41 @@ class SocialUrlConnector(Connector):
 
         try:
             sess = get_cached_session()
-            r = sess.get(url, timeout=12, allow_redirects=True)
-
-            fetch_cached = getattr(r, "from_cache", None)
-
-            html = r.text or ""
-            soup = BeautifulSoup(html, "lxml")
-
-            public = PublicEvidence(
-                canonical_url=str(r.url),
-                raw_excerpt=(html[:2000] if html else None),
-                field_confidence={"canonical_url": 0.9, "raw_excerpt": 0.3},
+            r = sess.get(
+                url, timeout=12, allow_redirects=True, resource="profile", deadline=self.deadline, refresh=self.refresh
             )
 
-            def meta(prop: str):
-                tag = soup.find("meta", attrs={"property": prop})
-                return tag.get("content").strip() if tag and tag.get("content") else None
-
-            og_title = meta("og:title")
-            og_desc = meta("og:description")
-            og_img = meta("og:image")
-
-            if og_title:
-                public.display_name = og_title
-                public.field_confidence["display_name"] = 0.55
-
-            if og_desc:
-                public.bio = og_desc
-                public.field_confidence["bio"] = 0.55
-
-            if og_img:
-                public.avatar_url = og_img
-                public.field_confidence["avatar_url"] = 0.45
+            fetch_cached = getattr(r, "from_cache", None)
+            fetch_cache_status = cache_status(r)
 
-            # Fallback: <title>
-            if not getattr(public, "display_name", None) and soup.title and soup.title.string:
-                public.display_name = soup.title.string.strip()
-                public.field_confidence["display_name"] = 0.35
+            status = fetch_status(r)
+            if status.startswith("skipped:"):
+                raise ValueError(f"page {status}")
 
-            # Phase 7.2: external_links (best-effort)
-            try:
-                public.external_links = _extract_external_links(html, base_url=str(r.url), cap=50)  # type: ignore[attr-defined]
-                public.field_confidence["external_links"] = 0.35 if public.external_links else 0.0
-            except Exception:
-                public.field_confidence["external_links"] = 0.0
+            # Parsed-evidence cache: same HTTP entry -> reuse the finished PublicEvidence
+            # (no decode / parse). Only per-fetch cache metadata is refreshed below.
+            evidence_cache = get_evidence_cache()
+            stamp = http_entry_stamp(r)
+            public = evidence_cache.get(url, stamp)
+            if public is None:
+                public = _extract_public(r)
+                evidence_cache.put(url, stamp, public)
 
             # Phase 6.3: expose caching
             public.field_confidence["fetch_cached"] = 1.0 if fetch_cached else 0.0
             try:
                 public.fetch_cached = fetch_cached  # type: ignore[attr-defined]
+                public.fetch_cache_status = fetch_cache_status  # type: ignore[attr-defined]
             except Exception:
                 pass
 
             ev.public = public
 
         except Exception as e:
-            ev.errors.append(f"public_fetch_failed: {type(e).__name__}: {e}")
+            if self.deadline is not None and self.deadline.caused(e):
+                ev.errors.append(f"{BUDGET_EXHAUSTED}:collect")
+            else:
+                ev.errors.append(f"public_fetch_failed: {type(e).__name__}: {e}")
             ev.mode = CollectionMode.IN_APP_ONLY
 
         return ev
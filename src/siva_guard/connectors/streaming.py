@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from requests.adapters import HTTPAdapter
+
+from siva_guard.core.deadline import BUDGET_EXHAUSTED, BudgetExhausted, Deadline
+
+# Internal request header carrying the resource class from session.get(resource=...)
+# down to the transport. Stripped before the request goes on the wire.
+RESOURCE_HEADER = "X-Siva-Resource"
+
+# Internal request header carrying the ceremony deadline (a time.monotonic() value) from
+# session.get(deadline=...) down to the transport, which checks it before every redirect
+# hop and between body chunks. Stripped like RESOURCE_HEADER.
+DEADLINE_HEADER = "X-Siva-Deadline"
+
+# Response header recording how the body was read; persisted with cached responses.
+#   "complete" | "truncated:head" | "truncated:max_bytes"
+#   "skipped:content_type" | "skipped:oversized" | "skipped:compression_ratio"
+FETCH_STATUS_HEADER = "X-Siva-Fetch"
+
+_CHUNK = 16 * 1024
+_HEAD_END = b"</head"
+
+# Compressed-bomb guard: above this many decoded bytes, the decoded/raw ratio must stay sane.
+_BOMB_MIN_DECODED = 1024 * 1024
+_BOMB_MAX_RATIO = 100
+
+
+@dataclass(frozen=True)
+class FetchLimits:
+    max_bytes: int                     # hard cap on decoded body bytes
+    html_only: bool = False            # skip non-HTML content types before downloading the body
+    head_window: Optional[int] = None  # after </head>, keep reading this many bytes, then stop
+
+
+RESOURCE_LIMITS: Dict[str, FetchLimits] = {
+    # Profile pages: OG meta lives in <head>; external links need a bounded body window.
+    "profile": FetchLimits(max_bytes=1024 * 1024, html_only=True, head_window=256 * 1024),
+    # Reverse-link websites: anchors + raw URLs, usually small personal sites.
+    "website": FetchLimits(max_bytes=1024 * 1024, html_only=True, head_window=512 * 1024),
+    # Avatars are hashed whole; only a hard cap applies.
+    "avatar": FetchLimits(max_bytes=5 * 1024 * 1024),
+}
+
+DEFAULT_LIMITS = FetchLimits(max_bytes=8 * 1024 * 1024)
+
+
+def is_html_content_type(content_type: Optional[str]) -> bool:
+    ct = (content_type or "").split(";", 1)[0].strip().lower()
+    # Missing content type: let the body through (many small sites omit it).
+    return (not ct) or ct in ("text/html", "application/xhtml+xml")
+
+
+def fetch_status(r) -> str:
+    """
+    How the response body was read (see FETCH_STATUS_HEADER). Unknown -> "complete".
+    """
+    headers = getattr(r, "headers", None) or {}
+    return headers.get(FETCH_STATUS_HEADER) or "complete"
+
+
+def request_deadline(headers: Any) -> Optional[Deadline]:
+    """
+    Deadline carried by DEADLINE_HEADER, or None.
+    """
+    try:
+        return Deadline.until(float(headers[DEADLINE_HEADER]))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _hop_timeout(timeout: Any, deadline: Deadline) -> Any:
+    # min(timeout, remaining) for this hop (also inside a (connect, read) tuple);
+    # BudgetExhausted when too little is left to start it.
+    if isinstance(timeout, tuple):
+        return tuple(deadline.timeout(float("inf") if t is None else float(t)) for t in timeout)
+    return deadline.timeout(float("inf") if timeout is None else float(timeout))
+
+
+def _read_capped(r, limits: FetchLimits, deadline: Optional[Deadline] = None) -> str:
+    """
+    Read r's body under `limits` and return the fetch status.
+    Leaves r with _content set and the connection closed if reading stopped early.
+    Raises BudgetExhausted (connection closed, nothing kept) when `deadline` runs out
+    between chunks.
+    """
+    ok = 200 <= r.status_code < 300
+
+    if ok and limits.html_only and not is_html_content_type(r.headers.get("Content-Type")):
+        r.close()
+        r._content = b""
+        return "skipped:content_type"
+
+    # Declared size only matters when the whole body is needed (no early termination).
+    try:
+        declared = int(r.headers.get("Content-Length") or -1)
+    except ValueError:
+        declared = -1
+    if limits.head_window is None and declared > limits.max_bytes:
+        r.close()
+        r._content = b""
+        return "skipped:oversized"
+
+    buf = bytearray()
+    stop_at = limits.max_bytes
+    status = "complete"
+    scanned = 0  # bytes already searched for </head>
+    head_found = limits.head_window is None or not ok
+
+    for chunk in r.iter_content(_CHUNK):
+        buf += chunk
+
+        if deadline is not None and deadline.exhausted():
+            r.close()
+            r._content = b""
+            raise BudgetExhausted(f"{BUDGET_EXHAUSTED}: body read stopped after {len(buf)} bytes")
+
+        raw_read = r.raw.tell() if hasattr(r.raw, "tell") else 0
+        if len(buf) > _BOMB_MIN_DECODED and raw_read and len(buf) > _BOMB_MAX_RATIO * raw_read:
+            r.close()
+            r._content = b""
+            return "skipped:compression_ratio"
+
+        if not head_found:
+            start = max(0, scanned - len(_HEAD_END))
+            pos = bytes(buf[start:]).lower().find(_HEAD_END)
+            scanned = len(buf)
+            if pos >= 0:
+                head_found = True
+                stop_at = min(stop_at, start + pos + len(_HEAD_END) + int(limits.head_window or 0))
+
+        if len(buf) >= stop_at:
+            status = "truncated:head" if stop_at < limits.max_bytes else "truncated:max_bytes"
+            break
+
+    if status != "complete":
+        r.close()
+        del buf[stop_at:]
+
+    r._content = bytes(buf)
+    r._content_consumed = True
+    return status
+
+
+class CappedHTTPAdapter(HTTPAdapter):
+    """
+    Transport adapter that always streams and reads bodies under per-resource limits.
+
+    Sits *under* requests-cache, so the cache stores the capped body (and replays the
+    fetch status header) and conditional revalidation keeps working unchanged.
+    Callers that pass stream=True themselves get the raw stream, unread.
+
+    With DEADLINE_HEADER set, every hop (redirects are sent one by one through here)
+    gets its timeout clamped to the remaining budget and is refused once it is spent,
+    and the body read stops when the budget runs out.
+    """
+
+    def send(self, request, stream=False, **kwargs):  # type: ignore[override]
+        resource = request.headers.get(RESOURCE_HEADER)
+        limits = RESOURCE_LIMITS.get(resource or "", DEFAULT_LIMITS)
+        deadline = request_deadline(request.headers)
+        if deadline is not None:
+            kwargs["timeout"] = _hop_timeout(kwargs.get("timeout"), deadline)
+
+        # Strip the markers on a copy: redirect handling re-copies the original request,
+        # so later hops keep the resource class and deadline.
+        wire = request
+        markers = [h for h in (RESOURCE_HEADER, DEADLINE_HEADER) if h in request.headers]
+        if markers:
+            wire = request.copy()
+            for h in markers:
+                del wire.headers[h]
+
+        r = super().send(wire, stream=True, **kwargs)
+        if stream or request.method == "HEAD":
+            return r
+        if r.status_code == 304:
+            # No body; requests-cache merges these headers into the cached entry,
+            # so don't overwrite the entry's recorded fetch status.
+            return r
+
+        r.headers[FETCH_STATUS_HEADER] = _read_capped(r, limits, deadline)
+        return r
+
+
+__all__ = [
+    "CappedHTTPAdapter",
+    "DEADLINE_HEADER",
+    "DEFAULT_LIMITS",
+    "FETCH_STATUS_HEADER",
+    "FetchLimits",
+    "RESOURCE_HEADER",
+    "RESOURCE_LIMITS",
+    "fetch_status",
+    "is_html_content_type",
+    "request_deadline",
+]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+# Below this much remaining time a new fetch isn't started at all.
+MIN_FETCH_S = 0.25
+
+# Error code recorded in per_identity when a stage is skipped / cut short by the budget.
+BUDGET_EXHAUSTED = "budget_exhausted"
+
+
+class BudgetExhausted(TimeoutError):
+    """The ceremony deadline left too little time to start this network call."""
+
+
+@dataclass
+class Deadline:
+    """
+    Ceremony-wide time budget. Every network call takes min(own timeout, remaining).
+
+    budget_s=None means unbounded (timeouts fall back to each call's default).
+
+    Socket timeouts only bound each connect / read, so the transport also checks the
+    deadline between redirect hops and between body chunks (connectors/streaming.py):
+    a fetch can overrun the budget by at most one blocked read.
+    """
+
+    budget_s: Optional[float] = None
+    started_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def after(cls, budget_s: Optional[float]) -> "Deadline":
+        return cls(budget_s=budget_s if budget_s is None else max(0.0, float(budget_s)))
+
+    @classmethod
+    def until(cls, expires_at: float) -> "Deadline":
+        """
+        Deadline ending at a time.monotonic() value (see expires_at()).
+        """
+        now = time.monotonic()
+        return cls(budget_s=max(0.0, expires_at - now), started_at=now)
+
+    def expires_at(self) -> Optional[float]:
+        if self.budget_s is None:
+            return None
+        return self.started_at + self.budget_s
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def remaining(self) -> Optional[float]:
+        if self.budget_s is None:
+            return None
+        return max(0.0, self.budget_s - self.elapsed())
+
+    def exhausted(self, min_s: float = MIN_FETCH_S) -> bool:
+        rem = self.remaining()
+        return rem is not None and rem < min_s
+
+    def timeout(self, default_s: float) -> float:
+        """
+        Timeout for the next call: min(default_s, remaining).
+        Raises BudgetExhausted when not enough budget is left to start it.
+        """
+        rem = self.remaining()
+        if rem is None:
+            return default_s
+        if rem < MIN_FETCH_S:
+            raise BudgetExhausted(f"{BUDGET_EXHAUSTED}: {self.elapsed():.2f}s of {self.budget_s:.2f}s used")
+        return min(default_s, rem)
+
+    def caused(self, error: BaseException) -> bool:
+        """
+        Whether a failed call is the budget's doing: BudgetExhausted itself, or any
+        failure observed once the budget is spent (i.e. a clamped timeout fired).
+        """
+        return isinstance(error, BudgetExhausted) or self.exhausted()
+
+    def summary(self) -> dict:
+        rem = self.remaining()
+        return {
+            "budget_s": self.budget_s,
+            "elapsed_s": round(self.elapsed(), 3),
+            "remaining_s": (round(rem, 3) if rem is not None else None),
+            "exhausted": self.exhausted(),
+        }
+
+
+__all__ = ["BUDGET_EXHAUSTED", "BudgetExhausted", "Deadline", "MIN_FETCH_S"]
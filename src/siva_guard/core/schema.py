@@ -127,6 +127,8 @@ class PublicEvidence(BaseModel):
     # ✅ Phase 6.3: expose cache information cleanly
     # social_url.py already attempts to set this field.
     fetch_cached: Optional[bool] = None
+    # "fresh" | "stale" | "revalidated" | "miss" (see http_client.cache_status)
+    fetch_cache_status: Optional[str] = None
 
     external_links: List[str] = Field(default_factory=list)
     raw_excerpt: Optional[str] = None
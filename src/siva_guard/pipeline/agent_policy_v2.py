@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
+from siva_guard.pipeline.scoring_weights import LOW_PUBLIC_COVERAGE, REQUEST_STRONGER_PROOF_RISK, WARN_RISK
+
 
 def decide_action_v2(metrics: Dict[str, Any], overall_risk: float) -> Dict[str, Any]:
     """
@@ -16,16 +18,16 @@ def decide_action_v2(metrics: Dict[str, Any], overall_risk: float) -> Dict[str,
 
     reasons: List[str] = []
 
-    if num > 1 and public_cov < 0.5:
+    if num > 1 and public_cov < LOW_PUBLIC_COVERAGE:
         reasons.append("low_public_coverage_multi_identity")
 
     if confusable > 0:
         reasons.append("confusable_identifiers_present")
 
     # Risk thresholds
-    if overall_risk >= 0.70:
+    if overall_risk >= REQUEST_STRONGER_PROOF_RISK:
         action = "REQUEST_STRONGER_PROOF"
-    elif overall_risk >= 0.40:
+    elif overall_risk >= WARN_RISK:
         action = "WARN"
     else:
         action = "ALLOW"
@@ -6,6 +6,8 @@ from typing import Optional
 import hashlib
 
 from siva_guard.connectors.http_client import get_cached_session
+from siva_guard.connectors.streaming import fetch_status
+from siva_guard.core.deadline import BUDGET_EXHAUSTED, Deadline
 
 
 @dataclass
@@ -15,17 +17,26 @@ class AvatarHashResult:
     error: Optional[str]
 
 
-def hash_avatar_url(avatar_url: Optional[str], timeout_s: float = 8.0) -> AvatarHashResult:
+def hash_avatar_url(
+    avatar_url: Optional[str],
+    timeout_s: float = 8.0,
+    deadline: Optional[Deadline] = None,
+) -> AvatarHashResult:
     """
     Deterministic: if avatar_url missing or fetch fails, return error; no guessing.
     Uses cached HTTP session (requests-cache) to reduce repeat fetches.
+    With a deadline, a fetch skipped / cut short by the budget -> error "budget_exhausted".
     """
     if not avatar_url:
         return AvatarHashResult(avatar_url=None, sha256=None, error="avatar_url_missing")
 
     try:
         sess = get_cached_session()
-        r = sess.get(avatar_url, timeout=timeout_s)
+        r = sess.get(avatar_url, timeout=timeout_s, resource="avatar", deadline=deadline)
+        status = fetch_status(r)
+        if status != "complete":
+            # Hashing a partial body would produce a meaningless digest.
+            return AvatarHashResult(avatar_url=avatar_url, sha256=None, error=f"avatar_fetch_failed:{status}")
         if r.status_code != 200 or not r.content:
             return AvatarHashResult(
                 avatar_url=avatar_url,
@@ -35,4 +46,6 @@ def hash_avatar_url(avatar_url: Optional[str], timeout_s: float = 8.0) -> Avatar
         h = hashlib.sha256(r.content).hexdigest()
         return AvatarHashResult(avatar_url=avatar_url, sha256=h, error=None)
     except Exception as e:
+        if deadline is not None and deadline.caused(e):
+            return AvatarHashResult(avatar_url=avatar_url, sha256=None, error=BUDGET_EXHAUSTED)
         return AvatarHashResult(avatar_url=avatar_url, sha256=None, error=f"avatar_fetch_failed:{type(e).__name__}")
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from siva_guard.pipeline.scoring_weights import (
+    AVATAR_MISMATCH_WEIGHT,
+    CONFIDENCE_BASE,
+    CONFIDENCE_COVERAGE_WEIGHT,
+    CONFUSABLE_WEIGHT,
+    CROSS_CEREMONY_REUSE_RISK,
+    CROSSLINK_CREDIT,
+    FAKE_HIGH_RISK,
+    FAKE_MEDIUM_RISK,
+    FETCH_ERROR_PENALTY,
+    LOW_PUBLIC_COVERAGE,
+    LOW_PUBLIC_COVERAGE_WEIGHT,
+    LOW_TRUST_AUTHENTICITY,
+    MAX_FETCH_ERROR_PENALTY,
+    MAX_SINGLE_EXPLAINERS,
+    MIN_IDENTITIES_FOR_SUBSTITUTION,
+    MIN_PUBLIC_COVERAGE,
+    NAME_MISMATCH_WEIGHT,
+    REQUEST_STRONGER_PROOF_RISK,
+    SINGLE_BASE_RISK,
+    SINGLE_REASON_WEIGHTS,
+    SUBSTITUTION_BASE_RISK,
+    WARN_RISK,
+    WEAK_EVIDENCE_CODES,
+    WEAK_EVIDENCE_MAX_CONFIDENCE,
+    WEAK_EVIDENCE_RISK,
+)
+from siva_guard.pipeline.single_identity_risk import SingleIdentityFlags, single_identity_flags
+
+# Batch (re-)scoring of stored ceremonies: compute_risk_v2 -> decide_action_v2 -> judge_v1
+# over columnar NumPy arrays, one row per ceremony / per identity. Every step applies
+# the scalar path's float operations in the same order, with the same constants
+# (scoring_weights.py), so results are bit-identical (see tests/test_batch_scoring.py);
+# thresholds can be varied for experiments.
+
+ACTIONS = ("ALLOW", "WARN", "REQUEST_STRONGER_PROOF")
+VERDICTS = ("REAL", "FAKE")
+CERTAINTIES = ("LOW", "MEDIUM", "HIGH")
+
+ALLOW, WARN, REQUEST_STRONGER_PROOF = 0, 1, 2
+REAL, FAKE = 0, 1
+LOW, MEDIUM, HIGH = 0, 1, 2
+
+
+@dataclass(frozen=True)
+class BatchThresholds:
+    """
+    Decision thresholds of decide_action_v2 / judge_v1 (defaults = scalar path).
+    """
+
+    request_stronger_proof: float = REQUEST_STRONGER_PROOF_RISK
+    warn: float = WARN_RISK
+    fake_high: float = FAKE_HIGH_RISK
+    fake_medium: float = FAKE_MEDIUM_RISK
+    min_public_coverage: float = MIN_PUBLIC_COVERAGE
+
+
+@dataclass
+class CeremonyBatch:
+    """
+    Columnar inputs. Ceremony columns (length C) are the evidence_graph_v2 metrics plus
+    whether cross_ceremony_reuse flagged anything; identity columns (length N) are
+    SingleIdentityFlags, the per_identity item's collection errors and the row of the
+    owning ceremony (ceremony[k] in 0..C-1, in per_identity order within a ceremony).
+    """
+
+    num_identities: np.ndarray
+    public_coverage: np.ndarray
+    confusable_pairs: np.ndarray
+    name_mismatch_pairs: np.ndarray
+    avatar_mismatch_pairs: np.ndarray
+    crosslink_hits: np.ndarray
+    reuse_flagged: np.ndarray
+
+    ceremony: np.ndarray
+    facebook_numeric_id: np.ndarray
+    generic_bio: np.ndarray
+    name_repetition: np.ndarray
+    no_linkouts: np.ndarray
+    missing_avatar: np.ndarray
+    has_errors: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.num_identities)
+
+    @classmethod
+    def from_ceremonies(
+        cls,
+        ceremonies: Iterable[Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]],
+    ) -> "CeremonyBatch":
+        """
+        Build from (graph_metrics, per_identity, cross_ceremony_reuse) triples, the
+        arguments compute_risk_v2 takes.
+        """
+        metrics: List[Tuple[int, float, int, int, int, int, bool]] = []
+        owner: List[int] = []
+        flags: List[SingleIdentityFlags] = []
+        errors: List[bool] = []
+        for c, (gm, per_identity, reuse) in enumerate(ceremonies):
+            metrics.append(
+                (
+                    int(gm.get("num_identities", 0) or 0),
+                    float(gm.get("public_coverage", 0.0) or 0.0),
+                    int(gm.get("confusable_pairs", 0) or 0),
+                    int(gm.get("name_mismatch_pairs", 0) or 0),
+                    int(gm.get("avatar_mismatch_pairs", 0) or 0),
+                    int(gm.get("crosslink_hits", 0) or 0),
+                    bool((reuse or {}).get("flagged")),
+                )
+            )
+            for item in (per_identity or {}).values():
+                owner.append(c)
+                flags.append(single_identity_flags(item))
+                errors.append(bool(item.get("errors")))
+
+        cols = list(zip(*metrics)) if metrics else [()] * 7
+        return cls(
+            num_identities=np.asarray(cols[0], dtype=np.int64),
+            public_coverage=np.asarray(cols[1], dtype=np.float64),
+            confusable_pairs=np.asarray(cols[2], dtype=np.int64),
+            name_mismatch_pairs=np.asarray(cols[3], dtype=np.int64),
+            avatar_mismatch_pairs=np.asarray(cols[4], dtype=np.int64),
+            crosslink_hits=np.asarray(cols[5], dtype=np.int64),
+            reuse_flagged=np.asarray(cols[6], dtype=bool),
+            ceremony=np.asarray(owner, dtype=np.int64),
+            facebook_numeric_id=np.asarray([f.facebook_numeric_id for f in flags], dtype=bool),
+            generic_bio=np.asarray([f.generic_bio is not None for f in flags], dtype=bool),
+            name_repetition=np.asarray([f.name_repetition for f in flags], dtype=np.float64),
+            no_linkouts=np.asarray([f.no_linkouts for f in flags], dtype=bool),
+            missing_avatar=np.asarray([f.missing_avatar for f in flags], dtype=bool),
+            has_errors=np.asarray(errors, dtype=bool),
+        )
+
+
+@dataclass
+class BatchScores:
+    substitution_risk: np.ndarray
+    authenticity_risk: np.ndarray
+    overall_risk: np.ndarray
+    confidence: np.ndarray
+    action: np.ndarray  # index into ACTIONS
+    verdict: np.ndarray  # index into VERDICTS
+    certainty: np.ndarray  # index into CERTAINTIES
+    abstained: np.ndarray
+
+    def labels(self, column: str) -> np.ndarray:
+        names = {"action": ACTIONS, "verdict": VERDICTS, "certainty": CERTAINTIES}[column]
+        return np.asarray(names, dtype=object)[getattr(self, column)]
+
+
+def _add(x: np.ndarray, cond: np.ndarray, delta: Any) -> np.ndarray:
+    # x + delta where cond; x + 0.0 elsewhere (exact), mirroring `if cond: x += delta`.
+    return x + np.where(cond, delta, 0.0)
+
+
+def reason_signals(batch: CeremonyBatch) -> Dict[str, np.ndarray]:
+    """
+    Column counterpart of single_identity_risk.reason_signals(): per identity row, the
+    strength of each single-identity reason (0.0 = absent).
+    """
+    return {
+        "facebook_numeric_id_profile": batch.facebook_numeric_id.astype(np.float64),
+        "generic_platform_bio": batch.generic_bio.astype(np.float64),
+        "repeated_name_tokens": batch.name_repetition,
+        "no_bio_linkouts": batch.no_linkouts.astype(np.float64),
+        "missing_avatar_url": batch.missing_avatar.astype(np.float64),
+    }
+
+
+def single_identity_risks(batch: CeremonyBatch) -> np.ndarray:
+    """
+    score_single_identity().authenticity_risk per identity row.
+    """
+    risk = np.full(len(batch.ceremony), SINGLE_BASE_RISK)
+    signals = reason_signals(batch)
+    for code, weight in SINGLE_REASON_WEIGHTS.items():
+        risk = _add(risk, signals[code] > 0, weight * signals[code])
+    return np.clip(risk, 0.0, 1.0)
+
+
+def _strongest_identity(batch: CeremonyBatch, risk: np.ndarray, authenticity: np.ndarray) -> np.ndarray:
+    # Row of the first identity reaching its ceremony's max risk (compute_risk_v2 keeps
+    # the first on ties), -1 for ceremonies without identities / above-zero risk.
+    n = len(batch.ceremony)
+    rows = np.arange(n)
+    top = np.full(len(batch), n, dtype=np.int64)
+    at_max = (risk == authenticity[batch.ceremony]) & (risk > 0.0)
+    np.minimum.at(top, batch.ceremony[at_max], rows[at_max])
+    return np.where(top == n, -1, top)
+
+
+def score_batch(batch: CeremonyBatch, thresholds: BatchThresholds = BatchThresholds()) -> BatchScores:
+    """
+    compute_risk_v2 + decide_action_v2 + judge_v1 for every ceremony in the batch.
+    """
+    c = len(batch)
+    num = batch.num_identities
+    public_cov = batch.public_coverage
+
+    # ---- A) Substitution risk ----
+    substitution = np.full(c, SUBSTITUTION_BASE_RISK)
+    substitution = _add(substitution, (num > 1) & (public_cov < LOW_PUBLIC_COVERAGE), LOW_PUBLIC_COVERAGE_WEIGHT)
+    substitution = _add(substitution, batch.confusable_pairs > 0, CONFUSABLE_WEIGHT)
+    substitution = _add(substitution, batch.name_mismatch_pairs > 0, NAME_MISMATCH_WEIGHT)
+    substitution = _add(substitution, batch.avatar_mismatch_pairs > 0, AVATAR_MISMATCH_WEIGHT)
+    substitution = substitution - np.where(batch.crosslink_hits > 0, CROSSLINK_CREDIT, 0.0)
+    substitution = np.clip(substitution, 0.0, 1.0)
+
+    # ---- B) Authenticity risk: strongest identity per ceremony ----
+    risk = single_identity_risks(batch)
+    authenticity = np.zeros(c)
+    np.maximum.at(authenticity, batch.ceremony, risk)
+    authenticity = np.clip(authenticity, 0.0, 1.0)
+    low_trust = authenticity > LOW_TRUST_AUTHENTICITY
+
+    # Reason codes attached from the strongest identity: its first MAX_SINGLE_EXPLAINERS
+    # reasons, which score_single_identity() emits in SINGLE_REASON_WEIGHTS order.
+    attached = {code: np.zeros(c, dtype=bool) for code in SINGLE_REASON_WEIGHTS}
+    if len(risk):
+        top = _strongest_identity(batch, risk, authenticity)
+        has_top = low_trust & (top >= 0)
+        t = np.where(top >= 0, top, 0)
+        slot = np.zeros(c, dtype=np.int64)
+        for code, signal in reason_signals(batch).items():
+            present = signal[t] > 0
+            attached[code] = has_top & present & (slot < MAX_SINGLE_EXPLAINERS)
+            slot = slot + present
+
+    # ---- B2) Cross-ceremony reuse ----
+    authenticity = np.where(batch.reuse_flagged, np.maximum(authenticity, CROSS_CEREMONY_REUSE_RISK), authenticity)
+
+    # ---- C) Overall risk ----
+    overall = np.maximum(substitution, authenticity)
+
+    # ---- D) Confidence ----
+    fetch_errors = np.zeros(c, dtype=np.int64)
+    np.add.at(fetch_errors, batch.ceremony[batch.has_errors], 1)
+    conf = CONFIDENCE_BASE + CONFIDENCE_COVERAGE_WEIGHT * public_cov
+    conf = conf - np.where(fetch_errors > 0, np.minimum(MAX_FETCH_ERROR_PENALTY, FETCH_ERROR_PENALTY * fetch_errors), 0.0)
+    conf = np.clip(conf, 0.0, 1.0)
+    # weak evidence: low_trust_single_identity_signals is present exactly when low_trust
+    conf = np.where((authenticity >= WEAK_EVIDENCE_RISK) & low_trust, np.minimum(conf, WEAK_EVIDENCE_MAX_CONFIDENCE), conf)
+
+    # ---- decide_action_v2 ----
+    action = np.where(
+        overall >= thresholds.request_stronger_proof,
+        REQUEST_STRONGER_PROOF,
+        np.where(overall >= thresholds.warn, WARN, ALLOW),
+    ).astype(np.int8)
+
+    # ---- judge_v1 ----
+    contradiction = (batch.name_mismatch_pairs > 0) | (batch.avatar_mismatch_pairs > 0) | (batch.crosslink_hits == 0)
+    substitution_case = (
+        (num >= MIN_IDENTITIES_FOR_SUBSTITUTION) & (public_cov >= thresholds.min_public_coverage) & (batch.confusable_pairs > 0) & contradiction
+    )
+    fake_high = substitution_case & (overall >= thresholds.fake_high)
+    fake_medium = substitution_case & (overall >= thresholds.fake_medium)
+    fake = fake_high | fake_medium
+
+    weak_evidence = np.zeros(c, dtype=bool)
+    for code in WEAK_EVIDENCE_CODES:
+        weak_evidence = weak_evidence | attached[code]
+    abstain = ~fake & ((action != ALLOW) | weak_evidence | (public_cov < thresholds.min_public_coverage))
+
+    verdict = np.where(fake, FAKE, REAL).astype(np.int8)
+    certainty = np.where(fake_high, HIGH, np.where(fake_medium, MEDIUM, np.where(abstain, LOW, MEDIUM))).astype(np.int8)
+
+    return BatchScores(
+        substitution_risk=substitution,
+        authenticity_risk=authenticity,
+        overall_risk=overall,
+        confidence=conf,
+        action=action,
+        verdict=verdict,
+        certainty=certainty,
+        abstained=abstain,
+    )
+
+
+def score_ceremonies(
+    ceremonies: Sequence[Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]],
+    thresholds: BatchThresholds = BatchThresholds(),
+) -> BatchScores:
+    return score_batch(CeremonyBatch.from_ceremonies(ceremonies), thresholds)
+
+
+__all__ = [
+    "ACTIONS",
+    "BatchScores",
+    "BatchThresholds",
+    "CERTAINTIES",
+    "CeremonyBatch",
+    "VERDICTS",
+    "reason_signals",
+    "score_batch",
+    "score_ceremonies",
+    "single_identity_risks",
+]
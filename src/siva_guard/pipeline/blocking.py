@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import math
+from collections import Counter, defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+from siva_guard.pipeline.similarity import CONFUSABLE_RATIO, normalize_identifier
+
+Pair = Tuple[int, int]
+
+# Below this many identities every pair is scored (exact legacy behaviour, edges included).
+BLOCKING_MIN_IDENTITIES = 50
+
+CONFUSABLE_THRESHOLD = CONFUSABLE_RATIO
+
+# Float slack so borderline pairs (ratio == threshold) are always kept as candidates.
+_EPS = 1e-6
+
+
+def _qgrams(s: str, q: int) -> Counter:
+    return Counter(s[i:i + q] for i in range(len(s) - q + 1))
+
+
+def _max_indel(la: int, lb: int, threshold: float) -> int:
+    # fuzz.ratio = 1 - indel_distance / (la + lb)  =>  indel_distance <= (1 - t) * (la + lb)
+    return int(math.floor((1.0 - threshold) * (la + lb) + _EPS))
+
+
+def _length_ok(la: int, lb: int, threshold: float) -> bool:
+    # indel_distance >= |la - lb|, so the ratio can't exceed 2 * min / (la + lb).
+    return 2.0 * min(la, lb) + _EPS >= threshold * (la + lb)
+
+
+def _min_shared(la: int, lb: int, q: int, threshold: float) -> int:
+    # q-gram lemma (Ukkonen): edit distance k => at least max(la, lb) - q + 1 - k*q shared
+    # q-grams (multiset). Levenshtein <= indel distance, so k = max indel distance is safe.
+    return max(la, lb) - q + 1 - _max_indel(la, lb, threshold) * q
+
+
+def confusable_candidates(
+    identifiers: Sequence[str],
+    *,
+    threshold: float = CONFUSABLE_THRESHOLD,
+    q: int = 2,
+    normalized: bool = False,
+) -> Set[Pair]:
+    """
+    Index pairs (i < j) whose normalized identifiers could reach
+    confusability(...)["ratio"] >= threshold. No false negatives: every pair at or
+    above the threshold is returned; most pairs far below it are not.
+
+    Length filter + q-gram count filter over an inverted index of normalized strings.
+    """
+    strs = [s if normalized else normalize_identifier(s) for s in identifiers]
+    order = sorted((i for i, s in enumerate(strs) if s), key=lambda i: len(strs[i]))
+
+    # Postings are appended shortest-first, so each list is sorted by length and
+    # entries too short for the current string can be skipped for good (head pointer).
+    postings: Dict[str, List[Tuple[int, int, int]]] = defaultdict(list)  # gram -> [(len, idx, count)]
+    heads: Dict[str, int] = defaultdict(int)
+    by_len: Dict[int, List[int]] = defaultdict(list)
+    need: Dict[Tuple[int, int], int] = {}  # (la, lb) -> min shared q-grams
+    out: Set[Pair] = set()
+
+    for b in order:
+        sb = strs[b]
+        lb = len(sb)
+        grams = _qgrams(sb, q)
+
+        min_la = lb
+        while min_la > 1 and _length_ok(min_la - 1, lb, threshold):
+            min_la -= 1
+
+        shared: Dict[int, int] = defaultdict(int)
+        for g, cb in grams.items():
+            plist = postings.get(g)
+            if not plist:
+                continue
+            h = heads[g]
+            while h < len(plist) and plist[h][0] < min_la:
+                h += 1
+            heads[g] = h
+            for k in range(h, len(plist)):
+                _, a, ca = plist[k]
+                shared[a] += ca if ca < cb else cb
+
+        for a, n in shared.items():
+            la = len(strs[a])
+            t = need.get((la, lb))
+            if t is None:
+                t = need[(la, lb)] = _min_shared(la, lb, q, threshold)
+            if n >= t:
+                out.add((a, b) if a < b else (b, a))
+
+        # Very short strings can qualify without sharing any q-gram.
+        for la in range(min_la, lb + 1):
+            if _min_shared(la, lb, q, threshold) <= 0:
+                for a in by_len.get(la, ()):
+                    out.add((a, b) if a < b else (b, a))
+
+        for g, cb in grams.items():
+            postings[g].append((lb, b, cb))
+        by_len[lb].append(b)
+
+    return out
+
+
+def key_join_candidates(
+    provides: Sequence[Iterable[Hashable]],
+    emits: Sequence[Iterable[Hashable]],
+) -> Set[Pair]:
+    """
+    Pairs (i < j) where one side emits a key the other provides
+    (e.g. a bio links to the other identity's domain or @handle).
+    """
+    owners: Dict[Hashable, List[int]] = defaultdict(list)
+    for i, keys in enumerate(provides):
+        for k in set(keys):
+            owners[k].append(i)
+
+    out: Set[Pair] = set()
+    for j, keys in enumerate(emits):
+        for k in set(keys):
+            for i in owners.get(k, ()):
+                if i != j:
+                    out.add((i, j) if i < j else (j, i))
+    return out
+
+
+def equal_key_candidates(keys: Sequence[Optional[Hashable]]) -> Set[Pair]:
+    """
+    Pairs (i < j) sharing the same non-empty key (e.g. identical avatar hash).
+    """
+    groups: Dict[Hashable, List[int]] = defaultdict(list)
+    for i, k in enumerate(keys):
+        if k is not None and k != "":
+            groups[k].append(i)
+    out: Set[Pair] = set()
+    for members in groups.values():
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                out.add((members[x], members[y]))
+    return out
+
+
+def all_pairs(n: int) -> List[Pair]:
+    return [(i, j) for i in range(n) for j in range(i + 1, n)]
+
+
+__all__ = [
+    "BLOCKING_MIN_IDENTITIES",
+    "CONFUSABLE_THRESHOLD",
+    "all_pairs",
+    "confusable_candidates",
+    "equal_key_candidates",
+    "key_join_candidates",
+]
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from siva_guard.pipeline.blocking import CONFUSABLE_THRESHOLD
+
+
+class UnionFind:
+    """
+    Disjoint sets over 0..n-1 (union by size, path halving): near-linear overall.
+    """
+
+    __slots__ = ("parent", "size")
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> int:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return ra
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+        return ra
+
+
+@dataclass
+class IdentityCluster:
+    """
+    Identities tied together by strong edges (crosslink or exact avatar match), plus
+    suspects: identities outside the cluster whose handle is confusable with a member.
+    """
+
+    cluster_id: int
+    members: List[int] = field(default_factory=list)
+    crosslink_edges: int = 0
+    avatar_match_edges: int = 0
+    suspects: List[int] = field(default_factory=list)
+    suspect_edges: int = 0
+
+
+def cluster_edges(
+    n: int,
+    src: Sequence[int],
+    dst: Sequence[int],
+    crosslink: Sequence[bool],
+    avatar_match: Sequence[Optional[bool]],
+    handle_similarity: Sequence[Optional[float]],
+    *,
+    threshold: float = CONFUSABLE_THRESHOLD,
+) -> List[IdentityCluster]:
+    """
+    Union-find over strong edges, then one pass attaching confusable-but-unlinked
+    identities to clusters of two or more as suspects. Clusters are numbered by their
+    first member (node order); singletons are not returned.
+    """
+    uf = UnionFind(n)
+    m = len(src)
+    for k in range(m):
+        if crosslink[k] or avatar_match[k] is True:
+            uf.union(src[k], dst[k])
+
+    roots = [uf.find(i) for i in range(n)]
+    clusters: Dict[int, IdentityCluster] = {}
+    for i, r in enumerate(roots):
+        if uf.size[r] < 2:
+            continue
+        c = clusters.get(r)
+        if c is None:
+            c = clusters[r] = IdentityCluster(cluster_id=len(clusters))
+        c.members.append(i)
+
+    suspect_sets: Dict[int, set] = {}
+    for k in range(m):
+        a, b = src[k], dst[k]
+        ra, rb = roots[a], roots[b]
+        if ra == rb:
+            c = clusters[ra]
+            if crosslink[k]:
+                c.crosslink_edges += 1
+            if avatar_match[k] is True:
+                c.avatar_match_edges += 1
+            continue
+
+        sim = handle_similarity[k]
+        if sim is None or sim < threshold:
+            continue
+        # Confusable across clusters: each side is a suspect of the other's cluster.
+        for member, other_root in ((a, rb), (b, ra)):
+            c = clusters.get(other_root)
+            if c is not None:
+                c.suspect_edges += 1
+                suspect_sets.setdefault(other_root, set()).add(member)
+
+    for r, s in suspect_sets.items():
+        clusters[r].suspects = sorted(s)
+
+    return sorted(clusters.values(), key=lambda c: c.cluster_id)
+
+
+def cluster_summary(
+    clusters: List[IdentityCluster],
+    node_ids: Sequence[str],
+    node_features: Sequence[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    JSON-ready per-cluster metrics.
+    """
+    out: List[Dict[str, Any]] = []
+    for c in clusters:
+        size = len(c.members)
+        out.append(
+            {
+                "cluster_id": c.cluster_id,
+                "members": [node_ids[i] for i in c.members],
+                "size": size,
+                "platforms": sorted({str(node_features[i].get("platform")) for i in c.members}),
+                "public_coverage": sum(1 for i in c.members if node_features[i].get("has_public")) / float(size),
+                "crosslink_edges": c.crosslink_edges,
+                "avatar_match_edges": c.avatar_match_edges,
+                "suspects": [node_ids[i] for i in c.suspects],
+                "suspect_edges": c.suspect_edges,
+            }
+        )
+    return out
+
+
+def cluster_metrics(clusters: List[IdentityCluster]) -> Dict[str, Any]:
+    """
+    Ceremony-level cluster counts (merged into GraphV2Result.metrics).
+    """
+    suspects = set()
+    for c in clusters:
+        suspects.update(c.suspects)
+    return {
+        "clusters": len(clusters),
+        "largest_cluster": max((len(c.members) for c in clusters), default=0),
+        "clustered_identities": sum(len(c.members) for c in clusters),
+        "suspect_identities": len(suspects),
+    }
+
+
+__all__ = [
+    "IdentityCluster",
+    "UnionFind",
+    "cluster_edges",
+    "cluster_metrics",
+    "cluster_summary",
+]
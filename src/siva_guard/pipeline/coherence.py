@@ -15,7 +15,7 @@ def compute_coherence(graph: EvidenceGraph) -> Dict[str, float]:
     # Handle similarity risk
     high_confusable_edges = 0
     for _, _, d in g.edges(data=True):
-        if d.get("handle_similarity", 0) >= 0.92:
+        if (d.get("handle_similarity") or 0) >= 0.92:
             high_confusable_edges += 1
 
     return {
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import unicodedata
+from typing import Dict, Optional
+
+# Confusable skeletons in the spirit of UTS #39: two identifiers that look alike map to
+# the same skeleton. Steps: NFKD (full-width / compatibility forms -> ASCII, accents
+# split off) -> drop combining marks, whitespace and invisible format characters ->
+# map lookalikes to their Latin prototype (may be multi-codepoint) -> lowercase -> map
+# again, so capitals without an entry of their own fold like their lowercase form.
+# Tables are compiled once at import; pure-ASCII input takes a bytes.translate fast path.
+
+# Legacy ASCII homoglyphs (digits / symbols standing in for letters).
+ASCII_HOMOGLYPHS: Dict[str, str] = {
+    "0": "o",
+    "1": "l",
+    "3": "e",
+    "5": "s",
+    "7": "t",
+    "@": "a",
+    "$": "s",
+}
+
+# Non-Latin lookalikes -> Latin prototype. Mapped before lowercasing, so capitals that
+# only look Latin as capitals (Greek Eta, Cyrillic En) get their own entries.
+CONFUSABLES: Dict[str, str] = {
+    # Cyrillic
+    "А": "a", "а": "a", "В": "b", "в": "b", "Ь": "b", "ь": "b", "С": "c", "с": "c",
+    "ԁ": "d", "Е": "e", "е": "e", "Һ": "h", "һ": "h", "Н": "h", "н": "h",
+    "І": "i", "і": "i", "Ј": "j", "ј": "j", "К": "k", "к": "k", "Ӏ": "l", "ӏ": "l",
+    "М": "m", "м": "m", "П": "n", "п": "n", "О": "o", "о": "o", "Р": "p", "р": "p",
+    "Ԛ": "q", "ԛ": "q", "Ѕ": "s", "ѕ": "s", "Т": "t", "т": "t", "Ѵ": "v", "ѵ": "v",
+    "Ԝ": "w", "ԝ": "w", "Х": "x", "х": "x", "У": "y", "у": "y", "Ү": "y", "ү": "y",
+    # Greek
+    "Α": "a", "α": "a", "Β": "b", "β": "b", "Ε": "e", "ε": "e", "Ζ": "z", "Η": "h",
+    "η": "n", "Ι": "i", "ι": "i", "Κ": "k", "κ": "k", "Μ": "m", "Ν": "n", "ν": "v",
+    "Ο": "o", "ο": "o", "Ρ": "p", "ρ": "p", "Τ": "t", "τ": "t", "Υ": "y", "υ": "u",
+    "Χ": "x", "χ": "x", "ω": "w", "ϲ": "c", "Ϲ": "c", "γ": "y", "Ϳ": "j", "ϳ": "j",
+    # Latin extensions / IPA / small capitals
+    "ı": "i", "ȷ": "j", "ɑ": "a", "ɡ": "g", "ɩ": "i", "ɪ": "i", "ʏ": "y", "ᴄ": "c",
+    "ᴏ": "o", "ᴠ": "v", "ᴡ": "w", "ᴢ": "z", "ł": "l", "Ł": "l", "đ": "d", "Đ": "d",
+    "ħ": "h", "Ħ": "h", "ø": "o", "Ø": "o",
+    # multi-codepoint prototypes
+    "æ": "ae", "Æ": "ae", "œ": "oe", "Œ": "oe", "ß": "ss", "ẞ": "ss",
+}
+
+# Invisible characters attackers insert between letters.
+_FORMAT_CHARS = (
+    "\u00ad\u034f\u061c\u115f\u1160\u17b4\u17b5\u180e\u200b\u200c\u200d\u200e\u200f\u2060\u2061\u2062\u2063\u2064\ufeff"
+)
+
+# Blocks holding the combining marks NFKD splits off Latin / Greek / Cyrillic letters.
+_COMBINING_RANGES = ((0x0300, 0x0370), (0x0483, 0x048A), (0x1AB0, 0x1B00), (0x1DC0, 0x1E00), (0x20D0, 0x2100), (0xFE20, 0xFE30))
+
+
+def _build_unicode_table() -> Dict[int, Optional[str]]:
+    table: Dict[int, Optional[str]] = {}
+    for lo, hi in _COMBINING_RANGES:
+        for cp in range(lo, hi):
+            if unicodedata.category(chr(cp)) == "Mn":
+                table[cp] = None
+    for cp in range(0x3001):
+        if chr(cp).isspace():
+            table[cp] = None
+    for ch in _FORMAT_CHARS:
+        table[ord(ch)] = None
+    for src, dst in ASCII_HOMOGLYPHS.items():
+        table[ord(src)] = dst
+    for src, dst in CONFUSABLES.items():
+        table[ord(src)] = dst
+    return table
+
+
+_UNICODE_TABLE = _build_unicode_table()
+
+# Lookalikes that NFKD would rewrite first (lunate sigma -> sigma) are mapped before it.
+_PRE_NFKD_TABLE = {ord(k): v for k, v in CONFUSABLES.items() if unicodedata.normalize("NFKD", k) != k}
+
+_ASCII_TABLE = bytes.maketrans(
+    "".join(ASCII_HOMOGLYPHS).encode("ascii"),
+    "".join(ASCII_HOMOGLYPHS.values()).encode("ascii"),
+)
+_ASCII_WHITESPACE = bytes(cp for cp in range(128) if chr(cp).isspace())
+
+
+def skeleton(s: Optional[str]) -> str:
+    """
+    Confusable skeleton of an identifier (lowercase, whitespace-free).
+    ASCII input gives exactly the legacy normalize_identifier result.
+    """
+    s = s or ""
+    if s.isascii():
+        return s.lower().encode("ascii").translate(_ASCII_TABLE, _ASCII_WHITESPACE).decode("ascii")
+    return unicodedata.normalize("NFKD", s.translate(_PRE_NFKD_TABLE)).translate(_UNICODE_TABLE).lower().translate(_UNICODE_TABLE)
+
+
+__all__ = ["ASCII_HOMOGLYPHS", "CONFUSABLES", "skeleton"]
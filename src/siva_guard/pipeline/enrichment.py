@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from siva_guard.connectors.fanout import run_coro
+from siva_guard.core.deadline import Deadline
+from siva_guard.pipeline.avatar_hash import AvatarHashResult, hash_avatar_url
+from siva_guard.pipeline.linkout import extract_linkouts
+from siva_guard.pipeline.reverse_links import ReverseLinkResult, fetch_outbound_links
+
+
+def _safe_str(s: Optional[str]) -> str:
+    return (s or "").strip()
+
+
+def enrichment_urls(item: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    (avatar_url, reverse_link_url) for one per_identity item, derived exactly as
+    build_evidence_graph_v2 derives them: public evidence first, UI card as fallback;
+    the reverse-link candidate is the first URL in the bio.
+    """
+    pub = item.get("public") or item.get("public_evidence") or {}
+    ui = item.get("ui") or {}
+
+    bio = _safe_str(pub.get("bio")) or _safe_str(ui.get("snippet"))
+    avatar_url = _safe_str(pub.get("avatar_url")) or _safe_str(ui.get("avatar_url"))
+
+    urls = extract_linkouts(bio).urls if bio else []
+    return (avatar_url or None), (urls[0] if urls else None)
+
+
+@dataclass
+class EnrichmentResult:
+    """
+    Precomputed network enrichment for one ceremony, keyed by URL (deduped).
+    build_evidence_graph_v2 reads from this and does no I/O of its own.
+    """
+
+    avatars: Dict[str, AvatarHashResult] = field(default_factory=dict)
+    reverse_links: Dict[str, ReverseLinkResult] = field(default_factory=dict)
+
+    def avatar(self, url: Optional[str]) -> Optional[AvatarHashResult]:
+        return self.avatars.get(url) if url else None
+
+    def reverse(self, url: Optional[str]) -> Optional[ReverseLinkResult]:
+        return self.reverse_links.get(url) if url else None
+
+    def merged(self, newer: "EnrichmentResult") -> "EnrichmentResult":
+        """
+        This result overlaid with `newer` (newer wins per URL).
+        """
+        return EnrichmentResult(
+            avatars={**self.avatars, **newer.avatars},
+            reverse_links={**self.reverse_links, **newer.reverse_links},
+        )
+
+
+async def aenrich_per_identity(
+    per_identity: Dict[str, Any],
+    *,
+    concurrency: int = 5,
+    deadline: Optional[Deadline] = None,
+) -> EnrichmentResult:
+    """
+    Gather every avatar URL and reverse-link URL across the ceremony, dedupe, and
+    fetch them concurrently (at most `concurrency` in flight). Latency tracks the
+    slowest fetch instead of the sum over identities.
+    """
+    avatar_urls: List[str] = []
+    reverse_urls: List[str] = []
+    for item in (per_identity or {}).values():
+        avatar_url, reverse_url = enrichment_urls(item or {})
+        if avatar_url and avatar_url not in avatar_urls:
+            avatar_urls.append(avatar_url)
+        if reverse_url and reverse_url not in reverse_urls:
+            reverse_urls.append(reverse_url)
+
+    sem = asyncio.Semaphore(max(1, int(concurrency or 1)))
+
+    async def _bounded(fn, *args, **kwargs):
+        async with sem:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+    results = await asyncio.gather(
+        *(_bounded(hash_avatar_url, u, deadline=deadline) for u in avatar_urls),
+        *(_bounded(fetch_outbound_links, u, deadline=deadline) for u in reverse_urls),
+    )
+
+    n = len(avatar_urls)
+    return EnrichmentResult(
+        avatars=dict(zip(avatar_urls, results[:n])),
+        reverse_links=dict(zip(reverse_urls, results[n:])),
+    )
+
+
+def enrich_per_identity(
+    per_identity: Dict[str, Any],
+    *,
+    concurrency: int = 5,
+    deadline: Optional[Deadline] = None,
+) -> EnrichmentResult:
+    """
+    Sync entry point (agent tools, direct build_evidence_graph_v2 callers).
+    """
+    return run_coro(aenrich_per_identity(per_identity, concurrency=concurrency, deadline=deadline))
+
+
+__all__ = [
+    "EnrichmentResult",
+    "aenrich_per_identity",
+    "enrich_per_identity",
+    "enrichment_urls",
+]
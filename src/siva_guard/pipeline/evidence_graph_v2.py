@@ -246,124 +246,366 @@
 # src/siva_guard/pipeline/evidence_graph_v2.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import networkx as nx
 
-from siva_guard.pipeline.identifiers import parse_claimed
-from siva_guard.pipeline.similarity import confusability
-from siva_guard.pipeline.linkout import extract_linkouts
-from siva_guard.pipeline.avatar_hash import hash_avatar_url
-from siva_guard.pipeline.reverse_links import fetch_outbound_links
-from siva_guard.pipeline.name_clean import clean_display_name
+from siva_guard.pipeline.identity_features import IdentityFeatures, build_identity_features
+from siva_guard.pipeline.similarity import similarity_matrix
+from siva_guard.pipeline.enrichment import EnrichmentResult, enrich_per_identity
+from siva_guard.pipeline.clustering import cluster_edges, cluster_metrics, cluster_summary
+from siva_guard.pipeline.blocking import (
+    BLOCKING_MIN_IDENTITIES,
+    all_pairs,
+    confusable_candidates,
+    equal_key_candidates,
+    key_join_candidates,
+)
+from siva_guard.core.deadline import Deadline
+
+
+def _candidate_pairs(feats: List[Dict[str, Any]], handles: List[str]) -> List[Tuple[int, int]]:
+    """
+    Pairs to score. Small sets: every pair. Large sets (bulk screening): only pairs that
+    can contribute to a metric -- handles that could reach the confusable threshold
+    (q-gram blocking, no false negatives), crosslink candidates (one side's bio /
+    external / reverse links name the other's domain or @handle) and shared avatars.
+    Non-candidate pairs would score handle_sim < 0.92, crosslink 0 and no avatar match,
+    so the metrics are identical either way.
+    """
+    n = len(feats)
+    if n < BLOCKING_MIN_IDENTITIES:
+        return all_pairs(n)
+
+    provides: List[List[Tuple[str, str]]] = []
+    emits: List[List[Tuple[str, str]]] = []
+    for f in feats:
+        p: List[Tuple[str, str]] = []
+        if f.get("parsed_domain"):
+            p.append(("domain", f["parsed_domain"]))
+        if f.get("parsed_handle"):
+            p.append(("handle", f["parsed_handle"].lower()))
+        provides.append(p)
+
+        e = [("domain", d) for d in (f.get("bio_link_domains") or [])]
+        e += [("domain", d) for d in (f.get("external_link_domains") or [])]
+        e += [("domain", d) for d in (f.get("reverse_link_domains") or [])]
+        e += [("handle", h) for h in (f.get("bio_link_handles") or [])]
+        emits.append(e)
+
+    pairs = confusable_candidates(handles, normalized=True)
+    pairs |= key_join_candidates(provides, emits)
+    pairs |= equal_key_candidates([f.get("avatar_sha256") for f in feats])
+    return sorted(pairs)
+
+
+class _LinkSets:
+    """
+    One node's crosslink inputs as interned IDs: its own domain / handle (None when
+    absent) and frozensets of the IDs its links name. Only domains / handles that are
+    some node's own parsed_domain / parsed_handle get an ID (nothing else can ever
+    match), so each set is no larger than the node's own link lists.
+    """
 
+    __slots__ = ("domain", "handle", "bio_domains", "external_domains", "reverse_domains", "bio_handles")
+
+    def __init__(self, domain: Optional[int], handle: Optional[int], bio_domains: FrozenSet[int],
+                 external_domains: FrozenSet[int], reverse_domains: FrozenSet[int], bio_handles: FrozenSet[int]):
+        self.domain = domain
+        self.handle = handle
+        self.bio_domains = bio_domains
+        self.external_domains = external_domains
+        self.reverse_domains = reverse_domains
+        self.bio_handles = bio_handles
+
+
+_NO_LINKS: FrozenSet[int] = frozenset()
+
+
+def _link_sets(feats_list: List[Dict[str, Any]]) -> List[_LinkSets]:
+    domain_ids: Dict[str, int] = {}
+    handle_ids: Dict[str, int] = {}
+    for f in feats_list:
+        if f.get("parsed_domain"):
+            domain_ids.setdefault(f["parsed_domain"], len(domain_ids))
+        if f.get("parsed_handle"):
+            handle_ids.setdefault(f["parsed_handle"].lower(), len(handle_ids))
+
+    def _ids(ids: Dict[str, int], values: Optional[List[str]]) -> FrozenSet[int]:
+        found = frozenset(ids[v] for v in values or () if v in ids)
+        return found or _NO_LINKS
+
+    out: List[_LinkSets] = []
+    for f in feats_list:
+        handle = f.get("parsed_handle") or ""
+        out.append(
+            _LinkSets(
+                domain=domain_ids.get(f.get("parsed_domain") or ""),
+                handle=handle_ids.get(handle.lower()) if handle else None,
+                bio_domains=_ids(domain_ids, f.get("bio_link_domains")),
+                external_domains=_ids(domain_ids, f.get("external_link_domains")),
+                reverse_domains=_ids(domain_ids, f.get("reverse_link_domains")),
+                bio_handles=_ids(handle_ids, f.get("bio_link_handles")),
+            )
+        )
+    return out
 
-def _safe_str(s: Optional[str]) -> str:
-    return (s or "").strip()
 
+def _crosslink_score(A: _LinkSets, B: _LinkSets) -> float:
+    """
+    Crosslink score (0..1) for one pair: set membership of interned IDs only.
+    """
+    score = 0.0
 
-def _domains_from_urls(urls: List[str]) -> List[str]:
-    out: List[str] = []
-    seen = set()
-    for u in urls or []:
-        try:
-            host = (urlparse(u).netloc or "").lower().strip()
-            if host and host not in seen:
-                seen.add(host)
-                out.append(host)
-        except Exception:
-            continue
-    return out
+    # direct bio-to-other domain (strong)
+    if A.domain in B.bio_domains:
+        score += 0.5
+    if B.domain in A.bio_domains:
+        score += 0.5
+
+    # external-links-to-other domain (medium)
+    if A.domain in B.external_domains:
+        score += 0.35
+    if B.domain in A.external_domains:
+        score += 0.35
+
+    # direct bio @handle mention (weaker)
+    if A.handle in B.bio_handles:
+        score += 0.25
+    if B.handle in A.bio_handles:
+        score += 0.25
+
+    # reverse website links: website links out to the other identity's domain (strong)
+    if B.domain in A.reverse_domains:
+        score += 0.5
+    if A.domain in B.reverse_domains:
+        score += 0.5
+
+    if score > 1.0:
+        score = 1.0
+
+    return score
 
 
 @dataclass
-class GraphV2Result:
-    graph: nx.Graph
-    nodes_out: List[Dict[str, Any]]
-    edges_out: List[Dict[str, Any]]
-    metrics: Dict[str, Any]
+class EdgeColumns:
+    """
+    Edges as index pairs into node_ids, one column per attribute.
+    """
+
+    src: array = field(default_factory=lambda: array("i"))
+    dst: array = field(default_factory=lambda: array("i"))
+    handle_similarity: List[Optional[float]] = field(default_factory=list)
+    name_similarity: List[Optional[float]] = field(default_factory=list)
+    avatar_match: List[Optional[bool]] = field(default_factory=list)
+    crosslink: List[bool] = field(default_factory=list)
+    crosslink_score: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.src)
+
+    def append(
+        self,
+        i: int,
+        j: int,
+        handle_similarity: Optional[float],
+        name_similarity: Optional[float],
+        avatar_match: Optional[bool],
+        crosslink: bool,
+        crosslink_score: float,
+    ) -> None:
+        self.src.append(i)
+        self.dst.append(j)
+        self.handle_similarity.append(handle_similarity)
+        self.name_similarity.append(name_similarity)
+        self.avatar_match.append(avatar_match)
+        self.crosslink.append(crosslink)
+        self.crosslink_score.append(crosslink_score)
+
+    def attrs(self, k: int) -> Dict[str, Any]:
+        return {
+            "handle_similarity": self.handle_similarity[k],
+            "name_similarity": self.name_similarity[k],
+            "avatar_match": self.avatar_match[k],
+            "crosslink": self.crosslink[k],
+            "crosslink_score": self.crosslink_score[k],
+        }
+
 
+class GraphV2Result:
+    """
+    Compact evidence graph: one feature dict per node (in node_ids order) and edges as
+    index-pair columns. nodes_out / edges_out (JSON-ready dicts) and the networkx
+    `graph` are only built when a caller asks for them. clusters holds per-cluster
+    metrics from pipeline/clustering.py.
+    """
 
-def build_evidence_graph_v2(per_identity: Dict[str, Any]) -> GraphV2Result:
+    __slots__ = ("node_ids", "node_features", "edges", "metrics", "clusters", "_graph", "_nodes_out", "_edges_out")
+
+    def __init__(
+        self,
+        node_ids: List[str],
+        node_features: List[Dict[str, Any]],
+        edges: EdgeColumns,
+        metrics: Dict[str, Any],
+        clusters: Optional[List[Dict[str, Any]]] = None,
+    ):
+        self.node_ids = node_ids
+        self.node_features = node_features
+        self.edges = edges
+        self.metrics = metrics
+        self.clusters = clusters or []
+        self._graph: Optional[nx.Graph] = None
+        self._nodes_out: Optional[List[Dict[str, Any]]] = None
+        self._edges_out: Optional[List[Dict[str, Any]]] = None
+
+    def features_by_id(self) -> Dict[str, Dict[str, Any]]:
+        return dict(zip(self.node_ids, self.node_features))
+
+    def edge_index(self) -> Dict[Tuple[str, str], int]:
+        """
+        (node_id, node_id) -> edge position, both orientations (edge attributes are symmetric).
+        """
+        out: Dict[Tuple[str, str], int] = {}
+        e = self.edges
+        for k in range(len(e)):
+            a, b = self.node_ids[e.src[k]], self.node_ids[e.dst[k]]
+            out[(a, b)] = k
+            out[(b, a)] = k
+        return out
+
+    @property
+    def nodes_out(self) -> List[Dict[str, Any]]:
+        if self._nodes_out is None:
+            out: List[Dict[str, Any]] = []
+            for nid, feats in zip(self.node_ids, self.node_features):
+                d = feats.copy()
+                d["id"] = nid
+                out.append(d)
+            self._nodes_out = out
+        return self._nodes_out
+
+    @property
+    def edges_out(self) -> List[Dict[str, Any]]:
+        if self._edges_out is None:
+            e = self.edges
+            self._edges_out = [
+                {"src": self.node_ids[e.src[k]], "dst": self.node_ids[e.dst[k]], **e.attrs(k)}
+                for k in range(len(e))
+            ]
+        return self._edges_out
+
+    @property
+    def graph(self) -> nx.Graph:
+        if self._graph is None:
+            G = nx.Graph()
+            for nid, feats in zip(self.node_ids, self.node_features):
+                G.add_node(nid, **feats)
+            e = self.edges
+            for k in range(len(e)):
+                G.add_edge(self.node_ids[e.src[k]], self.node_ids[e.dst[k]], **e.attrs(k))
+            self._graph = G
+        return self._graph
+
+
+def build_evidence_graph_v2(
+    per_identity: Dict[str, Any],
+    deadline: Optional[Deadline] = None,
+    enrichment: Optional[EnrichmentResult] = None,
+    previous: Optional[GraphV2Result] = None,
+    reuse: Optional[Set[str]] = None,
+    features: Optional[Dict[str, IdentityFeatures]] = None,
+    nodes: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> GraphV2Result:
     """
     Phase 6 evidence graph builder (v2), updated for Phase 7:
     - Adds display_name_clean (platform-aware cleaning)
     - Uses display_name_clean in name similarity
     - Incorporates PublicEvidence.external_links domains into crosslink scoring
-    """
-    G = nx.Graph()
 
-    node_ids: List[str] = []
-    node_features: Dict[str, Dict[str, Any]] = {}
+    enrichment: avatar hashes + reverse links precomputed by pipeline/enrichment.py;
+    with it the builder does no network I/O. Without it, enrichment runs first
+    (batched + concurrent) under `deadline`; skipped enrichment reports
+    avatar_hash_error / reverse_link_error = "budget_exhausted".
 
-    # ---- Nodes ----
-    for node_id, item in per_identity.items():
-        platform = item.get("platform")
-        claimed = item.get("claimed") or (item.get("claim", {}) or {}).get("claimed") or node_id
-        has_public = bool(item.get("has_public", False))
+    previous / reuse: incremental rebuild (ceremony sessions). Node ids in `reuse` are
+    unchanged since `previous` was built, so their features and the edges between
+    them are copied; only nodes outside `reuse` and their edges are computed.
 
-        # Prefer public evidence when present; otherwise fall back to UI
-        pub = item.get("public") or item.get("public_evidence") or {}
-        ui = item.get("ui") or {}
+    features: IdentityFeatures per node id from the per-identity stage (built here
+    for any node missing from it).
 
-        display_name = _safe_str(pub.get("display_name")) or _safe_str(ui.get("display_name"))
-        bio = _safe_str(pub.get("bio")) or _safe_str(ui.get("snippet"))
-        avatar_url = _safe_str(pub.get("avatar_url")) or _safe_str(ui.get("avatar_url"))
+    nodes: node features already computed for these ids (identity analysis cache,
+    pipeline/identity_cache.py); used as-is, only their edges are scored.
+    """
+    if enrichment is None:
+        enrichment = enrich_per_identity(per_identity, deadline=deadline)
 
-        # Phase 7.2: external_links from public evidence (if schema/tool supports it)
-        external_links = pub.get("external_links") or []
-        if not isinstance(external_links, list):
-            external_links = []
-        external_link_domains = _domains_from_urls([str(u) for u in external_links if u])
+    node_ids: List[str] = []
+    node_features: Dict[str, Dict[str, Any]] = {}
+    identity_features: List[IdentityFeatures] = []
 
-        # Phase 7.3: cleaned display name for comparisons
-        display_name_clean = clean_display_name(display_name, platform=str(platform or ""))
+    reuse = set(reuse or ()) if previous is not None else set()
+    prev_features = previous.features_by_id() if previous is not None else {}
 
-        # Phase 6: platform-aware parsing
-        parsed = parse_claimed(claimed, platform=platform)
+    # ---- Nodes ----
+    for node_id, item in per_identity.items():
+        f = features.get(node_id) if features else None
+        if f is None:
+            f = build_identity_features(node_id, item or {})
+        identity_features.append(f)
+
+        if node_id in reuse and node_id in prev_features:
+            node_ids.append(node_id)
+            node_features[node_id] = prev_features[node_id]
+            continue
 
-        # Bio linkouts (urls/domains/@handles)
-        linkouts = extract_linkouts(bio) if bio else extract_linkouts(None)
+        if nodes and node_id in nodes:
+            node_ids.append(node_id)
+            node_features[node_id] = dict(nodes[node_id])
+            continue
 
-        # Avatar hash (exact sha256 match only)
-        avatar_hash = hash_avatar_url(avatar_url) if avatar_url else None
+        # Avatar hash (exact sha256 match only; precomputed by the enrichment stage)
+        avatar_hash = enrichment.avatar(f.avatar_url or None)
 
         # Phase 6: reverse website links (best-effort)
         reverse_domains: List[str] = []
         reverse_error: Optional[str] = None
         reverse_cached: Optional[bool] = None
-        reverse_url: Optional[str] = None
+        reverse_url = f.reverse_link_url
 
-        if linkouts.urls:
-            reverse_url = linkouts.urls[0]  # first URL as website candidate
-            rr = fetch_outbound_links(reverse_url)
-            reverse_domains = rr.outbound_domains
-            reverse_error = rr.error
-            reverse_cached = rr.fetch_cached
+        if reverse_url:
+            rr = enrichment.reverse(reverse_url)
+            if rr is not None:
+                reverse_domains = rr.outbound_domains
+                reverse_error = rr.error
+                reverse_cached = rr.fetch_cached
+            else:
+                reverse_error = "not_enriched"
 
         feats = {
-            "platform": platform,
-            "claimed": claimed,
-            "has_public": has_public,
+            "platform": f.platform,
+            "claimed": f.claimed,
+            "has_public": f.has_public,
 
-            "display_name": display_name or None,
-            "display_name_clean": display_name_clean or None,
-            "bio": bio or None,
-            "avatar_url": avatar_url or None,
+            "display_name": f.display_name or None,
+            "display_name_clean": f.display_name_clean or None,
+            "bio": f.bio or None,
+            "avatar_url": f.avatar_url or None,
 
-            "parsed_kind": parsed.kind,
-            "parsed_domain": parsed.domain,
-            "parsed_handle": parsed.handle,
-            "norm": parsed.normalized,
+            "parsed_kind": f.parsed_kind,
+            "parsed_domain": f.parsed_domain,
+            "parsed_handle": f.parsed_handle,
+            "norm": f.norm,
 
-            "bio_link_domains": linkouts.domains,
-            "bio_link_handles": linkouts.handles,
+            "bio_link_domains": list(f.bio_link_domains),
+            "bio_link_handles": list(f.bio_link_handles),
 
             # Phase 7.2 inputs
-            "external_links": external_links,
-            "external_link_domains": external_link_domains,
+            "external_links": list(f.external_links),
+            "external_link_domains": list(f.external_link_domains),
 
             "reverse_link_url": reverse_url,
             "reverse_link_domains": reverse_domains,
@@ -372,127 +614,85 @@ def build_evidence_graph_v2(per_identity: Dict[str, Any]) -> GraphV2Result:
 
             "avatar_sha256": (avatar_hash.sha256 if avatar_hash else None),
             "avatar_hash_error": (
-                avatar_hash.error if avatar_hash else ("avatar_url_missing" if not avatar_url else None)
+                avatar_hash.error if avatar_hash else ("avatar_url_missing" if not f.avatar_url else "not_enriched")
             ),
         }
 
-        G.add_node(node_id, **feats)
         node_ids.append(node_id)
         node_features[node_id] = feats
 
     # ---- Edges (pairwise) ----
-    edges_out: List[Dict[str, Any]] = []
+    edges = EdgeColumns()
     confusable_pairs = 0
     name_mismatch_pairs = 0
     avatar_mismatch_pairs = 0
     crosslink_hits = 0
 
-    for i in range(len(node_ids)):
-        for j in range(i + 1, len(node_ids)):
-            a = node_ids[i]
-            b = node_ids[j]
-            A = node_features[a]
-            B = node_features[b]
-
+    # Skeletons come precomputed with the identity features; score handles and display
+    # names in bulk (full matrices for small sets, candidate pairs when blocking applies).
+    feats_list = [node_features[nid] for nid in node_ids]
+    handles = [f.handle_skeleton for f in identity_features]
+    names = [f.name_skeleton for f in identity_features]
+    links = _link_sets(feats_list)
+    pairs = _candidate_pairs(feats_list, handles)
+    prev_edges = previous.edge_index() if previous is not None else {}
+    todo = [(i, j) for i, j in pairs if not (
+        node_ids[i] in reuse and node_ids[j] in reuse and (node_ids[i], node_ids[j]) in prev_edges
+    )]
+    dense = len(todo) == len(node_ids) * (len(node_ids) - 1) // 2
+    handle_sims = similarity_matrix(handles, pairs=None if dense else todo, normalized=True)
+    name_sims = similarity_matrix(names, pairs=None if dense else todo, normalized=True)
+
+    for i, j in pairs:
+        a = node_ids[i]
+        b = node_ids[j]
+
+        k = prev_edges.get((a, b)) if (a in reuse and b in reuse) else None
+        if k is not None:
+            # Both identities unchanged since the previous round: reuse the scored edge.
+            handle_sim = previous.edges.handle_similarity[k]
+            name_sim = previous.edges.name_similarity[k]
+            avatar_match = previous.edges.avatar_match[k]
+            score = previous.edges.crosslink_score[k]
+        else:
             # Handle similarity (preferred)
-            handle_a = A.get("parsed_handle") or ""
-            handle_b = B.get("parsed_handle") or ""
-            ha = handle_a if handle_a else (A.get("norm") or "")
-            hb = handle_b if handle_b else (B.get("norm") or "")
-
-            handle_sim = confusability(ha, hb)["ratio"]
+            handle_sim = handle_sims.ratio(i, j)
 
             # Display name similarity (use cleaned names first)
-            dn_a = A.get("display_name_clean") or A.get("display_name") or ""
-            dn_b = B.get("display_name_clean") or B.get("display_name") or ""
-            name_sim = confusability(dn_a, dn_b)["ratio"] if (dn_a and dn_b) else None
+            name_sim = name_sims.ratio(i, j)
 
             # Avatar match (exact hash match only)
-            av_a = A.get("avatar_sha256")
-            av_b = B.get("avatar_sha256")
-            avatar_match = (av_a is not None and av_b is not None and av_a == av_b)
-
-            # ---- Crosslink scoring (0..1) ----
-            score = 0.0
-
-            da = set(A.get("bio_link_domains") or [])
-            db = set(B.get("bio_link_domains") or [])
-            ea = set(A.get("external_link_domains") or [])
-            eb = set(B.get("external_link_domains") or [])
-
-            dom_a = A.get("parsed_domain")
-            dom_b = B.get("parsed_domain")
-
-            # direct bio-to-other domain (strong)
-            if dom_a and dom_a in db:
-                score += 0.5
-            if dom_b and dom_b in da:
-                score += 0.5
-
-            # external-links-to-other domain (medium)
-            if dom_a and dom_a in eb:
-                score += 0.35
-            if dom_b and dom_b in ea:
-                score += 0.35
-
-            # direct bio @handle mention (weaker)
-            ha_set = set(A.get("bio_link_handles") or [])
-            hb_set = set(B.get("bio_link_handles") or [])
-            ha_l = handle_a.lower() if handle_a else ""
-            hb_l = handle_b.lower() if handle_b else ""
-
-            if ha_l and ha_l in hb_set:
-                score += 0.25
-            if hb_l and hb_l in ha_set:
-                score += 0.25
-
-            # reverse website links: website links out to the other identity's domain (strong)
-            ra = set(A.get("reverse_link_domains") or [])
-            rb = set(B.get("reverse_link_domains") or [])
-            if dom_b and dom_b in ra:
-                score += 0.5
-            if dom_a and dom_a in rb:
-                score += 0.5
-
-            if score > 1.0:
-                score = 1.0
-
-            crosslink = score >= 0.5
-            if crosslink:
-                crosslink_hits += 1
-
-            # thresholds (deterministic constants)
-            confusable = handle_sim >= 0.92
-            if confusable:
-                confusable_pairs += 1
-
-            if name_sim is not None and name_sim < 0.60 and confusable:
-                name_mismatch_pairs += 1
-
-            if (av_a is not None and av_b is not None) and (not avatar_match) and confusable:
-                avatar_mismatch_pairs += 1
-
-            G.add_edge(
-                a,
-                b,
-                handle_similarity=handle_sim,
-                name_similarity=name_sim,
-                avatar_match=(avatar_match if (av_a is not None and av_b is not None) else None),
-                crosslink=crosslink,
-                crosslink_score=score,
-            )
-
-            edges_out.append(
-                {
-                    "src": a,
-                    "dst": b,
-                    "handle_similarity": handle_sim,
-                    "name_similarity": name_sim,
-                    "avatar_match": (avatar_match if (av_a is not None and av_b is not None) else None),
-                    "crosslink": crosslink,
-                    "crosslink_score": score,
-                }
-            )
+            av_a = node_features[a].get("avatar_sha256")
+            av_b = node_features[b].get("avatar_sha256")
+            avatar_match = (av_a == av_b) if (av_a is not None and av_b is not None) else None
+
+            score = _crosslink_score(links[i], links[j])
+
+        crosslink = score >= 0.5
+        if crosslink:
+            crosslink_hits += 1
+
+        # thresholds (deterministic constants)
+        # No ratio when a handle skeleton is empty (e.g. only invisible characters).
+        confusable = handle_sim is not None and handle_sim >= 0.92
+        if confusable:
+            confusable_pairs += 1
+
+        if name_sim is not None and name_sim < 0.60 and confusable:
+            name_mismatch_pairs += 1
+
+        if avatar_match is False and confusable:
+            avatar_mismatch_pairs += 1
+
+        edges.append(
+            i,
+            j,
+            handle_similarity=handle_sim,
+            name_similarity=name_sim,
+            avatar_match=avatar_match,
+            crosslink=crosslink,
+            crosslink_score=score,
+        )
 
     # ---- Metrics ----
     total = len(node_ids) if node_ids else 1
@@ -507,11 +707,22 @@ def build_evidence_graph_v2(per_identity: Dict[str, Any]) -> GraphV2Result:
         "crosslink_hits": crosslink_hits,
     }
 
-    # output nodes
-    nodes_out: List[Dict[str, Any]] = []
-    for nid in node_ids:
-        d = node_features[nid].copy()
-        d["id"] = nid
-        nodes_out.append(d)
-
-    return GraphV2Result(graph=G, nodes_out=nodes_out, edges_out=edges_out, metrics=metrics)
+    # ---- Clusters (union-find over crosslink / avatar-match edges) ----
+    feats_out = [node_features[nid] for nid in node_ids]
+    clusters = cluster_edges(
+        len(node_ids),
+        edges.src,
+        edges.dst,
+        edges.crosslink,
+        edges.avatar_match,
+        edges.handle_similarity,
+    )
+    metrics.update(cluster_metrics(clusters))
+
+    return GraphV2Result(
+        node_ids=node_ids,
+        node_features=feats_out,
+        edges=edges,
+        metrics=metrics,
+        clusters=cluster_summary(clusters, node_ids, feats_out),
+    )
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from siva_guard.pipeline.identity_features import IdentityFeatures, norm_platform
+from siva_guard.pipeline.similarity import normalize_identifier
+from siva_guard.pipeline.single_identity_risk import SingleIdentityRisk
+
+# Popular identities recur across ceremonies: their per-identity analysis (parsed claim,
+# cleaned name, linkouts, avatar hash, reverse links, single-identity risk) is kept for
+# IDENTITY_CACHE_TTL_S, in line with the profile fetch TTLs (connectors/fetch_policy.py).
+IDENTITY_CACHE_TTL_S = 15 * 60
+IDENTITY_CACHE_MAX_ENTRIES = 8192
+
+# Enrichment outcomes that say nothing about the identity itself; not cached.
+_TRANSIENT_ERRORS = ("budget_exhausted", "not_enriched")
+
+AnalysisKey = Tuple[str, str, str]  # (platform, normalized handle, evidence hash)
+
+
+def evidence_hash(item: Dict[str, Any]) -> str:
+    """
+    sha256 of the evidence a per_identity item is analysed from (claim, UI card,
+    public evidence); collection mode and errors are not part of it.
+    """
+    content = {
+        "platform": item.get("platform"),
+        "claimed": item.get("claimed"),
+        "has_public": bool(item.get("has_public", False)),
+        "ui": item.get("ui"),
+        "public": item.get("public") or item.get("public_evidence"),
+    }
+    data = json.dumps(content, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def analysis_key(key: str, item: Dict[str, Any]) -> AnalysisKey:
+    claimed = item.get("claimed") or key
+    return (norm_platform(item.get("platform")), normalize_identifier(str(claimed)), evidence_hash(item))
+
+
+def cacheable(node: Dict[str, Any]) -> bool:
+    """
+    False when the node's avatar hash / reverse links were cut short by the ceremony
+    budget or never enriched: the next ceremony should try again.
+    """
+    for k in ("avatar_hash_error", "reverse_link_error"):
+        err = str(node.get(k) or "")
+        if any(err.startswith(t) for t in _TRANSIENT_ERRORS):
+            return False
+    return True
+
+
+@dataclass
+class IdentityAnalysis:
+    """
+    Everything computed for one identity that does not depend on the rest of the
+    ceremony: the feature record, the evidence_graph_v2 node features and the
+    single-identity risk.
+    """
+
+    features: IdentityFeatures
+    node: Dict[str, Any]
+    risk: SingleIdentityRisk
+    expires_at: float = field(default=0.0, repr=False)
+
+
+class IdentityAnalysisCache:
+    """
+    Bounded in-process LRU of identity analyses with a TTL.
+    """
+
+    def __init__(self, max_entries: int = IDENTITY_CACHE_MAX_ENTRIES, ttl_s: float = IDENTITY_CACHE_TTL_S) -> None:
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[AnalysisKey, IdentityAnalysis]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: AnalysisKey) -> Optional[IdentityAnalysis]:
+        now = time.monotonic()
+        with self._lock:
+            a = self._entries.get(key)
+            if a is not None and a.expires_at <= now:
+                del self._entries[key]
+                a = None
+            if a is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return a
+
+    def put(self, key: AnalysisKey, features: IdentityFeatures, node: Dict[str, Any], risk: SingleIdentityRisk) -> bool:
+        """
+        Store one analysis (deep copies of `node` and the risk reasons, so the storing
+        ceremony's later edits don't reach other ceremonies); skipped when not cacheable().
+        """
+        if not cacheable(node):
+            return False
+        a = IdentityAnalysis(
+            features=features,
+            node=copy.deepcopy(node),
+            risk=SingleIdentityRisk(risk.authenticity_risk, copy.deepcopy(risk.reasons)),
+            expires_at=time.monotonic() + self.ttl_s,
+        )
+        with self._lock:
+            self._entries[key] = a
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+IDENTITY_CACHE = IdentityAnalysisCache()
+
+
+def get_identity_cache() -> IdentityAnalysisCache:
+    return IDENTITY_CACHE
+
+
+__all__ = [
+    "IDENTITY_CACHE_MAX_ENTRIES",
+    "IDENTITY_CACHE_TTL_S",
+    "IdentityAnalysis",
+    "IdentityAnalysisCache",
+    "analysis_key",
+    "cacheable",
+    "evidence_hash",
+    "get_identity_cache",
+]
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from siva_guard.pipeline.identifiers import parse_claimed
+from siva_guard.pipeline.linkout import extract_linkouts
+from siva_guard.pipeline.name_clean import clean_display_name
+from siva_guard.pipeline.similarity import normalize_identifier
+
+
+def _safe_str(s: Optional[str]) -> str:
+    return (s or "").strip()
+
+
+def _domains_from_urls(urls: List[str]) -> List[str]:
+    out: List[str] = []
+    seen = set()
+    for u in urls or []:
+        try:
+            host = (urlparse(u).netloc or "").lower().strip()
+            if host and host not in seen:
+                seen.add(host)
+                out.append(host)
+        except Exception:
+            continue
+    return out
+
+
+def norm_platform(p: Any) -> str:
+    """
+    Platform keyword from 'Platform.FACEBOOK' / 'facebook' / 'twitter' style values.
+    """
+    s = str(p or "").lower()
+    if "facebook" in s:
+        return "facebook"
+    if "instagram" in s:
+        return "instagram"
+    if "linkedin" in s:
+        return "linkedin"
+    if "github" in s:
+        return "github"
+    if "tiktok" in s:
+        return "tiktok"
+    if "youtube" in s:
+        return "youtube"
+    if s in ("x", "twitter") or "twitter" in s:
+        return "x"
+    return s
+
+
+@dataclass(frozen=True, slots=True)
+class IdentityFeatures:
+    """
+    Everything the scorers derive from one per_identity item, computed once in the
+    per-identity stage: public evidence first, UI card as fallback (also for a
+    whitespace-only public field); parsed claim; bio linkouts; confusable skeletons.
+    Read by the baseline judge, the graph builder and the risk scorers instead of
+    re-digging the raw dicts.
+    """
+
+    key: str
+    platform: Optional[str]
+    platform_kind: str
+    claimed: str
+    has_public: bool
+
+    display_name: str
+    display_name_clean: str
+    bio: str
+    avatar_url: str
+
+    parsed_kind: str
+    parsed_domain: Optional[str]
+    parsed_handle: Optional[str]
+    norm: str
+
+    bio_link_urls: Tuple[str, ...]
+    bio_link_domains: Tuple[str, ...]
+    bio_link_handles: Tuple[str, ...]
+    external_links: Tuple[Any, ...]
+    external_link_domains: Tuple[str, ...]
+
+    # normalize_identifier() skeletons, ready for similarity_matrix(normalized=True)
+    claimed_skeleton: str
+    handle_skeleton: str
+    name_skeleton: str
+
+    @property
+    def reverse_link_url(self) -> Optional[str]:
+        # first bio URL is the website candidate for reverse-link checks
+        return self.bio_link_urls[0] if self.bio_link_urls else None
+
+
+def build_identity_features(key: str, item: Dict[str, Any]) -> IdentityFeatures:
+    platform = item.get("platform")
+    claimed = item.get("claimed") or (item.get("claim", {}) or {}).get("claimed") or key
+
+    # Prefer public evidence when present; otherwise fall back to UI
+    pub = item.get("public") or item.get("public_evidence") or {}
+    ui = item.get("ui") or {}
+
+    display_name = _safe_str(pub.get("display_name")) or _safe_str(ui.get("display_name"))
+    bio = _safe_str(pub.get("bio")) or _safe_str(ui.get("snippet"))
+    avatar_url = _safe_str(pub.get("avatar_url")) or _safe_str(ui.get("avatar_url"))
+
+    # Phase 7.2: external_links from public evidence (if schema/tool supports it)
+    external_links = pub.get("external_links") or []
+    if not isinstance(external_links, list):
+        external_links = []
+    external_link_domains = _domains_from_urls([str(u) for u in external_links if u])
+
+    # Phase 7.3: cleaned display name for comparisons
+    display_name_clean = clean_display_name(display_name, platform=str(platform or ""))
+
+    # Phase 6: platform-aware parsing
+    parsed = parse_claimed(claimed, platform=platform)
+
+    # Bio linkouts (urls/domains/@handles)
+    linkouts = extract_linkouts(bio) if bio else extract_linkouts(None)
+
+    handle = parsed.handle or parsed.normalized or ""
+    name = display_name_clean or display_name
+
+    return IdentityFeatures(
+        key=key,
+        platform=platform,
+        platform_kind=norm_platform(platform),
+        claimed=claimed,
+        has_public=bool(item.get("has_public", False)),
+        display_name=display_name,
+        display_name_clean=display_name_clean,
+        bio=bio,
+        avatar_url=avatar_url,
+        parsed_kind=parsed.kind,
+        parsed_domain=parsed.domain,
+        parsed_handle=parsed.handle,
+        norm=parsed.normalized,
+        bio_link_urls=tuple(linkouts.urls),
+        bio_link_domains=tuple(linkouts.domains),
+        bio_link_handles=tuple(linkouts.handles),
+        external_links=tuple(external_links),
+        external_link_domains=tuple(external_link_domains),
+        claimed_skeleton=normalize_identifier(claimed),
+        handle_skeleton=normalize_identifier(handle),
+        name_skeleton=normalize_identifier(name),
+    )
+
+
+def build_features(per_identity: Dict[str, Any]) -> Dict[str, IdentityFeatures]:
+    return {k: build_identity_features(k, item or {}) for k, item in (per_identity or {}).items()}
+
+
+__all__ = [
+    "IdentityFeatures",
+    "build_features",
+    "build_identity_features",
+    "norm_platform",
+]
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from siva_guard.pipeline.identity_features import norm_platform
+from siva_guard.pipeline.similarity import normalize_identifier
+
+# Distinct *other* ceremonies (none of whose subjects is in the current ceremony) before
+# a key counts as reused. External link domains are shared by unrelated people far more
+# often (link hubs, employers), so they need more corroboration.
+REUSE_MIN_CEREMONIES: Dict[str, int] = {
+    "avatar": 3,
+    "handle": 3,
+    "domain": 3,
+    "ext_domain": 10,
+}
+
+# Per key, only the most recent ceremonies are kept: lookups stay O(1) and memory bounded.
+MAX_CEREMONIES_PER_KEY = 256
+
+# A value presented under more distinct subjects than this (platform default avatars,
+# placeholder images, shared hosting domains) identifies nobody and is never flagged.
+MAX_SUBJECTS_PER_KEY = 32
+
+# Ceremonies older than REUSE_WINDOW_S no longer count and are swept out every
+# SWEEP_EVERY records; beyond MAX_KEYS the least recently seen keys are dropped.
+REUSE_WINDOW_S = 30 * 24 * 3600
+MAX_KEYS = 500_000
+SWEEP_EVERY = 1024
+
+# The JSONL log is rewritten from the live state once it holds more than
+# COMPACT_FACTOR lines per live ceremony (and at least COMPACT_MIN_LINES).
+COMPACT_FACTOR = 2
+COMPACT_MIN_LINES = 10_000
+
+# Hosts of profile platforms and link hubs: a URL claim on them says nothing about who
+# owns the site, so only personal-site domains get a "domain" key.
+PLATFORM_HOSTS = frozenset(
+    {
+        "facebook.com",
+        "fb.com",
+        "instagram.com",
+        "x.com",
+        "twitter.com",
+        "github.com",
+        "linkedin.com",
+        "tiktok.com",
+        "youtube.com",
+        "youtu.be",
+        "snapchat.com",
+        "threads.net",
+        "t.me",
+        "discord.com",
+        "discord.gg",
+        "medium.com",
+        "linktr.ee",
+    }
+)
+_PLATFORM_KINDS = frozenset({"facebook", "instagram", "linkedin", "github", "tiktok", "youtube", "x"})
+
+Key = Tuple[str, str]  # (kind, value)
+
+
+def _subject(feats: Dict[str, Any]) -> str:
+    """
+    Who the features belong to: the same person re-verifying (same handle, any
+    platform) is not reuse; a different handle presenting the same avatar is.
+    """
+    return str(feats.get("parsed_handle") or feats.get("norm") or feats.get("claimed") or "").lower()
+
+
+def _personal_domain(feats: Dict[str, Any]) -> Optional[str]:
+    """
+    parsed_domain of a personal-site claim (Platform.WEBSITE or any host that is not a
+    known platform), else None.
+    """
+    domain = str(feats.get("parsed_domain") or "").lower().split(":", 1)[0].rstrip(".")
+    if not domain:
+        return None
+    if norm_platform(feats.get("platform")).rsplit(".", 1)[-1] in _PLATFORM_KINDS:
+        return None
+    host = domain[4:] if domain.startswith("www.") else domain
+    if any(host == h or host.endswith("." + h) for h in PLATFORM_HOSTS):
+        return None
+    return host
+
+
+def identity_keys(feats: Dict[str, Any]) -> List[Key]:
+    """
+    Index keys for one evidence_graph_v2 node.
+    """
+    keys: List[Key] = []
+    if feats.get("avatar_sha256"):
+        keys.append(("avatar", str(feats["avatar_sha256"])))
+    if feats.get("parsed_handle"):
+        # Homoglyph-folded, so near-identical handles (0ctocat / octocat) share a key.
+        keys.append(("handle", normalize_identifier(feats["parsed_handle"])))
+    domain = _personal_domain(feats)
+    if domain:
+        keys.append(("domain", domain))
+    for d in feats.get("external_link_domains") or []:
+        keys.append(("ext_domain", str(d).lower()))
+    return keys
+
+
+class IdentityIndex:
+    """
+    Cross-ceremony inverted index: key -> {ceremony_id: subjects}, plus each ceremony's
+    full subject set (a ceremony sharing any subject with the current one is the same
+    person again, e.g. github jane + x janedoe re-verifying with one avatar).
+
+    Append-only JSONL log (one line per recorded ceremony) when `path` is set;
+    replayed on start-up and tailed on every record(), so several workers sharing
+    the file see each other's ceremonies. Without a path it is process-local.
+
+    Bounded: ceremonies expire after `window_s`, keys are LRU-capped at `max_keys`, and
+    the log is compacted (rewritten and atomically replaced) once mostly dead. A worker
+    that sees the file replaced reloads it; lines another worker appends to the old
+    file while it is being compacted are lost, which only delays a reuse flag.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_per_key: int = MAX_CEREMONIES_PER_KEY,
+        max_keys: int = MAX_KEYS,
+        window_s: float = REUSE_WINDOW_S,
+        max_subjects: int = MAX_SUBJECTS_PER_KEY,
+    ):
+        self.path = path
+        self.max_per_key = max_per_key
+        self.max_subjects = max_subjects
+        self.max_keys = max_keys
+        self.window_s = window_s
+        self._lock = threading.Lock()
+        self._reset()
+        if path:
+            self._tail()
+
+    # ---- storage ----
+
+    def _reset(self) -> None:
+        self._keys: "OrderedDict[Key, OrderedDict[str, Set[str]]]" = OrderedDict()
+        self._seen: Dict[str, float] = {}  # ceremony_id -> record time (epoch seconds)
+        self._subjects: Dict[str, Set[str]] = {}  # ceremony_id -> subjects
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._lines = 0
+        self._records = 0
+        self.ceremonies = 0
+
+    def _add(self, ceremony_id: str, entries: Iterable[Tuple[str, str, str]], t: float) -> None:
+        self._seen[ceremony_id] = max(t, self._seen.get(ceremony_id, t))
+        ceremony_subjects = self._subjects.setdefault(ceremony_id, set())
+        for kind, value, subject in entries:
+            ceremony_subjects.add(subject)
+            key = (kind, value)
+            by_ceremony = self._keys.get(key)
+            if by_ceremony is None:
+                by_ceremony = self._keys[key] = OrderedDict()
+            else:
+                self._keys.move_to_end(key)
+            subjects = by_ceremony.get(ceremony_id)
+            if subjects is None:
+                subjects = by_ceremony[ceremony_id] = set()
+                if len(by_ceremony) > self.max_per_key:
+                    by_ceremony.popitem(last=False)
+            subjects.add(subject)
+        while len(self._keys) > self.max_keys:
+            self._keys.popitem(last=False)
+        self.ceremonies += 1
+
+    def _live(self, ceremony_id: str, now: float) -> bool:
+        t = self._seen.get(ceremony_id)
+        return t is not None and now - t <= self.window_s
+
+    def _sweep(self, now: float) -> None:
+        # Drop expired ceremonies, keys left without any ceremony, and ceremonies no
+        # key refers to any more (evicted by the per-key / max_keys caps).
+        expired = {cid for cid in self._seen if not self._live(cid, now)}
+        referenced: Set[str] = set()
+        for key in list(self._keys):
+            by_ceremony = self._keys[key]
+            for cid in expired.intersection(by_ceremony):
+                del by_ceremony[cid]
+            if by_ceremony:
+                referenced.update(by_ceremony)
+            else:
+                del self._keys[key]
+        self._seen = {cid: t for cid, t in self._seen.items() if cid in referenced}
+        self._subjects = {cid: s for cid, s in self._subjects.items() if cid in referenced}
+
+    def _tail(self) -> None:
+        if not self.path:
+            return
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return
+        if self._inode is not None and (st.st_ino != self._inode or st.st_size < self._offset):
+            self._reset()  # compacted by another worker: reload
+        self._inode = st.st_ino
+        with open(self.path, "r", encoding="utf-8") as f:
+            f.seek(self._offset)
+            for line in f:
+                if not line.endswith("\n"):
+                    break  # partial write from another process; pick it up next time
+                self._offset += len(line.encode("utf-8"))
+                self._lines += 1
+                try:
+                    rec = json.loads(line)
+                    self._add(str(rec["c"]), [tuple(e) for e in rec.get("k") or []], float(rec.get("t") or time.time()))
+                except Exception:
+                    continue
+
+    def _compact(self) -> None:
+        # One line per live ceremony, rebuilt from the in-memory state.
+        per_ceremony: Dict[str, List[Tuple[str, str, str]]] = {}
+        for (kind, value), by_ceremony in self._keys.items():
+            for cid, subjects in by_ceremony.items():
+                per_ceremony.setdefault(cid, []).extend((kind, value, s) for s in sorted(subjects))
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for cid, entries in per_ceremony.items():
+                f.write(json.dumps({"c": cid, "t": self._seen.get(cid, 0.0), "k": entries}) + "\n")
+        os.replace(tmp, self.path)
+        st = os.stat(self.path)
+        self._inode, self._offset, self._lines = st.st_ino, st.st_size, len(per_ceremony)
+
+    def compact(self) -> None:
+        """
+        Sweep expired ceremonies and rewrite the log from what is left.
+        """
+        with self._lock:
+            self._tail()
+            self._sweep(time.time())
+            if self.path:
+                self._compact()
+
+    def record(self, ceremony_id: str, node_features: Iterable[Dict[str, Any]]) -> None:
+        """
+        Add one ceremony's identities (evidence_graph_v2 node features).
+        """
+        entries = [(kind, value, _subject(f)) for f in node_features for kind, value in identity_keys(f)]
+        if not entries:
+            return
+        now = round(time.time(), 3)
+        with self._lock:
+            if self.path:
+                self._tail()
+                line = json.dumps({"c": ceremony_id, "t": now, "k": entries}) + "\n"
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
+                self._offset += len(line.encode("utf-8"))
+                self._lines += 1
+            self._add(ceremony_id, entries, now)
+            self._records += 1
+            if self._records % SWEEP_EVERY == 0:
+                self._sweep(now)
+                if self.path and self._lines > max(COMPACT_MIN_LINES, COMPACT_FACTOR * len(self._seen)):
+                    self._compact()
+
+    # ---- lookups ----
+
+    def reuse_count(self, key: Key, subjects: Set[str], ceremony_id: Optional[str]) -> int:
+        """
+        Other live ceremonies in which `key` appeared, counting only those that share no
+        subject with `subjects` (the current ceremony's). 0 for high-fan-out values.
+        """
+        by_ceremony = self._keys.get(key)
+        if not by_ceremony:
+            return 0
+        distinct: Set[str] = set()
+        for key_subjects in by_ceremony.values():
+            distinct.update(key_subjects)
+        if len(distinct) > self.max_subjects:
+            return 0
+        now = time.time()
+        n = 0
+        for cid in by_ceremony:
+            if cid != ceremony_id and self._live(cid, now) and self._subjects.get(cid, set()).isdisjoint(subjects):
+                n += 1
+        return n
+
+    def lookup(self, node_ids: List[str], node_features: List[Dict[str, Any]], ceremony_id: Optional[str]) -> Dict[str, Any]:
+        """
+        cross_ceremony_reuse signal for compute_risk_v2:
+          identities: node_id -> {kind: max other-ceremony count}
+          flagged:    [{id, kind, value, ceremonies}] at or above REUSE_MIN_CEREMONIES
+        """
+        identities: Dict[str, Dict[str, int]] = {}
+        flagged: List[Dict[str, Any]] = []
+        subjects = {_subject(f) for f in node_features} - {""}
+        for nid, f in zip(node_ids, node_features):
+            counts: Dict[str, int] = {}
+            for kind, value in identity_keys(f):
+                n = self.reuse_count((kind, value), subjects, ceremony_id)
+                if n <= 0:
+                    continue
+                counts[kind] = max(counts.get(kind, 0), n)
+                if n >= REUSE_MIN_CEREMONIES.get(kind, 3):
+                    flagged.append({"id": nid, "kind": kind, "value": value, "ceremonies": n})
+            if counts:
+                identities[nid] = counts
+        return {
+            "identities": identities,
+            "flagged": flagged,
+            "max_ceremonies": max((x["ceremonies"] for x in flagged), default=0),
+        }
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def _index_from_env(value: Optional[str]) -> Optional[IdentityIndex]:
+    # Opt-in: unset / empty = off, "memory" = process-local, anything else = JSONL path.
+    value = (value or "").strip()
+    if not value:
+        return None
+    return IdentityIndex(None if value.lower() == "memory" else value)
+
+
+IDENTITY_INDEX = _index_from_env(os.getenv("SIVA_IDENTITY_INDEX"))
+
+
+def get_identity_index() -> Optional[IdentityIndex]:
+    """
+    The shared index, or None when cross-ceremony reuse is off (SIVA_IDENTITY_INDEX unset).
+    """
+    return IDENTITY_INDEX
+
+
+__all__ = [
+    "IdentityIndex",
+    "MAX_CEREMONIES_PER_KEY",
+    "MAX_KEYS",
+    "MAX_SUBJECTS_PER_KEY",
+    "PLATFORM_HOSTS",
+    "REUSE_MIN_CEREMONIES",
+    "REUSE_WINDOW_S",
+    "get_identity_index",
+    "identity_keys",
+]
@@ -1,27 +1,98 @@
 from __future__ import annotations
 
-from typing import List, Dict
+from typing import Any, List, Dict, Optional, Tuple
 from siva_guard.core.schema import IdentityEvidence, RiskResult, RiskReason
-from siva_guard.pipeline.similarity import confusability
+from siva_guard.pipeline.identity_features import IdentityFeatures
+from siva_guard.pipeline.similarity import (
+    CONFUSABLE_LEV,
+    CONFUSABLE_RATIO,
+    confusable_pairs,
+    is_confusable,
+    normalize_identifier,
+)
+from siva_guard.pipeline.blocking import BLOCKING_MIN_IDENTITIES, all_pairs, confusable_candidates
 
 
+def _pairs_from_graph(
+    ids: List[str],
+    skeletons: List[str],
+    features: Dict[str, IdentityFeatures],
+    graph: Any,
+    pairs: Optional[List[Tuple[int, int]]],
+) -> List[Tuple[int, int]]:
+    """
+    Confusable claimed-identifier pairs, reusing the evidence graph's handle scores.
 
-def judge_identity_set(evidences: List[IdentityEvidence]) -> RiskResult:
+    Where a claimed identifier is its own handle (same skeleton), the graph edge's
+    handle_similarity is exactly the judge's ratio, and the graph's blocking has no
+    false negatives at the confusable threshold: only its edges at or above it need an
+    edit distance. Pairs involving URL-style claims are scored here as usual.
+    """
+    own = [c in features and features[c].handle_skeleton == skeletons[k] for k, c in enumerate(ids)]
+
+    hits: List[Tuple[int, int]] = []
+    edges = graph.edges
+    for k, sim in enumerate(edges.handle_similarity):
+        i, j = edges.src[k], edges.dst[k]
+        if own[i] and own[j] and sim is not None and sim >= CONFUSABLE_RATIO:
+            if is_confusable(skeletons[i], skeletons[j], normalized=True):
+                hits.append((i, j))
+
+    rest = [(i, j) for i, j in (pairs if pairs is not None else all_pairs(len(ids))) if not (own[i] and own[j])]
+    if rest:
+        hits.extend((i, j) for i, j, _, _ in confusable_pairs(skeletons, pairs=rest, normalized=True))
+    return sorted(hits)
+
+
+def judge_identity_set(
+    evidences: List[IdentityEvidence],
+    features: Optional[Dict[str, IdentityFeatures]] = None,
+    graph: Any = None,
+) -> RiskResult:
+    """
+    Baseline (v0) substitution judge over the claimed identifiers.
+
+    features / graph: IdentityFeatures and the GraphV2Result of the same ceremony;
+    with both, confusable pairs come from the graph's handle similarities instead of a
+    second pairwise pass.
+    """
     reasons: List[RiskReason] = []
     per_identity: Dict[str, dict] = {}
 
     ids = [e.claim.claimed for e in evidences]
     n = len(ids)
 
-    for i in range(n):
-        for j in range(i + 1, n):
-            c = confusability(ids[i], ids[j])
-            if c["ratio"] is not None and c["ratio"] >= 0.92 and (c["lev"] is not None and c["lev"] <= 2):
-                reasons.append(RiskReason(
-                    code="IDENTIFIERS_CONFUSABLE",
-                    severity="high",
-                    message=f"Two claimed identifiers are extremely similar: '{ids[i]}' and '{ids[j]}'."
-                ))
+    # Claimed-identifier skeletons from the per-identity stage when available.
+    features = features or {}
+    skeletons = [
+        features[c].claimed_skeleton if c in features else normalize_identifier(c)
+        for c in ids
+    ]
+
+    # Large sets: only score pairs the q-gram index says could reach the threshold.
+    pairs = sorted(confusable_candidates(skeletons, normalized=True)) if n >= BLOCKING_MIN_IDENTITIES else None
+
+    if graph is not None and features and list(graph.node_ids) == ids:
+        hits = _pairs_from_graph(ids, skeletons, features, graph, pairs)
+    else:
+        # Threshold-aware: only pairs that can clear both cutoffs get a full score.
+        hits = [
+            (i, j)
+            for i, j, _, _ in confusable_pairs(
+                skeletons,
+                pairs=pairs,
+                score_cutoff=CONFUSABLE_RATIO,
+                lev_cutoff=CONFUSABLE_LEV,
+                normalized=True,
+            )
+        ]
+
+    for i, j in hits:
+        reasons.append(RiskReason(
+            code="IDENTIFIERS_CONFUSABLE",
+            severity="high",
+            message=f"Two claimed identifiers are extremely similar: '{ids[i]}' and '{ids[j]}'."
+        ))
 
     missing_public = sum(1 for e in evidences if e.public is None)
     if missing_public == n:
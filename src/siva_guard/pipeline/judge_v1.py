@@ -2,6 +2,14 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Tuple
 
+from siva_guard.pipeline.scoring_weights import (
+    FAKE_HIGH_RISK,
+    FAKE_MEDIUM_RISK,
+    MIN_IDENTITIES_FOR_SUBSTITUTION,
+    MIN_PUBLIC_COVERAGE,
+    WEAK_EVIDENCE_CODES,
+)
+
 
 def _get(d: Dict[str, Any], key: str, default=None):
     return d.get(key, default) if isinstance(d, dict) else default
@@ -95,9 +103,9 @@ def judge_v1(siva_output: Dict[str, Any]) -> Dict[str, Any]:
             "weak_evidence_alone_is_not_fake": True,
         },
         "criteria": {
-            "min_identities_for_substitution": 2,
-            "min_public_coverage": 0.50,
-            "fake_overall_risk_threshold": 0.70,
+            "min_identities_for_substitution": MIN_IDENTITIES_FOR_SUBSTITUTION,
+            "min_public_coverage": MIN_PUBLIC_COVERAGE,
+            "fake_overall_risk_threshold": FAKE_HIGH_RISK,
             "fake_requires_confusable_pairs": True,
             "fake_requires_any_contradiction_signal": [
                 "name_mismatch_pairs>0",
@@ -117,19 +125,19 @@ def judge_v1(siva_output: Dict[str, Any]) -> Dict[str, Any]:
     contradiction = (name_mismatch_pairs > 0) or (avatar_mismatch_pairs > 0) or (crosslink_hits == 0)
 
     fake_high = (
-        num_identities >= 2
-        and public_coverage >= 0.50
+        num_identities >= MIN_IDENTITIES_FOR_SUBSTITUTION
+        and public_coverage >= MIN_PUBLIC_COVERAGE
         and confusable_pairs > 0
         and contradiction
-        and overall_risk >= 0.70
+        and overall_risk >= FAKE_HIGH_RISK
     )
 
     fake_medium = (
-        num_identities >= 2
-        and public_coverage >= 0.50
+        num_identities >= MIN_IDENTITIES_FOR_SUBSTITUTION
+        and public_coverage >= MIN_PUBLIC_COVERAGE
         and confusable_pairs > 0
         and contradiction
-        and overall_risk >= 0.55
+        and overall_risk >= FAKE_MEDIUM_RISK
     )
 
     # If single identity, do NOT call fake based solely on generic/weak evidence.
@@ -145,8 +153,8 @@ def judge_v1(siva_output: Dict[str, Any]) -> Dict[str, Any]:
     else:
         verdict = "REAL"
         # If evidence is weak/non-informative or SIVA escalates, abstain.
-        weak_evidence = ("generic_platform_bio" in reason_codes) or ("no_bio_linkouts" in reason_codes)
-        if agent_action in ("WARN", "REQUEST_STRONGER_PROOF") or weak_evidence or public_coverage < 0.50:
+        weak_evidence = any(code in reason_codes for code in WEAK_EVIDENCE_CODES)
+        if agent_action in ("WARN", "REQUEST_STRONGER_PROOF") or weak_evidence or public_coverage < MIN_PUBLIC_COVERAGE:
             certainty = "LOW"
             abstained = True
         else:
@@ -3,6 +3,8 @@ from __future__ import annotations
 import re
 from typing import Optional
 
+from siva_guard.pipeline.patterns import get_pattern_pack
+
 _PLATFORM_TOKENS = {
     "facebook": ["facebook"],
     "instagram": ["instagram"],
@@ -11,7 +13,8 @@ _PLATFORM_TOKENS = {
     "linkedin": ["linkedin"],
 }
 
-_SPLIT_MARKERS = ["|", "•", "-", "—", "–", "·", ":", "(", "["]
+# Template markers (pattern pack): the name is cut at the first one.
+_SPLIT_MARKERS = list(get_pattern_pack().name_split_markers)
 
 
 def clean_display_name(raw: Optional[str], *, platform: str) -> str:
@@ -28,9 +31,9 @@ def clean_display_name(raw: Optional[str], *, platform: str) -> str:
     s = re.sub(r"\s+", " ", s)
 
     # Split on common template markers; keep the first chunk (deterministic)
-    for m in _SPLIT_MARKERS:
-        if m in s:
-            s = s.split(m, 1)[0].strip()
+    hit = get_pattern_pack().split_marker_matcher.leftmost(s)
+    if hit is not None:
+        s = s[: hit[0]].strip()
 
     # Remove trailing platform token if present
     tokens = _PLATFORM_TOKENS.get((platform or "").lower(), [])
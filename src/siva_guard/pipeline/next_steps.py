@@ -12,6 +12,21 @@ class NextStep:
     priority: int  # lower is higher priority
 
 
+# Steps asking the person to edit a public profile (bio / links) and re-run: the follow-up
+# round must fetch the profiles again instead of reusing the previous evidence.
+PROFILE_EDIT_STEPS = frozenset(
+    {
+        "add_bio_linkout",
+        "ask_for_specific_bio_signal",
+        "request_avatar_or_second_identity",
+        "resolve_avatar_discrepancy",
+        "resolve_name_discrepancy",
+        "strengthen_single_identity_proof",
+        "temporary_bio_crosslink",
+        "temporary_mutual_crosslink",
+    }
+)
+
 # Deterministic mapping: reason_code -> list of NextStep templates
 _REASON_TO_STEPS: Dict[str, List[NextStep]] = {
     "facebook_numeric_id_profile": [
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Pattern packs: versioned JSON lists of platform template phrases / markers, compiled
+# once into Aho-Corasick automata. Matching is linear in the text length whatever the
+# number of patterns, so the lists can grow to hundreds of localized templates.
+PATTERN_PACK_VERSION = 1
+DEFAULT_PATTERN_PACK = os.path.join(os.path.dirname(__file__), "pattern_pack.json")
+
+# Below this many patterns, per-pattern str.find (C speed) beats walking the automaton
+# in Python; same results either way.
+AUTOMATON_MIN_PATTERNS = 200
+
+Match = Tuple[int, str]  # (start offset, pattern)
+
+
+class PatternMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of substrings.
+
+    States are trie nodes; `_fail` points at the longest proper suffix that is also a
+    trie prefix and `_out` holds every pattern ending at a state (own + via fail links),
+    so one left-to-right pass finds all occurrences. search()/leftmost() use plain
+    str.find per pattern below AUTOMATON_MIN_PATTERNS.
+    """
+
+    __slots__ = ("patterns", "lower", "use_automaton", "_goto", "_fail", "_out")
+
+    def __init__(self, patterns: Sequence[str], *, lower: bool = True, min_patterns: int = AUTOMATON_MIN_PATTERNS):
+        self.lower = lower
+        self.patterns: Tuple[str, ...] = tuple(
+            dict.fromkeys((p.lower() if lower else p) for p in patterns if p)
+        )
+        self.use_automaton = len(self.patterns) >= min_patterns
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[str, ...]] = [()]
+
+        for p in self.patterns:
+            s = 0
+            for ch in p:
+                nxt = self._goto[s].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[s][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                s = nxt
+            self._out[s] = self._out[s] + (p,)
+
+        # Breadth-first so a state's fail target is finished before the state itself.
+        queue = deque(self._goto[0].values())
+        while queue:
+            s = queue.popleft()
+            for ch, nxt in self._goto[s].items():
+                queue.append(nxt)
+                f = self._fail[s]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def finditer(self, text: Optional[str]) -> Iterator[Match]:
+        """
+        Every (start, pattern) occurrence, in order of end offset.
+        """
+        t = text or ""
+        if self.lower:
+            t = t.lower()
+        goto, fail, out = self._goto, self._fail, self._out
+        s = 0
+        for i, ch in enumerate(t):
+            while s and ch not in goto[s]:
+                s = fail[s]
+            s = goto[s].get(ch, 0)
+            if out[s]:
+                for p in out[s]:
+                    yield i - len(p) + 1, p
+
+    def _first_occurrences(self, text: Optional[str]) -> Iterator[Match]:
+        # Small sets: first occurrence of each pattern via str.find.
+        t = text or ""
+        if self.lower:
+            t = t.lower()
+        for p in self.patterns:
+            i = t.find(p)
+            if i >= 0:
+                yield i, p
+
+    def search(self, text: Optional[str]) -> Optional[str]:
+        """
+        First pattern found (earliest end offset, longest on ties), or None.
+        """
+        if not self.use_automaton:
+            best = min(self._first_occurrences(text), key=lambda m: (m[0] + len(m[1]), -len(m[1])), default=None)
+            return best[1] if best is not None else None
+        for _, p in self.finditer(text):
+            return p
+        return None
+
+    def leftmost(self, text: Optional[str]) -> Optional[Match]:
+        """
+        Occurrence with the smallest start offset (longest pattern on ties), or None.
+        """
+        matches = self._first_occurrences(text) if not self.use_automaton else self.finditer(text)
+        return min(matches, key=lambda m: (m[0], -len(m[1])), default=None)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+
+@dataclass
+class PatternPack:
+    """
+    Loaded pattern pack (see pattern_pack.json) with its compiled matchers.
+    """
+
+    version: int
+    generic_bio: Tuple[str, ...]
+    name_split_markers: Tuple[str, ...]
+    path: Optional[str] = None
+
+    generic_bio_matcher: PatternMatcher = field(init=False, repr=False)
+    split_marker_matcher: PatternMatcher = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.generic_bio_matcher = PatternMatcher(self.generic_bio, lower=True)
+        self.split_marker_matcher = PatternMatcher(self.name_split_markers, lower=False)
+
+
+def load_pattern_pack(path: Optional[str] = None) -> PatternPack:
+    """
+    Read and compile a pattern pack; ValueError on an unsupported version.
+    """
+    path = path or DEFAULT_PATTERN_PACK
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    version = int(data.get("version") or 0)
+    if version != PATTERN_PACK_VERSION:
+        raise ValueError(f"pattern pack {path}: version {version} not supported (expected {PATTERN_PACK_VERSION})")
+    return PatternPack(
+        version=version,
+        generic_bio=tuple(str(p) for p in data.get("generic_bio") or []),
+        name_split_markers=tuple(str(p) for p in data.get("name_split_markers") or []),
+        path=path,
+    )
+
+
+_PACK: Optional[PatternPack] = None
+_PACK_LOCK = threading.Lock()
+
+
+def get_pattern_pack() -> PatternPack:
+    """
+    Process-wide pack: SIVA_PATTERN_PACK if set, else the bundled pattern_pack.json.
+    """
+    global _PACK
+    if _PACK is None:
+        with _PACK_LOCK:
+            if _PACK is None:
+                _PACK = load_pattern_pack(os.getenv("SIVA_PATTERN_PACK", "").strip() or None)
+    return _PACK
+
+
+__all__ = [
+    "AUTOMATON_MIN_PATTERNS",
+    "DEFAULT_PATTERN_PACK",
+    "PATTERN_PACK_VERSION",
+    "PatternMatcher",
+    "PatternPack",
+    "get_pattern_pack",
+    "load_pattern_pack",
+]
@@ -3,15 +3,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import List, Optional, Set
-import re
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
-
 from siva_guard.connectors.http_client import get_cached_session
-
-
-_URL_RE = re.compile(r"(https?://[^\s\"'<>]+)", re.IGNORECASE)
+from siva_guard.connectors.page_analysis import analyze_page
+from siva_guard.connectors.streaming import fetch_status
+from siva_guard.core.deadline import BUDGET_EXHAUSTED, Deadline
 
 
 @dataclass
@@ -23,34 +20,34 @@ class ReverseLinkResult:
     fetch_cached: Optional[bool]
 
 
-def fetch_outbound_links(url: str, timeout_s: float = 8.0, max_links: int = 80) -> ReverseLinkResult:
+def fetch_outbound_links(
+    url: str,
+    timeout_s: float = 8.0,
+    max_links: int = 80,
+    deadline: Optional[Deadline] = None,
+) -> ReverseLinkResult:
     """
     Fetch a webpage and extract outbound links. Deterministic, best-effort.
+    With a deadline, a fetch skipped / cut short by the budget -> error "budget_exhausted".
     """
     try:
         sess = get_cached_session()
-        r = sess.get(url, timeout=timeout_s, allow_redirects=True)
+        r = sess.get(url, timeout=timeout_s, allow_redirects=True, resource="website", deadline=deadline)
 
         fetch_cached = getattr(r, "from_cache", None)
+        status = fetch_status(r)
+        if status.startswith("skipped:"):
+            return ReverseLinkResult(url, [], [], status.replace(":", "_"), fetch_cached)
         if r.status_code != 200 or not r.text:
             return ReverseLinkResult(url, [], [], f"http_{r.status_code}", fetch_cached)
 
-        soup = BeautifulSoup(r.text, "lxml")
-        hrefs: List[str] = []
-
-        for a in soup.find_all("a", href=True):
-            href = a.get("href") or ""
-            href = href.strip()
-            if href.startswith("http://") or href.startswith("https://"):
-                hrefs.append(href)
+        # One parse: verbatim absolute anchors first, then raw URLs seen in text/attributes.
+        page = analyze_page(r.text, base_url=str(r.url))
+        hrefs: List[str] = page.absolute_hrefs(limit=max_links)
+        for m in page.text_urls:
             if len(hrefs) >= max_links:
                 break
-
-        # also include raw URLs in text (some sites)
-        for m in _URL_RE.findall(r.text):
             hrefs.append(m)
-            if len(hrefs) >= max_links:
-                break
 
         # uniq preserve order
         seen: Set[str] = set()
@@ -74,4 +71,6 @@ def fetch_outbound_links(url: str, timeout_s: float = 8.0, max_links: int = 80)
         return ReverseLinkResult(url, out_urls, out_domains, None, fetch_cached)
 
     except Exception as e:
+        if deadline is not None and deadline.caused(e):
+            return ReverseLinkResult(url, [], [], BUDGET_EXHAUSTED, None)
         return ReverseLinkResult(url, [], [], f"fetch_failed:{type(e).__name__}", None)
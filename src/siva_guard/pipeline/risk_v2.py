@@ -2,9 +2,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List
-
-from siva_guard.pipeline.single_identity_risk import score_single_identity
+from typing import Any, Dict, List, Optional
+
+from siva_guard.pipeline.identity_features import IdentityFeatures
+from siva_guard.pipeline.scoring_weights import (
+    AVATAR_MISMATCH_WEIGHT,
+    CONFIDENCE_BASE,
+    CONFIDENCE_COVERAGE_WEIGHT,
+    CONFUSABLE_WEIGHT,
+    CROSS_CEREMONY_REUSE_RISK,
+    CROSSLINK_CREDIT,
+    FETCH_ERROR_PENALTY,
+    LOW_PUBLIC_COVERAGE,
+    LOW_PUBLIC_COVERAGE_WEIGHT,
+    LOW_TRUST_AUTHENTICITY,
+    MAX_FETCH_ERROR_PENALTY,
+    MAX_SINGLE_EXPLAINERS,
+    NAME_MISMATCH_WEIGHT,
+    SUBSTITUTION_BASE_RISK,
+    WEAK_EVIDENCE_CODES,
+    WEAK_EVIDENCE_MAX_CONFIDENCE,
+    WEAK_EVIDENCE_RISK,
+)
+from siva_guard.pipeline.single_identity_risk import SingleIdentityRisk, score_identity_features, score_single_identity
 
 
 @dataclass
@@ -20,13 +40,25 @@ def clamp01(x: float) -> float:
     return max(0.0, min(1.0, x))
 
 
-def compute_risk_v2(graph_metrics: Dict[str, Any], per_identity: Dict[str, Any]) -> RiskV2:
+def compute_risk_v2(
+    graph_metrics: Dict[str, Any],
+    per_identity: Dict[str, Any],
+    cross_ceremony_reuse: Optional[Dict[str, Any]] = None,
+    features: Optional[Dict[str, IdentityFeatures]] = None,
+    single_risks: Optional[Dict[str, SingleIdentityRisk]] = None,
+) -> RiskV2:
     """
     Deterministic:
     - substitution_risk: set-based substitution risk (confusables, low coverage, mismatches)
-    - authenticity_risk: per-identity low-trust signal (works even for single identity)
+    - authenticity_risk: per-identity low-trust signal (works even for single identity),
+      floored when an avatar / handle / domain recurs across unrelated ceremonies
+      (cross_ceremony_reuse, see pipeline/identity_index.py)
     - overall_risk: max(substitution_risk, authenticity_risk)
     - confidence: confidence in the decision given observable evidence quality
+
+    features: IdentityFeatures per per_identity key (agent per-identity stage); items
+    without one are scored from the raw dict. single_risks: single-identity scores
+    already computed (identity analysis cache), used instead of rescoring.
     """
     num = int(graph_metrics.get("num_identities", 0) or 0)
     public_cov = float(graph_metrics.get("public_coverage", 0.0) or 0.0)
@@ -40,26 +72,26 @@ def compute_risk_v2(graph_metrics: Dict[str, Any], per_identity: Dict[str, Any])
     # -------------------------
     # A) Substitution risk
     # -------------------------
-    substitution = 0.10
+    substitution = SUBSTITUTION_BASE_RISK
 
-    if num > 1 and public_cov < 0.5:
-        substitution += 0.25
+    if num > 1 and public_cov < LOW_PUBLIC_COVERAGE:
+        substitution += LOW_PUBLIC_COVERAGE_WEIGHT
         reasons.append({"code": "low_public_coverage", "detail": f"public_coverage={public_cov:.2f}"})
 
     if confusable > 0:
-        substitution += 0.30
+        substitution += CONFUSABLE_WEIGHT
         reasons.append({"code": "confusable_identifiers", "detail": f"confusable_pairs={confusable}"})
 
     if name_mismatch > 0:
-        substitution += 0.20
+        substitution += NAME_MISMATCH_WEIGHT
         reasons.append({"code": "name_mismatch_under_confusable", "detail": f"name_mismatch_pairs={name_mismatch}"})
 
     if avatar_mismatch > 0:
-        substitution += 0.20
+        substitution += AVATAR_MISMATCH_WEIGHT
         reasons.append({"code": "avatar_mismatch_under_confusable", "detail": f"avatar_mismatch_pairs={avatar_mismatch}"})
 
     if crosslinks > 0:
-        substitution -= 0.10
+        substitution -= CROSSLINK_CREDIT
         reasons.append({"code": "crosslink_support", "detail": f"crosslink_hits={crosslinks}"})
 
     substitution = clamp01(substitution)
@@ -70,20 +102,39 @@ def compute_risk_v2(graph_metrics: Dict[str, Any], per_identity: Dict[str, Any])
     authenticity = 0.0
     top_single_reasons: List[Dict[str, Any]] = []
 
-    for _, item in per_identity.items():
-        r = score_single_identity(item)
+    features = features or {}
+    single_risks = single_risks or {}
+    for key, item in per_identity.items():
+        r = single_risks.get(key)
+        if r is None:
+            f = features.get(key)
+            r = score_identity_features(f) if f is not None else score_single_identity(item)
         if r.authenticity_risk > authenticity:
             authenticity = r.authenticity_risk
             top_single_reasons = r.reasons[:]  # keep the strongest identity's reasons
 
     authenticity = clamp01(authenticity)
 
-    if authenticity > 0.25:
+    if authenticity > LOW_TRUST_AUTHENTICITY:
         reasons.append(
             {"code": "low_trust_single_identity_signals", "detail": f"authenticity_risk={authenticity:.2f}"}
         )
         # attach a few explainers (bounded)
-        reasons.extend(top_single_reasons[:3])
+        reasons.extend(top_single_reasons[:MAX_SINGLE_EXPLAINERS])
+
+    # -------------------------
+    # B2) Cross-ceremony reuse (impostor-farm signal)
+    # -------------------------
+    flagged = (cross_ceremony_reuse or {}).get("flagged") or []
+    if flagged:
+        authenticity = max(authenticity, CROSS_CEREMONY_REUSE_RISK)
+        top = max(flagged, key=lambda x: x.get("ceremonies", 0))
+        reasons.append(
+            {
+                "code": "cross_ceremony_reuse",
+                "detail": f"{top.get('kind')} seen in {top.get('ceremonies')} other ceremonies (identity={top.get('id')})",
+            }
+        )
 
     # -------------------------
     # C) Overall risk
@@ -101,23 +152,22 @@ def compute_risk_v2(graph_metrics: Dict[str, Any], per_identity: Dict[str, Any])
         if errs:
             fetch_errors += 1
 
-    conf = 0.40 + 0.50 * public_cov  # ranges 0.40..0.90
+    conf = CONFIDENCE_BASE + CONFIDENCE_COVERAGE_WEIGHT * public_cov  # ranges 0.40..0.90
     if fetch_errors > 0:
-        conf -= min(0.20, 0.05 * fetch_errors)
+        conf -= min(MAX_FETCH_ERROR_PENALTY, FETCH_ERROR_PENALTY * fetch_errors)
 
     conf = clamp01(conf)
 
     # ✅ Fix #2: If we are flagging high authenticity risk AND evidence is weak/generic,
     # cap confidence so it doesn't look like we are "sure it's fake".
-    if authenticity >= 0.70:
+    if authenticity >= WEAK_EVIDENCE_RISK:
         reason_codes = {r.get("code") for r in reasons if isinstance(r, dict)}
         weak_evidence = (
-            "generic_platform_bio" in reason_codes
-            or "no_bio_linkouts" in reason_codes
+            any(code in reason_codes for code in WEAK_EVIDENCE_CODES)
             or "low_trust_single_identity_signals" in reason_codes
         )
         if weak_evidence:
-            conf = min(conf, 0.75)
+            conf = min(conf, WEAK_EVIDENCE_MAX_CONFIDENCE)
 
     return RiskV2(
         substitution_risk=substitution,
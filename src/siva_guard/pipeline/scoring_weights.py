@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+# Weights and thresholds of the deterministic scoring chain, shared by the per-ceremony
+# path (single_identity_risk -> risk_v2 -> agent_policy_v2 -> judge_v1) and the NumPy
+# batch path (batch_scoring.py). Change them here only: the batch path must stay
+# bit-identical to the scalar one (tests/test_batch_scoring.py).
+
+# ---- single_identity_risk ----
+SINGLE_BASE_RISK = 0.10
+
+# Reason code -> weight, in the order score_single_identity() emits the reasons. Each
+# weight is multiplied by the signal's strength (1.0 for yes/no signals, the 0..1
+# repetition score for repeated_name_tokens).
+SINGLE_REASON_WEIGHTS: Dict[str, float] = {
+    "facebook_numeric_id_profile": 0.20,
+    "generic_platform_bio": 0.20,
+    "repeated_name_tokens": 0.15,
+    "no_bio_linkouts": 0.10,
+    "missing_avatar_url": 0.05,
+}
+
+# ---- risk_v2: substitution ----
+SUBSTITUTION_BASE_RISK = 0.10
+LOW_PUBLIC_COVERAGE = 0.5  # multi-identity ceremonies below this coverage
+LOW_PUBLIC_COVERAGE_WEIGHT = 0.25
+CONFUSABLE_WEIGHT = 0.30
+NAME_MISMATCH_WEIGHT = 0.20
+AVATAR_MISMATCH_WEIGHT = 0.20
+CROSSLINK_CREDIT = 0.10  # subtracted
+
+# ---- risk_v2: authenticity ----
+# Above this, the strongest identity's first MAX_SINGLE_EXPLAINERS reasons are attached.
+LOW_TRUST_AUTHENTICITY = 0.25
+MAX_SINGLE_EXPLAINERS = 3
+# Authenticity floor when identity features recur across unrelated ceremonies.
+CROSS_CEREMONY_REUSE_RISK = 0.70
+
+# ---- risk_v2: confidence ----
+CONFIDENCE_BASE = 0.40
+CONFIDENCE_COVERAGE_WEIGHT = 0.50
+FETCH_ERROR_PENALTY = 0.05  # per identity with collection errors
+MAX_FETCH_ERROR_PENALTY = 0.20
+# High authenticity risk from weak evidence only: confidence is capped.
+WEAK_EVIDENCE_RISK = 0.70
+WEAK_EVIDENCE_MAX_CONFIDENCE = 0.75
+# Reason codes that only say the evidence is weak (never grounds for FAKE).
+WEAK_EVIDENCE_CODES: Tuple[str, ...] = ("generic_platform_bio", "no_bio_linkouts")
+
+# ---- agent_policy_v2 ----
+REQUEST_STRONGER_PROOF_RISK = 0.70
+WARN_RISK = 0.40
+
+# ---- judge_v1 ----
+MIN_IDENTITIES_FOR_SUBSTITUTION = 2
+MIN_PUBLIC_COVERAGE = 0.50
+FAKE_HIGH_RISK = 0.70
+FAKE_MEDIUM_RISK = 0.55
+
+
+__all__ = [
+    "AVATAR_MISMATCH_WEIGHT",
+    "CONFIDENCE_BASE",
+    "CONFIDENCE_COVERAGE_WEIGHT",
+    "CONFUSABLE_WEIGHT",
+    "CROSSLINK_CREDIT",
+    "CROSS_CEREMONY_REUSE_RISK",
+    "FAKE_HIGH_RISK",
+    "FAKE_MEDIUM_RISK",
+    "FETCH_ERROR_PENALTY",
+    "LOW_PUBLIC_COVERAGE",
+    "LOW_PUBLIC_COVERAGE_WEIGHT",
+    "LOW_TRUST_AUTHENTICITY",
+    "MAX_FETCH_ERROR_PENALTY",
+    "MAX_SINGLE_EXPLAINERS",
+    "MIN_IDENTITIES_FOR_SUBSTITUTION",
+    "MIN_PUBLIC_COVERAGE",
+    "NAME_MISMATCH_WEIGHT",
+    "REQUEST_STRONGER_PROOF_RISK",
+    "SINGLE_BASE_RISK",
+    "SINGLE_REASON_WEIGHTS",
+    "SUBSTITUTION_BASE_RISK",
+    "WARN_RISK",
+    "WEAK_EVIDENCE_CODES",
+    "WEAK_EVIDENCE_MAX_CONFIDENCE",
+    "WEAK_EVIDENCE_RISK",
+]
@@ -1,29 +1,237 @@
 from __future__ import annotations
-import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 from rapidfuzz.distance import Levenshtein
-from rapidfuzz import fuzz
-
-HOMOGLYPH_MAP = {
-    "0": "o",
-    "1": "l",
-    "3": "e",
-    "5": "s",
-    "7": "t",
-    "@": "a",
-    "$": "s",
-}
+from rapidfuzz import fuzz, process
+
+from siva_guard.pipeline.confusables import ASCII_HOMOGLYPHS, skeleton
+
+HOMOGLYPH_MAP = ASCII_HOMOGLYPHS
 
 def normalize_identifier(s: str) -> str:
-    s = (s or "").strip().lower()
-    s = re.sub(r"\s+", "", s)
-    for k, v in HOMOGLYPH_MAP.items():
-        s = s.replace(k, v)
-    return s
-
-def confusability(a: str, b: str) -> dict:
-    na, nb = normalize_identifier(a), normalize_identifier(b)
+    # Confusable skeleton (pipeline/confusables.py): NFKD, Cyrillic / Greek / full-width
+    # lookalikes folded to Latin; identical to the old ASCII-only version on ASCII input.
+    return skeleton(s)
+
+# Confusable identifier pair: ratio >= CONFUSABLE_RATIO and edit distance <= CONFUSABLE_LEV.
+CONFUSABLE_RATIO = 0.92
+CONFUSABLE_LEV = 2
+
+
+def max_ratio(la: int, lb: int) -> float:
+    """
+    Upper bound of fuzz.ratio / 100 for strings of these lengths: the Indel distance is
+    at least |la - lb|, so ratio <= 2 * min(la, lb) / (la + lb).
+    """
+    return (2.0 * min(la, lb) / (la + lb)) if (la + lb) else 1.0
+
+
+def confusability(
+    a: str,
+    b: str,
+    *,
+    score_cutoff: Optional[float] = None,
+    lev_cutoff: Optional[int] = None,
+    score_hint: Optional[int] = None,
+    normalized: bool = False,
+) -> dict:
+    """
+    {"lev", "ratio"} of the normalized identifiers (None when either is empty).
+
+    With cutoffs, a pair that cannot reach them returns early, without a full DP:
+    ratio reads 0.0 below score_cutoff (0..1 scale), lev reads lev_cutoff + 1 above
+    lev_cutoff; both are first checked against the length bound, then passed on to
+    rapidfuzz. score_hint: expected edit distance, lets rapidfuzz start with a
+    narrower band.
+    """
+    na, nb = (a, b) if normalized else (normalize_identifier(a), normalize_identifier(b))
     if not na or not nb:
         return {"lev": None, "ratio": None}
-    lev = Levenshtein.distance(na, nb)
-    ratio = fuzz.ratio(na, nb) / 100.0
+    la, lb = len(na), len(nb)
+
+    if lev_cutoff is None:
+        lev = Levenshtein.distance(na, nb, score_hint=score_hint)
+    elif abs(la - lb) > lev_cutoff:
+        lev = lev_cutoff + 1
+    else:
+        lev = Levenshtein.distance(na, nb, score_cutoff=lev_cutoff, score_hint=score_hint)
+
+    if score_cutoff is None:
+        ratio = fuzz.ratio(na, nb) / 100.0
+    elif max_ratio(la, lb) < score_cutoff:
+        ratio = 0.0
+    else:
+        ratio = fuzz.ratio(na, nb, score_cutoff=score_cutoff * 100.0) / 100.0
     return {"lev": lev, "ratio": ratio}
+
+
+def is_confusable(
+    a: str,
+    b: str,
+    *,
+    score_cutoff: float = CONFUSABLE_RATIO,
+    lev_cutoff: int = CONFUSABLE_LEV,
+    normalized: bool = False,
+) -> bool:
+    """
+    confusability() ratio >= score_cutoff and lev <= lev_cutoff, stopping at the first
+    check that fails: length bounds, then the banded (cutoff-limited) edit distance,
+    then the ratio.
+    """
+    na, nb = (a, b) if normalized else (normalize_identifier(a), normalize_identifier(b))
+    if not na or not nb:
+        return False
+    la, lb = len(na), len(nb)
+    if abs(la - lb) > lev_cutoff or max_ratio(la, lb) < score_cutoff:
+        return False
+    if Levenshtein.distance(na, nb, score_cutoff=lev_cutoff, score_hint=1) > lev_cutoff:
+        return False
+    return fuzz.ratio(na, nb, score_cutoff=score_cutoff * 100.0) >= score_cutoff * 100.0
+
+
+# rapidfuzz worker threads for bulk scoring (-1 = all cores).
+SIMILARITY_WORKERS = -1
+
+
+@dataclass
+class SimilarityMatrix:
+    """
+    Pairwise confusability() scores for a list of identifiers, each normalized once and
+    scored in bulk. Dense (n x n arrays) for full matrices, or keyed by (i, j) with
+    i < j when only candidate pairs were scored.
+
+    ratio()/lev() mirror confusability(): None when either side normalizes to empty.
+    Ratios below score_cutoff read as 0.0; distances above lev_cutoff as lev_cutoff + 1.
+    """
+
+    normalized: List[str]
+    ratios: Any
+    levs: Any = None
+
+    def _key(self, i: int, j: int) -> Tuple[int, int]:
+        return (i, j) if i < j else (j, i)
+
+    def ratio(self, i: int, j: int) -> Optional[float]:
+        if not self.normalized[i] or not self.normalized[j]:
+            return None
+        return float(self.ratios[self._key(i, j)])
+
+    def lev(self, i: int, j: int) -> Optional[int]:
+        if self.levs is None or not self.normalized[i] or not self.normalized[j]:
+            return None
+        return int(self.levs[self._key(i, j)])
+
+
+def _length_filter(
+    norm: Sequence[str],
+    pairs: Sequence[Tuple[int, int]],
+    score_cutoff: Optional[float],
+    lev_cutoff: Optional[int],
+) -> List[Tuple[int, int]]:
+    # Pairs whose lengths alone rule out the cutoffs never reach rapidfuzz.
+    lens = [len(x) for x in norm]
+    out: List[Tuple[int, int]] = []
+    for i, j in pairs:
+        la, lb = lens[i], lens[j]
+        if not la or not lb:
+            continue
+        if lev_cutoff is not None and abs(la - lb) > lev_cutoff:
+            continue
+        if score_cutoff is not None and max_ratio(la, lb) < score_cutoff:
+            continue
+        out.append((i, j))
+    return out
+
+
+def similarity_matrix(
+    strings: Sequence[str],
+    *,
+    pairs: Optional[Sequence[Tuple[int, int]]] = None,
+    score_cutoff: Optional[float] = None,
+    with_lev: bool = False,
+    lev_cutoff: Optional[int] = None,
+    workers: int = SIMILARITY_WORKERS,
+    normalized: bool = False,
+) -> SimilarityMatrix:
+    """
+    Bulk confusability(): rapidfuzz process.cdist over all pairs, or process.cpdist over
+    just `pairs` (i < j, e.g. from pipeline/blocking.py) for large sets.
+    score_cutoff is on the 0..1 ratio scale. normalized=True: `strings` are already
+    normalize_identifier() skeletons (e.g. IdentityFeatures.handle_skeleton).
+    """
+    norm = list(strings) if normalized else [normalize_identifier(s) for s in strings]
+    cutoff = None if score_cutoff is None else score_cutoff * 100.0
+
+    if pairs is None:
+        ratios = process.cdist(
+            norm, norm, scorer=fuzz.ratio, dtype=np.float64, workers=workers, score_cutoff=cutoff
+        ) / 100.0
+        levs = (
+            process.cdist(norm, norm, scorer=Levenshtein.distance, workers=workers, score_cutoff=lev_cutoff)
+            if with_lev else None
+        )
+        return SimilarityMatrix(normalized=norm, ratios=ratios, levs=levs)
+
+    pairs = list(pairs)
+    left = [norm[i] for i, _ in pairs]
+    right = [norm[j] for _, j in pairs]
+    r = process.cpdist(
+        left, right, scorer=fuzz.ratio, dtype=np.float64, workers=workers, score_cutoff=cutoff
+    ) / 100.0
+    ratio_map: Dict[Tuple[int, int], float] = dict(zip(pairs, r.tolist()))
+    lev_map: Optional[Dict[Tuple[int, int], int]] = None
+    if with_lev:
+        d = process.cpdist(left, right, scorer=Levenshtein.distance, workers=workers, score_cutoff=lev_cutoff)
+        lev_map = dict(zip(pairs, d.tolist()))
+    return SimilarityMatrix(normalized=norm, ratios=ratio_map, levs=lev_map)
+
+
+def confusable_pairs(
+    strings: Sequence[str],
+    *,
+    pairs: Optional[Sequence[Tuple[int, int]]] = None,
+    score_cutoff: float = CONFUSABLE_RATIO,
+    lev_cutoff: int = CONFUSABLE_LEV,
+    workers: int = SIMILARITY_WORKERS,
+    normalized: bool = False,
+) -> List[Tuple[int, int, float, int]]:
+    """
+    (i, j, ratio, lev) for every pair (i < j, sorted) that is_confusable(): the
+    thresholded counterpart of similarity_matrix() for callers that only need the pairs
+    over the cutoffs. Ratios are scored with score_cutoff (cdist over all pairs, or
+    cpdist over `pairs` after the length prefilter); edit distances only for the pairs
+    that passed, banded to lev_cutoff.
+    """
+    norm = list(strings) if normalized else [normalize_identifier(s) for s in strings]
+    cutoff = score_cutoff * 100.0
+
+    if pairs is None:
+        ratios = process.cdist(
+            norm, norm, scorer=fuzz.ratio, dtype=np.float64, workers=workers, score_cutoff=cutoff
+        ) / 100.0
+        hits = np.argwhere(np.triu(ratios >= score_cutoff, k=1))
+        scored = [(int(i), int(j), float(ratios[i, j])) for i, j in hits]
+    else:
+        todo = _length_filter(norm, sorted(pairs), score_cutoff, lev_cutoff)
+        if not todo:
+            return []
+        r = process.cpdist(
+            [norm[i] for i, _ in todo],
+            [norm[j] for _, j in todo],
+            scorer=fuzz.ratio,
+            dtype=np.float64,
+            workers=workers,
+            score_cutoff=cutoff,
+        ) / 100.0
+        scored = [(i, j, x) for (i, j), x in zip(todo, r.tolist()) if x >= score_cutoff]
+
+    out: List[Tuple[int, int, float, int]] = []
+    for i, j, ratio in scored:
+        if not norm[i] or not norm[j]:
+            continue
+        lev = Levenshtein.distance(norm[i], norm[j], score_cutoff=lev_cutoff, score_hint=1)
+        if lev <= lev_cutoff:
+            out.append((i, j, ratio, lev))
+    return out
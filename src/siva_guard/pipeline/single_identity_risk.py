@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 import re
 
+from siva_guard.pipeline.identity_features import IdentityFeatures, norm_platform
+from siva_guard.pipeline.patterns import get_pattern_pack
+from siva_guard.pipeline.scoring_weights import SINGLE_BASE_RISK, SINGLE_REASON_WEIGHTS
+
 
 @dataclass
 class SingleIdentityRisk:
@@ -11,51 +15,45 @@ class SingleIdentityRisk:
     reasons: List[Dict[str, Any]]
 
 
-# Generic/template bio snippets (deterministic, low false-positive)
-_GENERIC_BIO_PATTERNS = [
-    # Facebook OG template pattern
-    "is on facebook. join facebook to connect with",
-    "facebook gives people the power to share",
-    # Instagram / LinkedIn common template phrases (kept minimal)
-    "see instagram photos and videos from",
-    "view",
-    "profile",
-    "on linkedin",
-]
+@dataclass(frozen=True)
+class SingleIdentityFlags:
+    """
+    The signals score_single_identity() weighs, before weighting; also the per-identity
+    columns of pipeline/batch_scoring.py.
+    """
+
+    facebook_numeric_id: bool
+    generic_bio: Optional[str]  # matched template pattern ("" = empty bio), None = not generic
+    name_repetition: float
+    no_linkouts: bool
+    missing_avatar: bool
+
+
+# Generic/template bio snippets (deterministic, low false-positive), from the pattern
+# pack (pipeline/pattern_pack.json) and matched with one Aho-Corasick pass.
+_GENERIC_BIO_PATTERNS = list(get_pattern_pack().generic_bio)
 
 
 def _clamp01(x: float) -> float:
     return max(0.0, min(1.0, x))
 
 
-def _norm_platform(p: Any) -> str:
+# Shared with the per-identity feature record.
+_norm_platform = norm_platform
+
+
+def _generic_bio_match(bio: str) -> Optional[str]:
     """
-    Your output sometimes has 'Platform.FACEBOOK' (Enum leakage).
-    Normalize to simple lowercase keyword.
+    The template pattern found in the bio ("" for an empty bio), or None.
     """
-    s = str(p or "").lower()
-    if "facebook" in s:
-        return "facebook"
-    if "instagram" in s:
-        return "instagram"
-    if "linkedin" in s:
-        return "linkedin"
-    if "github" in s:
-        return "github"
-    if "tiktok" in s:
-        return "tiktok"
-    if "youtube" in s:
-        return "youtube"
-    if s in ("x", "twitter") or "twitter" in s:
-        return "x"
-    return s
+    b = (bio or "").strip()
+    if not b:
+        return ""
+    return get_pattern_pack().generic_bio_matcher.search(b)
 
 
 def _is_generic_bio(bio: str) -> bool:
-    b = (bio or "").strip().lower()
-    if not b:
-        return True
-    return any(p in b for p in _GENERIC_BIO_PATTERNS)
+    return _generic_bio_match(bio) is not None
 
 
 def _name_repetition_score(name: str) -> float:
@@ -85,63 +83,121 @@ def _name_repetition_score(name: str) -> float:
     return 0.0
 
 
-def score_single_identity(per_identity_item: Dict[str, Any]) -> SingleIdentityRisk:
+def single_identity_flags(per_identity_item: Dict[str, Any]) -> SingleIdentityFlags:
     """
-    Deterministic single-identity scoring using extracted evidence only.
-    Does NOT claim 'fake'. Produces a low-trust / weak-evidence signal.
+    The single-identity signals of a raw per_identity item (see score_single_identity).
     """
     platform = _norm_platform(per_identity_item.get("platform"))
     claimed = per_identity_item.get("claimed") or ""
     pub = per_identity_item.get("public") or {}
     ui = per_identity_item.get("ui") or {}
 
-    display_name = (pub.get("display_name") or ui.get("display_name") or "").strip()
-    bio = (pub.get("bio") or ui.get("snippet") or "").strip()
-    avatar_url = (pub.get("avatar_url") or ui.get("avatar_url") or "").strip()
-
-    reasons: List[Dict[str, Any]] = []
-    risk = 0.10  # base
-
-    # 1) Facebook numeric-id URL pattern (weak binding, easy to substitute)
-    # This is NOT a "fake" claim; it's a deterministic low-trust signal.
-    if platform == "facebook":
-        if "profile.php" in claimed and "id=" in claimed:
-            risk += 0.20
-            reasons.append(
-                {"code": "facebook_numeric_id_profile", "detail": "profile.php?id=... pattern"}
-            )
-
-    # 2) Generic/template bio
-    if _is_generic_bio(bio):
-        risk += 0.20
-        reasons.append(
-            {"code": "generic_platform_bio", "detail": "bio looks like platform template / non-specific"}
-        )
-
-    # 3) Repeated name tokens
-    rep = _name_repetition_score(display_name)
-    if rep > 0:
-        risk += 0.15 * rep
-        reasons.append({"code": "repeated_name_tokens", "detail": f"repetition_score={rep:.2f}"})
+    # As in IdentityFeatures: a missing or whitespace-only public field falls back to the UI card.
+    display_name = (pub.get("display_name") or "").strip() or (ui.get("display_name") or "").strip()
+    bio = (pub.get("bio") or "").strip() or (ui.get("snippet") or "").strip()
+    avatar_url = (pub.get("avatar_url") or "").strip() or (ui.get("avatar_url") or "").strip()
 
-    # 4) No linkouts / crosslinks visible
-    # Prefer structured fields if present; otherwise fallback to raw bio
     bio_link_domains = per_identity_item.get("bio_link_domains")
     bio_link_handles = per_identity_item.get("bio_link_handles")
     external_links = pub.get("external_links") or per_identity_item.get("external_links") or []
 
+    return _flags(platform, claimed, display_name, bio, avatar_url, bio_link_domains, bio_link_handles, external_links)
+
+
+def identity_features_flags(f: IdentityFeatures) -> SingleIdentityFlags:
+    """
+    single_identity_flags() over the precomputed per-identity record (no dict digging).
+    Bio linkouts are judged from the bio text, as for raw per_identity items.
+    """
+    return _flags(f.platform_kind, f.claimed, f.display_name, f.bio, f.avatar_url, None, None, f.external_links)
+
+
+def score_single_identity(per_identity_item: Dict[str, Any]) -> SingleIdentityRisk:
+    """
+    Deterministic single-identity scoring using extracted evidence only.
+    Does NOT claim 'fake'. Produces a low-trust / weak-evidence signal.
+    """
+    return _score(single_identity_flags(per_identity_item))
+
+
+def score_identity_features(f: IdentityFeatures) -> SingleIdentityRisk:
+    """
+    score_single_identity() over the precomputed per-identity record.
+    """
+    return _score(identity_features_flags(f))
+
+
+def _flags(
+    platform: str,
+    claimed: str,
+    display_name: str,
+    bio: str,
+    avatar_url: str,
+    bio_link_domains: Optional[Sequence[str]],
+    bio_link_handles: Optional[Sequence[str]],
+    external_links: Sequence[Any],
+) -> SingleIdentityFlags:
+    # 4) Prefer structured linkout fields if present; otherwise fallback to raw bio
     if bio_link_domains is not None or bio_link_handles is not None:
-        if not (bio_link_domains or bio_link_handles or external_links):
-            risk += 0.10
-            reasons.append({"code": "no_bio_linkouts", "detail": "no URLs or @handles in bio"})
+        no_linkouts = not (bio_link_domains or bio_link_handles or external_links)
     else:
-        if ("http://" not in bio.lower()) and ("https://" not in bio.lower()) and ("@" not in bio) and not external_links:
-            risk += 0.10
-            reasons.append({"code": "no_bio_linkouts", "detail": "no URLs or @handles in bio"})
-
-    # 5) Missing avatar URL reduces corroboration ability (low trust, not suspicious)
-    if not avatar_url:
-        risk += 0.05
-        reasons.append({"code": "missing_avatar_url", "detail": "no avatar_url extracted"})
+        no_linkouts = (
+            ("http://" not in bio.lower()) and ("https://" not in bio.lower()) and ("@" not in bio) and not external_links
+        )
+
+    return SingleIdentityFlags(
+        facebook_numeric_id=(platform == "facebook" and "profile.php" in claimed and "id=" in claimed),
+        generic_bio=_generic_bio_match(bio),
+        name_repetition=_name_repetition_score(display_name),
+        no_linkouts=bool(no_linkouts),
+        missing_avatar=not avatar_url,
+    )
+
+
+def reason_signals(flags: SingleIdentityFlags) -> Dict[str, float]:
+    """
+    Strength of each single-identity reason (0.0 = absent), keyed and ordered like
+    SINGLE_REASON_WEIGHTS.
+    """
+    return {
+        # 1) Facebook numeric-id URL pattern (weak binding, easy to substitute)
+        # This is NOT a "fake" claim; it's a deterministic low-trust signal.
+        "facebook_numeric_id_profile": 1.0 if flags.facebook_numeric_id else 0.0,
+        # 2) Generic/template bio
+        "generic_platform_bio": 1.0 if flags.generic_bio is not None else 0.0,
+        # 3) Repeated name tokens
+        "repeated_name_tokens": flags.name_repetition,
+        # 4) No linkouts / crosslinks visible
+        "no_bio_linkouts": 1.0 if flags.no_linkouts else 0.0,
+        # 5) Missing avatar URL reduces corroboration ability (low trust, not suspicious)
+        "missing_avatar_url": 1.0 if flags.missing_avatar else 0.0,
+    }
+
+
+_REASON_DETAILS = {
+    "facebook_numeric_id_profile": "profile.php?id=... pattern",
+    "generic_platform_bio": "bio looks like platform template / non-specific",
+    "no_bio_linkouts": "no URLs or @handles in bio",
+    "missing_avatar_url": "no avatar_url extracted",
+}
+
+
+def _score(flags: SingleIdentityFlags) -> SingleIdentityRisk:
+    reasons: List[Dict[str, Any]] = []
+    risk = SINGLE_BASE_RISK
+
+    signals = reason_signals(flags)
+    for code, weight in SINGLE_REASON_WEIGHTS.items():
+        strength = signals[code]
+        if strength <= 0:
+            continue
+        risk += weight * strength
+        if code == "repeated_name_tokens":
+            reason = {"code": code, "detail": f"repetition_score={strength:.2f}"}
+        else:
+            reason = {"code": code, "detail": _REASON_DETAILS[code]}
+        if code == "generic_platform_bio" and flags.generic_bio:
+            reason["pattern"] = flags.generic_bio
+        reasons.append(reason)
 
     return SingleIdentityRisk(authenticity_risk=_clamp01(risk), reasons=reasons)
@@ -0,0 +1,31 @@
+import pytest
+import requests
+
+from siva_guard.connectors.archive import ArchiveMiss, FetchArchive, ReplayAdapter, archive_key
+
+
+def test_replay_serves_archived_responses_and_failures(tmp_path):
+    arc = FetchArchive(tmp_path)
+    url = "https://example.com/jane"
+    arc.add({
+        "key": archive_key("GET", None, url),
+        "url": url,
+        "status": 200,
+        "reason": "OK",
+        "headers": {"Content-Type": "text/html"},
+        "sha256": arc.put_blob(b"<html><title>Jane</title></html>"),
+    })
+    arc.add({"key": archive_key("GET", None, "https://down.example/"), "url": "https://down.example/",
+             "error": "ReadTimeout", "message": "read timed out"})
+
+    # Index is reloaded from disk.
+    sess = requests.Session()
+    adapter = ReplayAdapter(FetchArchive(tmp_path), latency={"*.example.com": 0.0})
+    sess.mount("https://", adapter)
+
+    r = sess.get(url)
+    assert r.status_code == 200 and "Jane" in r.text
+    with pytest.raises(requests.ReadTimeout):
+        sess.get("https://down.example/")
+    with pytest.raises(ArchiveMiss):
+        sess.get("https://example.com/other")
@@ -0,0 +1,84 @@
+import random
+
+from siva_guard.pipeline.agent_policy_v2 import decide_action_v2
+from siva_guard.pipeline.batch_scoring import CeremonyBatch, reason_signals, score_batch
+from siva_guard.pipeline.judge_v1 import judge_v1
+from siva_guard.pipeline.risk_v2 import compute_risk_v2
+from siva_guard.pipeline.scoring_weights import SINGLE_REASON_WEIGHTS
+from siva_guard.pipeline.single_identity_risk import score_single_identity
+
+_BIOS = ["", "Jane is on Facebook. Join Facebook to connect with Jane", "see https://jane.dev", "@jane fan", "Engineer at Acme"]
+_NAMES = ["Jane Doe", "Jane Jane", "A B A B", "", "Jane"]
+
+
+def _ceremony(rng):
+    per_identity = {}
+    for k in range(rng.choice([0, 1, 1, 2, 3, 5])):
+        claimed = rng.choice(["https://facebook.com/profile.php?id=42", "jane", f"@jane{k}"])
+        public = None
+        if rng.random() < 0.7:
+            public = {
+                "display_name": rng.choice(_NAMES),
+                "bio": rng.choice(_BIOS),
+                "avatar_url": rng.choice(["", "https://cdn.example.com/a.png"]),
+                "external_links": rng.choice([[], ["https://jane.dev"]]),
+            }
+        per_identity[f"{claimed}#{k}"] = {
+            "platform": rng.choice(["Platform.FACEBOOK", "Platform.GITHUB", "x"]),
+            "claimed": claimed,
+            "ui": {"display_name": rng.choice(_NAMES), "snippet": rng.choice(_BIOS)},
+            "public": public,
+            "errors": ["timeout"] if rng.random() < 0.2 else [],
+        }
+    n = len(per_identity)
+    metrics = {
+        "num_identities": n,
+        "public_coverage": rng.choice([0.0, 0.25, 0.5, 0.6, 1.0, 1 / 3]),
+        "confusable_pairs": rng.choice([0, 0, 1, 3]),
+        "name_mismatch_pairs": rng.choice([0, 0, 1]),
+        "avatar_mismatch_pairs": rng.choice([0, 0, 1]),
+        "crosslink_hits": rng.choice([0, 1, 2]),
+    }
+    reuse = {"flagged": [{"id": "x", "kind": "avatar", "ceremonies": 4}]} if rng.random() < 0.15 else None
+    return metrics, per_identity, reuse
+
+
+def test_batch_scoring_matches_scalar_path():
+    rng = random.Random(25)
+    ceremonies = [_ceremony(rng) for _ in range(3000)]
+    scores = score_batch(CeremonyBatch.from_ceremonies(ceremonies))
+    actions, verdicts, certainties = scores.labels("action"), scores.labels("verdict"), scores.labels("certainty")
+
+    for c, (metrics, per_identity, reuse) in enumerate(ceremonies):
+        r = compute_risk_v2(metrics, per_identity, cross_ceremony_reuse=reuse)
+        agent = decide_action_v2(metrics, r.overall_risk)
+        j = judge_v1(
+            {
+                "overall_risk": r.overall_risk,
+                "authenticity_risk": r.authenticity_risk,
+                "substitution_risk": r.substitution_risk,
+                "confidence": r.confidence,
+                "reasons": r.reasons,
+                "agent": agent,
+                "graph_metrics": metrics,
+            }
+        )
+        assert scores.substitution_risk[c] == r.substitution_risk
+        assert scores.authenticity_risk[c] == r.authenticity_risk
+        assert scores.overall_risk[c] == r.overall_risk
+        assert scores.confidence[c] == r.confidence
+        assert actions[c] == agent["action"]
+        assert (verdicts[c], certainties[c], bool(scores.abstained[c])) == (j["verdict"], j["certainty"], j["abstained"])
+
+
+def test_batch_reason_slots_follow_single_identity_order():
+    item = {
+        "platform": "Platform.FACEBOOK",
+        "claimed": "https://facebook.com/profile.php?id=42",
+        "ui": {"display_name": "Jane Jane", "snippet": ""},
+    }
+    codes = [r["code"] for r in score_single_identity(item).reasons]
+    assert codes == list(SINGLE_REASON_WEIGHTS)
+
+    batch = CeremonyBatch.from_ceremonies([({"num_identities": 1}, {"a": item}, None)])
+    assert list(reason_signals(batch)) == codes
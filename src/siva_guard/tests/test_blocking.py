@@ -0,0 +1,41 @@
+import random
+import string
+
+from siva_guard.pipeline.blocking import CONFUSABLE_THRESHOLD, all_pairs, confusable_candidates
+from siva_guard.pipeline.similarity import CONFUSABLE_LEV, confusability, confusable_pairs
+
+
+def test_confusable_candidates_has_no_false_negatives():
+    rng = random.Random(7)
+    base = ["".join(rng.choice(string.ascii_lowercase + "013") for _ in range(rng.randint(1, 14))) for _ in range(60)]
+    # near-duplicates: one edit away from a base handle
+    ids = list(base)
+    for s in base[:30]:
+        k = rng.randrange(len(s))
+        ids.append(s[:k] + rng.choice("ol5") + s[k + 1:])
+
+    expected = {
+        (i, j)
+        for i, j in all_pairs(len(ids))
+        if (confusability(ids[i], ids[j])["ratio"] or 0.0) >= CONFUSABLE_THRESHOLD
+    }
+    got = confusable_candidates(ids)
+    assert expected
+    assert expected <= got
+    assert len(got) < len(all_pairs(len(ids))) // 10
+
+
+def test_confusable_pairs_matches_full_scoring():
+    rng = random.Random(11)
+    ids = ["".join(rng.choice("abo01 ") for _ in range(rng.randint(0, 9))) for _ in range(80)]
+
+    expected = []
+    for i, j in all_pairs(len(ids)):
+        c = confusability(ids[i], ids[j])
+        if c["ratio"] is not None and c["ratio"] >= CONFUSABLE_THRESHOLD and c["lev"] <= CONFUSABLE_LEV:
+            expected.append((i, j))
+
+    assert expected
+    assert [(i, j) for i, j, _, _ in confusable_pairs(ids)] == expected
+    blocked = sorted(confusable_candidates(ids))
+    assert [(i, j) for i, j, _, _ in confusable_pairs(ids, pairs=blocked)] == expected
@@ -0,0 +1,65 @@
+import os
+
+import pytest
+from requests_cache import CachedResponse
+
+from siva_guard.connectors.cache_backend import DEFAULT_SHARDS, ShardedSQLiteCache, shard_count, shard_index
+
+
+def _key(i):
+    return f"{i:08x}" + "0" * 56  # hex digest-like; prefix picks the shard
+
+
+def test_keys_route_to_one_shard_and_redirects_share_the_files(tmp_path):
+    cache = ShardedSQLiteCache(tmp_path / "c", shards=4)
+    for i in range(8):
+        cache.responses[_key(i)] = CachedResponse(status_code=200, url=f"https://example.com/{i}")
+    cache.redirects["https://example.com/old"] = _key(5)
+
+    for i in range(8):
+        holders = [n for n, s in enumerate(cache.responses.shards) if _key(i) in s]
+        assert holders == [shard_index(_key(i), 4)] == [i % 4]
+    assert cache.responses[_key(6)].url == "https://example.com/6"
+
+    i = shard_index("https://example.com/old", 4)
+    assert cache.redirects["https://example.com/old"] == _key(5)
+    assert [n for n, s in enumerate(cache.redirects.shards) if "https://example.com/old" in s] == [i]
+    assert cache.redirects.shards[i].db_path == cache.responses.shards[i].db_path
+    assert sorted(p.name for p in (tmp_path / "c").glob("*.sqlite")) == [f"shard-{n:02d}.sqlite" for n in range(4)]
+
+
+def test_count_and_bulk_delete_span_shards(tmp_path):
+    cache = ShardedSQLiteCache(tmp_path / "c", shards=3)
+    for i in range(9):
+        cache.responses[_key(i)] = CachedResponse(status_code=200, url=f"https://example.com/{i}")
+    assert cache.count() == len(cache.responses) == 9 == len(list(cache.responses))
+
+    cache.responses.bulk_delete([_key(0), _key(4), _key(8), "missing"])
+    assert cache.count() == 6
+    assert [s.count() for s in cache.responses.shards] == [2, 2, 2]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_child_reopens_shards_after_fork(tmp_path):
+    cache = ShardedSQLiteCache(tmp_path / "c", shards=2)
+    cache.responses[_key(1)] = CachedResponse(status_code=200, url="https://example.com/1")
+
+    pid = os.fork()
+    if pid == 0:  # child: inherited handles dropped, reopened on first use
+        ok = all(s._connection is None for s in cache.responses.shards + cache.redirects.shards)
+        try:
+            ok = ok and cache.responses[_key(1)].url == "https://example.com/1"
+            cache.responses[_key(2)] = CachedResponse(status_code=200, url="https://example.com/2")
+        except Exception:
+            ok = False
+        os._exit(0 if ok else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert cache.responses[_key(2)].url == "https://example.com/2"
+
+
+def test_shard_count_falls_back_on_bad_values():
+    assert shard_count("16") == 16
+    assert shard_count(None) == shard_count("") == shard_count("eight") == DEFAULT_SHARDS
+    assert shard_count("0") == shard_count("-3") == shard_count("100000") == DEFAULT_SHARDS
@@ -0,0 +1,25 @@
+from siva_guard.pipeline.clustering import cluster_edges, cluster_metrics
+
+
+def test_clusters_strong_edges_and_attaches_confusable_suspects():
+    # 0-1 crosslinked, 1-2 same avatar -> one cluster; 3 is a near-duplicate handle of 0;
+    # 4-5 are confusable with each other only (no cluster to attach to).
+    src = [0, 1, 0, 4, 2]
+    dst = [1, 2, 3, 5, 5]
+    crosslink = [True, False, False, False, False]
+    avatar = [None, True, False, None, None]
+    sim = [0.5, 0.4, 0.95, 0.97, 0.3]
+
+    clusters = cluster_edges(6, src, dst, crosslink, avatar, sim)
+
+    assert len(clusters) == 1
+    c = clusters[0]
+    assert c.members == [0, 1, 2]
+    assert (c.crosslink_edges, c.avatar_match_edges) == (1, 1)
+    assert c.suspects == [3]
+    assert cluster_metrics(clusters) == {
+        "clusters": 1,
+        "largest_cluster": 3,
+        "clustered_identities": 3,
+        "suspect_identities": 1,
+    }
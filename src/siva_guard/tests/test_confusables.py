@@ -0,0 +1,66 @@
+import random
+import re
+import string
+
+from siva_guard.agent.runner import SivaAgentRunner
+from siva_guard.agent.tools.build_graph import BuildGraphTool
+from siva_guard.agent.tools.build_per_identity import BuildPerIdentityTool
+from siva_guard.agent.tools.decide_action import DecideActionTool
+from siva_guard.agent.tools.score_risk import ScoreRiskTool
+from siva_guard.core.schema import IdentityClaim, IdentityEvidence
+from siva_guard.pipeline.confusables import ASCII_HOMOGLYPHS, skeleton
+
+
+class _OfflineCollect:
+    name = "collect_evidence"
+
+    def run(self, st, cfg):
+        st.evidences = [IdentityEvidence(claim=c) for c in st.claims]
+        return {"num_evidences": len(st.evidences)}
+
+
+def test_invisible_only_identifier_scores_without_errors():
+    # "​" and "­" have an empty skeleton: no handle ratio, never confusable.
+    claims = [IdentityClaim(platform="github", claimed=c, ui={"display_name": "Alice"}) for c in ("alice", "​", "­")]
+    runner = SivaAgentRunner([_OfflineCollect(), BuildPerIdentityTool(), BuildGraphTool(), ScoreRiskTool(), DecideActionTool()])
+    out = runner.run({"identities": claims, "budget_s": 5})
+
+    assert "errors" not in out
+    assert out["overall_risk"] is not None
+    assert out["evidence_graph"]["metrics"]["confusable_pairs"] == 0
+
+
+def _legacy_normalize(s):
+    s = re.sub(r"\s+", "", (s or "").strip().lower())
+    for k, v in ASCII_HOMOGLYPHS.items():
+        s = s.replace(k, v)
+    return s
+
+
+def test_mixed_script_and_capital_lookalikes_fold_to_latin():
+    assert skeleton("pаypаl") == "paypal"  # Cyrillic a
+    assert skeleton("ΡΑΥΡΑL") == "paypal"  # Greek capitals
+    assert skeleton("ΗΝ") == "hn" and skeleton("ην") == "nv"  # case-specific prototypes
+    # Capitals without an entry of their own fold like their lowercase form.
+    assert skeleton("ƖeƖ") == skeleton("ɩeɩ") == "iei"
+    assert skeleton("Ԁev") == skeleton("ԁev") == "dev"
+
+
+def test_full_width_and_accents_fold():
+    assert skeleton("ｏｃｔｏｃａｔ") == skeleton("ＯＣＴＯＣＡＴ") == "octocat"
+    assert skeleton("ｏｃｔ０ｃａｔ") == "octocat"
+    assert skeleton("jósé") == "jose"
+
+
+def test_invisible_characters_are_dropped():
+    assert skeleton("oc\u200bto\u00adcat\ufeff") == "octocat"
+    assert skeleton("\u200b") == skeleton("\u00ad\u2060") == skeleton("\u0301") == ""
+    assert skeleton(None) == ""
+
+
+def test_ascii_matches_legacy_normalize_identifier():
+    rng = random.Random(7)
+    alphabet = string.ascii_letters + string.digits + "@$._- \t"
+    for _ in range(2000):
+        s = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+        assert skeleton(s) == _legacy_normalize(s)
@@ -0,0 +1,21 @@
+import pytest
+
+from siva_guard.core.deadline import BUDGET_EXHAUSTED, BudgetExhausted, Deadline
+from siva_guard.pipeline.avatar_hash import hash_avatar_url
+
+
+def test_deadline_clamps_timeouts_and_refuses_when_spent():
+    assert Deadline.after(None).timeout(12) == 12
+    assert Deadline.after(5).timeout(12) <= 5
+    assert Deadline.after(60).timeout(8) == 8
+
+    spent = Deadline.after(0)
+    assert spent.exhausted()
+    with pytest.raises(BudgetExhausted):
+        spent.timeout(8)
+
+
+def test_spent_budget_skips_uncached_enrichment_fetch():
+    res = hash_avatar_url("http://avatar.invalid/never-fetched.png", deadline=Deadline.after(0))
+    assert res.sha256 is None
+    assert res.error == BUDGET_EXHAUSTED
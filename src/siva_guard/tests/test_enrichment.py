@@ -0,0 +1,37 @@
+from siva_guard.pipeline.avatar_hash import AvatarHashResult
+from siva_guard.pipeline.enrichment import EnrichmentResult, enrichment_urls
+from siva_guard.pipeline.evidence_graph_v2 import build_evidence_graph_v2
+from siva_guard.pipeline.reverse_links import ReverseLinkResult
+
+
+def _item(claimed, bio, avatar):
+    return {
+        "platform": "Platform.WEBSITE",
+        "claimed": claimed,
+        "has_public": True,
+        "ui": {"display_name": "Jane"},
+        "public": {"display_name": "Jane", "bio": bio, "avatar_url": avatar},
+        "errors": [],
+    }
+
+
+def test_graph_reads_precomputed_enrichment_without_io():
+    per_identity = {
+        "https://jane.dev": _item("https://jane.dev", "me: https://jane.dev/about", "https://cdn.invalid/a.png"),
+        "https://blog.invalid": _item("https://blog.invalid", None, "https://cdn.invalid/a.png"),
+    }
+    assert enrichment_urls(per_identity["https://jane.dev"]) == ("https://cdn.invalid/a.png", "https://jane.dev/about")
+
+    enrichment = EnrichmentResult(
+        avatars={"https://cdn.invalid/a.png": AvatarHashResult("https://cdn.invalid/a.png", "ab" * 32, None)},
+        reverse_links={
+            "https://jane.dev/about": ReverseLinkResult("https://jane.dev/about", [], ["blog.invalid"], None, True),
+        },
+    )
+    g2 = build_evidence_graph_v2(per_identity, enrichment=enrichment)
+
+    nodes = {n["id"]: n for n in g2.nodes_out}
+    assert nodes["https://jane.dev"]["reverse_link_domains"] == ["blog.invalid"]
+    assert nodes["https://blog.invalid"]["avatar_sha256"] == "ab" * 32
+    assert g2.edges_out[0]["avatar_match"] is True
+    assert g2.edges_out[0]["crosslink_score"] == 0.5  # jane.dev links out to blog.invalid
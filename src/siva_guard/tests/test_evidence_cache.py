@@ -0,0 +1,32 @@
+from siva_guard.connectors.evidence_cache import EvidenceCache, http_entry_stamp
+from siva_guard.connectors.streaming import FETCH_STATUS_HEADER
+from siva_guard.core.schema import PublicEvidence
+
+
+class _Resp:
+    def __init__(self, url, content, status="complete"):
+        self.url = url
+        self.content = content
+        self.headers = {FETCH_STATUS_HEADER: status}
+
+
+def test_evidence_cache_follows_http_entry_and_returns_copies():
+    cache = EvidenceCache(max_entries=8)
+    url = "https://GitHub.com/jane#readme"
+    stamp = http_entry_stamp(_Resp("https://github.com/jane", b"<html>v1</html>"))
+
+    cache.put(url, stamp, PublicEvidence(display_name="Jane", external_links=["https://jane.dev/"]))
+
+    hit = cache.get("https://github.com/jane", stamp)
+    assert hit is not None and hit.display_name == "Jane"
+    hit.external_links.append("https://evil.example/")
+    assert cache.get(url, stamp).external_links == ["https://jane.dev/"]
+
+    # Body changed upstream (refresh / re-download) -> stamp differs -> re-extract.
+    assert cache.get(url, http_entry_stamp(_Resp("https://github.com/jane", b"<html>v2</html>"))) is None
+    assert cache.stats() == {"hits": 2, "misses": 1, "entries": 1}
+
+    # Same store after an extractor version change: the stored entry no longer matches.
+    cache.version = "social_url/0"
+    assert cache.get(url, stamp) is None
+    assert cache.stats() == {"hits": 2, "misses": 2, "entries": 1}
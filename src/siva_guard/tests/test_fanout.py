@@ -0,0 +1,41 @@
+import threading
+import time
+
+from siva_guard.connectors.base import Connector
+from siva_guard.connectors.fanout import collect_claims
+from siva_guard.core.schema import IdentityClaim, IdentityEvidence, Platform, UiCard
+
+
+class _SlowConnector(Connector):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def supports(self, claim):
+        return claim.platform == Platform.GITHUB
+
+    def collect(self, claim):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.2 if claim.claimed == "a" else 0.05)
+        with self.lock:
+            self.in_flight -= 1
+        ev = IdentityEvidence(claim=claim)
+        ev.errors.append(f"seen:{claim.claimed}")
+        return ev
+
+
+def _claim(claimed, platform=Platform.GITHUB):
+    return IdentityClaim(platform=platform, claimed=claimed, ui=UiCard())
+
+
+def test_collect_claims_keeps_claim_order_and_runs_concurrently():
+    claims = [_claim("a"), _claim("b"), _claim("c", Platform.EMAIL), _claim("d")]
+    connector = _SlowConnector()
+    evs = collect_claims(claims, [connector], concurrency=4)
+
+    assert [e.claim.claimed for e in evs] == ["a", "b", "c", "d"]
+    assert evs[2].errors == []  # unsupported -> in-app only
+    assert connector.max_in_flight > 1  # "b" / "d" run while "a" is still sleeping
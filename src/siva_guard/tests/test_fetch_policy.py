@@ -0,0 +1,45 @@
+import pytest
+import requests
+
+from siva_guard.connectors.fetch_policy import NegativeCache, TTL_POLICY, TTLRule, ttl_for
+
+
+class _Resp:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def test_ttl_policy_first_match_by_resource_and_host():
+    assert ttl_for("avatar", "https://cdn.example.com/a.png") == 7 * 24 * 3600
+    assert ttl_for("profile", "https://github.com/jane") == 15 * 60
+    assert ttl_for("profile", "https://api.github.com/users/jane") == 15 * 60
+    assert ttl_for("profile", "https://x.com/jane") == 30 * 60
+    assert ttl_for(None, "https://example.com/") == 3600
+
+    policy = [TTLRule("website", "*.example.org", 5)] + TTL_POLICY
+    assert ttl_for("website", "https://blog.example.org/", policy) == 5
+    assert ttl_for("website", "https://example.net/", policy) == 6 * 3600
+
+
+def test_negative_cache_replays_failures_and_skips_successes():
+    neg = NegativeCache(max_entries=2)
+    key = ("profile", "https://example.com/missing")
+
+    assert neg.record(key, "example.com", response=_Resp(200)) is None
+    assert neg.lookup(key, "example.com") is None
+
+    r404 = _Resp(404)
+    assert neg.record(key, "example.com", response=r404) == "http_404"
+    assert neg.lookup(key, "example.com").replay() is r404
+
+    tkey = ("avatar", "https://slow.example/a.png")
+    neg.record(tkey, "slow.example", error=requests.ReadTimeout("read timed out"))
+    with pytest.raises(requests.ReadTimeout):
+        neg.lookup(tkey, "slow.example").replay()
+
+    # 429 backs off the whole host; the LRU bound evicts the oldest key.
+    neg.record(("website", "https://busy.example/a"), "busy.example", response=_Resp(429, {"Retry-After": "120"}))
+    assert neg.lookup(("website", "https://busy.example/other"), "busy.example") is not None
+    assert neg.stats()["negative_entries"] == 2
+    assert neg.lookup(key, "example.com") is None
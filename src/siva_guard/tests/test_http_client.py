@@ -0,0 +1,135 @@
+import io
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from siva_guard.connectors.http_client import SESSION, STALE_WHILE_REVALIDATE_S, CoalescingCachedSession, cache_status
+from siva_guard.core.deadline import BudgetExhausted, Deadline
+
+_BODY = b"<html><head><title>Jane</title></head></html>"
+
+
+def test_cache_status_classifies_responses():
+    assert cache_status(SimpleNamespace(from_cache=False)) == "miss"
+    assert cache_status(SimpleNamespace(from_cache=True, is_expired=False)) == "fresh"
+    assert cache_status(SimpleNamespace(from_cache=True, is_expired=True)) == "stale"
+    assert cache_status(SimpleNamespace(from_cache=True, is_expired=True, revalidated=True)) == "revalidated"
+    assert cache_status(object()) is None
+    assert SESSION.settings.stale_while_revalidate == STALE_WHILE_REVALIDATE_S
+
+
+@pytest.fixture
+def origin(monkeypatch):
+    """
+    Transport under CappedHTTPAdapter: 200 with an ETag first, 304 for conditional GETs.
+    """
+    calls = []
+
+    def send(self, request, stream=False, **kwargs):
+        calls.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            raw = HTTPResponse(body=io.BytesIO(b""), headers={"ETag": '"v1"'}, status=304, preload_content=False)
+        else:
+            headers = {"Content-Type": "text/html", "ETag": '"v1"', "Content-Length": str(len(_BODY))}
+            raw = HTTPResponse(body=io.BytesIO(_BODY), headers=headers, status=200, preload_content=False)
+        return self.build_response(request, raw)
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    return calls
+
+
+def _session(**kwargs):
+    return CoalescingCachedSession(backend="memory", **kwargs)
+
+
+def test_conditional_revalidation_through_capped_adapter(origin):
+    sess = _session()
+    url = "https://example.com/jane"
+
+    first = sess.get(url, expire_after=1, resource="profile")
+    assert cache_status(first) == "miss" and first.content == _BODY
+    assert cache_status(sess.get(url, expire_after=1, resource="profile")) == "fresh"
+    assert origin == [None]
+
+    time.sleep(1.1)
+    again = sess.get(url, expire_after=1, resource="profile")
+    assert cache_status(again) == "revalidated"
+    assert origin == [None, '"v1"']
+    assert again.content == _BODY  # 304 kept the stored (capped) body
+
+
+def test_stale_while_revalidate_serves_expired_entry_then_refreshes(origin, monkeypatch):
+    # CoalescingCachedSession overrides requests-cache's private _resend_async hook; fail
+    # loudly if an upgrade stops routing background revalidation through it.
+    revalidated = []
+    resend_async = requests_cache.CachedSession._resend_async
+
+    def spy(self, request, actions, cached_response, **kwargs):
+        revalidated.append(cached_response)
+        return resend_async(self, request, actions, cached_response, **kwargs)
+
+    monkeypatch.setattr(requests_cache.CachedSession, "_resend_async", spy)
+    sess = _session(stale_while_revalidate=60)
+    url = "https://example.com/jane"
+    sess.get(url, expire_after=1, resource="profile")
+
+    time.sleep(1.1)
+    stale = sess.get(url, expire_after=1, resource="profile")
+    assert cache_status(stale) == "stale" and stale.content == _BODY
+
+    # The background conditional GET (304) renews the entry.
+    deadline = time.monotonic() + 5
+    while cache_status(sess.get(url, expire_after=1, resource="profile")) != "fresh":
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+    assert origin[:2] == [None, '"v1"'] and set(origin[1:]) == {'"v1"'}
+    assert revalidated and revalidated[0] is not stale  # a copy was revalidated
+    assert cache_status(stale) == "stale"
+
+
+def test_coalesced_callers_keep_their_own_deadlines(monkeypatch):
+    calls = []
+
+    def slow_send(self, request, stream=False, **kwargs):
+        calls.append(time.monotonic())
+        time.sleep(0.6)
+        headers = {"Content-Type": "text/html", "Content-Length": str(len(_BODY))}
+        return self.build_response(request, HTTPResponse(body=io.BytesIO(_BODY), headers=headers, status=200, preload_content=False))
+
+    monkeypatch.setattr(HTTPAdapter, "send", slow_send)
+
+    def get_in_thread(sess, url, deadline):
+        out = {}
+
+        def run():
+            try:
+                out["r"] = sess.get(url, resource="profile", deadline=deadline)
+            except Exception as e:
+                out["error"] = e
+
+        t = threading.Thread(target=run)
+        t.start()
+        time.sleep(0.1)  # let it lead the flight
+        return t, out
+
+    # Leader runs out of budget mid-fetch: the follower with time left fetches itself.
+    sess = _session()
+    t, leader = get_in_thread(sess, "https://example.com/a", Deadline.after(0.4))
+    r = sess.get("https://example.com/a", resource="profile", deadline=Deadline.after(5))
+    t.join()
+    assert isinstance(leader["error"], BudgetExhausted)
+    assert r.content == _BODY and len(calls) == 2
+
+    # Follower with less time than the fetch needs stops waiting at its own deadline.
+    t, leader = get_in_thread(sess, "https://example.com/b", None)
+    started = time.monotonic()
+    with pytest.raises(BudgetExhausted):
+        sess.get("https://example.com/b", resource="profile", deadline=Deadline.after(0.3))
+    assert time.monotonic() - started < 0.45
+    t.join()
+    assert leader["r"].content == _BODY
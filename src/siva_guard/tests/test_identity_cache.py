@@ -0,0 +1,76 @@
+from siva_guard.agent.config import AgentConfig
+from siva_guard.agent.state import CeremonyState
+from siva_guard.agent.tools.build_per_identity import BuildPerIdentityTool
+from siva_guard.core.schema import IdentityClaim, IdentityEvidence
+from siva_guard.pipeline.identity_cache import IdentityAnalysisCache, analysis_key, get_identity_cache
+from siva_guard.pipeline.identity_features import build_identity_features
+from siva_guard.pipeline.single_identity_risk import score_identity_features
+
+
+def _item(bio):
+    return {"platform": "Platform.GITHUB", "claimed": "octocat", "has_public": True, "public": {"bio": bio}, "ui": {}}
+
+
+def _put(cache, item, node):
+    f = build_identity_features("octocat", item)
+    key = analysis_key("octocat", item)
+    return key, cache.put(key, f, node, score_identity_features(f))
+
+
+def test_key_follows_evidence_content():
+    a, b = _item("hello"), _item("hello")
+    b["errors"] = ["timeout"]
+    assert analysis_key("octocat", a) == analysis_key("octocat", b)
+    assert analysis_key("octocat", a) != analysis_key("octocat", _item("bye"))
+    assert analysis_key("octocat", a)[:2] == ("github", "octocat")
+
+
+def test_lru_ttl_and_transient_errors():
+    cache = IdentityAnalysisCache(max_entries=2, ttl_s=60)
+    k1, _ = _put(cache, _item("one"), {"avatar_hash_error": "avatar_url_missing"})
+    k2, _ = _put(cache, _item("two"), {})
+    assert cache.get(k1) is not None  # k2 is now least recent
+    k3, _ = _put(cache, _item("three"), {})
+    assert cache.get(k2) is None and cache.get(k3) is not None
+
+    _, stored = _put(cache, _item("four"), {"reverse_link_error": "budget_exhausted"})
+    assert not stored
+
+    expired = IdentityAnalysisCache(ttl_s=0)
+    k, _ = _put(expired, _item("one"), {})
+    assert expired.get(k) is None
+
+
+def test_stored_analysis_is_not_aliased():
+    cache = IdentityAnalysisCache()
+    item = _item("hello")
+    f = build_identity_features("octocat", item)
+    node = {"bio_link_domains": ["a.dev"]}
+    risk = score_identity_features(f)
+    key = analysis_key("octocat", item)
+    cache.put(key, f, node, risk)
+
+    node["bio_link_domains"].append("b.dev")
+    risk.reasons.append({"code": "later_edit"})
+    hit = cache.get(key)
+    assert hit.node["bio_link_domains"] == ["a.dev"]
+    assert all(r["code"] != "later_edit" for r in hit.risk.reasons)
+
+
+def _per_identity_round(refresh):
+    st = CeremonyState(request={})
+    st.evidences = [IdentityEvidence(claim=IdentityClaim(platform="github", claimed="cache-refresh-test", ui={}))]
+    st.refresh = refresh
+    BuildPerIdentityTool().run(st, AgentConfig())
+    return st
+
+
+def test_refresh_skips_cached_analyses_but_keeps_keys():
+    st = _per_identity_round(refresh=False)
+    key = st.analysis_keys["cache-refresh-test"]
+    f = st.identity_features["cache-refresh-test"]
+    get_identity_cache().put(key, f, {}, score_identity_features(f))
+    assert "cache-refresh-test" in _per_identity_round(refresh=False).analysis_hits
+
+    st = _per_identity_round(refresh=True)
+    assert st.analysis_hits == {} and st.analysis_keys["cache-refresh-test"] == key
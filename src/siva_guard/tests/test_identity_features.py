@@ -0,0 +1,72 @@
+from siva_guard.pipeline.enrichment import EnrichmentResult
+from siva_guard.pipeline.evidence_graph_v2 import build_evidence_graph_v2
+from siva_guard.pipeline.identifiers import parse_claimed
+from siva_guard.pipeline.identity_features import build_features, build_identity_features
+from siva_guard.pipeline.linkout import extract_linkouts
+from siva_guard.pipeline.name_clean import clean_display_name
+from siva_guard.pipeline.single_identity_risk import score_identity_features, score_single_identity
+
+
+def _item(platform, claimed, public=None, ui=None):
+    return {"platform": platform, "claimed": claimed, "has_public": public is not None, "public": public, "ui": ui or {}, "errors": []}
+
+
+ITEMS = {
+    "jane": _item(
+        "Platform.GITHUB",
+        "https://github.com/jane",
+        {"display_name": "Jane Doe", "bio": "Blog: https://jane.dev, also @janedoe", "avatar_url": "https://cdn.invalid/j.png",
+         "external_links": ["https://jane.dev/about", "https://mastodon.invalid/@jane"]},
+    ),
+    "fb": _item("Platform.FACEBOOK", "https://www.facebook.com/profile.php?id=1000123", {"display_name": "Sam Sam", "bio": ""}),
+    "ui-only": _item("Platform.X", "@octocat", None, {"display_name": "Octo Cat", "snippet": "Software engineer", "avatar_url": "a.png"}),
+    "blank-public": _item(
+        "Platform.INSTAGRAM",
+        "insta_user",
+        {"display_name": "  ", "bio": " \n ", "avatar_url": " "},
+        {"display_name": "Insta User", "snippet": "links: https://insta.invalid", "avatar_url": "https://cdn.invalid/i.png"},
+    ),
+    "site": _item("Platform.WEBSITE", "https://www.jane.dev/", {"bio": "Welcome to my website"}),
+    "empty": _item("Platform.OTHER", "", None, None),
+}
+
+
+def _legacy_node(key, item):
+    # Node features as evidence_graph_v2 derived them from the raw item before IdentityFeatures.
+    pub, ui = item.get("public") or {}, item.get("ui") or {}
+    display_name = (pub.get("display_name") or "").strip() or (ui.get("display_name") or "").strip()
+    bio = (pub.get("bio") or "").strip() or (ui.get("snippet") or "").strip()
+    avatar_url = (pub.get("avatar_url") or "").strip() or (ui.get("avatar_url") or "").strip()
+    claimed = item.get("claimed") or key
+    parsed = parse_claimed(claimed, platform=item.get("platform"))
+    linkouts = extract_linkouts(bio or None)
+    external = pub.get("external_links") or []
+    return {
+        "claimed": claimed,
+        "display_name": display_name or None,
+        "display_name_clean": clean_display_name(display_name, platform=str(item.get("platform") or "")) or None,
+        "bio": bio or None,
+        "avatar_url": avatar_url or None,
+        "parsed_kind": parsed.kind,
+        "parsed_domain": parsed.domain,
+        "parsed_handle": parsed.handle,
+        "norm": parsed.normalized,
+        "bio_link_domains": list(linkouts.domains),
+        "bio_link_handles": list(linkouts.handles),
+        "external_links": list(external),
+        "reverse_link_url": linkouts.urls[0] if linkouts.urls else None,
+    }
+
+
+def test_feature_scoring_matches_raw_item_scoring():
+    for key, item in ITEMS.items():
+        assert score_identity_features(build_identity_features(key, item)) == score_single_identity(item), key
+
+
+def test_graph_node_features_match_raw_item_derivation():
+    g2 = build_evidence_graph_v2(ITEMS, enrichment=EnrichmentResult(), features=build_features(ITEMS))
+    nodes = dict(zip(g2.node_ids, g2.node_features))
+    assert nodes["jane"]["external_link_domains"] == ["jane.dev", "mastodon.invalid"]
+    for key, item in ITEMS.items():
+        expected = _legacy_node(key, item)
+        assert {k: nodes[key][k] for k in expected} == expected, key
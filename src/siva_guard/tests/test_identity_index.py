@@ -0,0 +1,82 @@
+from siva_guard.pipeline.identity_index import IdentityIndex, _index_from_env
+from siva_guard.pipeline.risk_v2 import compute_risk_v2
+
+
+def _node(handle, avatar, platform="github"):
+    return {"claimed": handle, "platform": platform, "parsed_handle": handle, "avatar_sha256": avatar, "external_link_domains": []}
+
+
+def test_avatar_reused_across_ceremonies_under_other_handles(tmp_path):
+    path = str(tmp_path / "index.jsonl")
+    index = IdentityIndex(path)
+    for i in range(3):
+        index.record(f"c{i}", [_node(f"farm{i}", "ab" * 32)])
+    index.record("c9", [_node("jane", "cd" * 32)])
+    index.record("c10", [_node("jane", "cd" * 32)])  # same person re-verifying: not reuse
+
+    reloaded = IdentityIndex(path)
+    sig = reloaded.lookup(["x", "jane"], [_node("octocat", "ab" * 32), _node("jane", "cd" * 32)], "now")
+    assert [(f["id"], f["kind"], f["ceremonies"]) for f in sig["flagged"]] == [("x", "avatar", 3)]
+    assert "jane" not in sig["identities"]
+
+    risk = compute_risk_v2({"num_identities": 1, "public_coverage": 1.0}, {}, cross_ceremony_reuse=sig)
+    assert risk.authenticity_risk >= 0.70
+    assert any(r["code"] == "cross_ceremony_reuse" for r in risk.reasons)
+
+
+def test_platform_host_domains_are_not_indexed(tmp_path):
+    index = IdentityIndex(str(tmp_path / "index.jsonl"))
+    for i, who in enumerate(["alice", "bob", "carol"]):
+        node = {"claimed": f"https://github.com/{who}", "platform": "Platform.GITHUB", "parsed_domain": "github.com"}
+        index.record(f"c{i}", [node])
+    for i in range(3):
+        index.record(f"s{i}", [{"claimed": f"site{i}", "platform": "website", "parsed_domain": "www.jane.dev"}])
+
+    dave = {"claimed": "https://github.com/dave", "platform": "Platform.GITHUB", "parsed_domain": "github.com"}
+    site = {"claimed": "https://jane.dev", "platform": "website", "parsed_domain": "jane.dev"}
+    sig = index.lookup(["dave", "site"], [dave, site], "now")
+    assert [(f["id"], f["kind"]) for f in sig["flagged"]] == [("site", "domain")]
+
+    sig = index.lookup(["dave"], [dave], "now")
+    risk = compute_risk_v2({"num_identities": 1, "public_coverage": 1.0}, {}, cross_ceremony_reuse=sig)
+    assert sig["flagged"] == [] and risk.authenticity_risk < 0.70
+
+
+def test_expired_ceremonies_are_swept_and_log_compacted(tmp_path):
+    path = tmp_path / "index.jsonl"
+    index = IdentityIndex(str(path), max_keys=4, window_s=3600)
+    for i in range(3):
+        index.record(f"c{i}", [_node(f"farm{i}", "ab" * 32)])
+    index._seen["c0"] -= 7200  # recorded two hours ago
+    assert index.reuse_count(("avatar", "ab" * 32), {"octocat"}, "now") == 2
+
+    for i in range(6):
+        index.record(f"d{i}", [_node(f"user{i}", None)])
+    assert len(index) == 4  # LRU over keys
+
+    index.compact()
+    assert "c0" not in index._seen
+    assert len(path.read_text().splitlines()) == len(index._seen)
+    reloaded = IdentityIndex(str(path), max_keys=4, window_s=3600)
+    assert sorted(reloaded._keys) == sorted(index._keys)
+
+
+def test_same_person_under_several_handles_is_not_reuse(tmp_path):
+    index = IdentityIndex(str(tmp_path / "index.jsonl"))
+    for i in range(4):
+        index.record(f"c{i}", [_node("jane", "ab" * 32), _node("janedoe", "ab" * 32, platform="x")])
+    # 5th /verify, with both identities or just one of them.
+    assert index.lookup(["gh", "x"], [_node("jane", "ab" * 32), _node("janedoe", "ab" * 32, platform="x")], "c9")["flagged"] == []
+    assert index.lookup(["x"], [_node("janedoe", "ab" * 32, platform="x")], "c9")["flagged"] == []
+
+
+def test_high_fan_out_values_are_not_flagged():
+    index = IdentityIndex(max_subjects=5)
+    for i in range(6):
+        index.record(f"c{i}", [_node(f"user{i}", "00" * 32)])  # platform default avatar
+    assert index.lookup(["x"], [_node("octocat", "00" * 32)], "now")["flagged"] == []
+
+
+def test_index_is_opt_in():
+    assert _index_from_env(None) is None and _index_from_env(" ") is None
+    assert _index_from_env("memory").path is None
@@ -0,0 +1,64 @@
+import random
+import string
+
+from siva_guard.agent.tools.build_per_identity import _evidence_to_per_identity
+from siva_guard.core.schema import IdentityClaim, IdentityEvidence, PublicEvidence
+from siva_guard.pipeline.enrichment import EnrichmentResult
+from siva_guard.pipeline.evidence_graph_v2 import build_evidence_graph_v2
+from siva_guard.pipeline.identity_features import build_features
+from siva_guard.pipeline.judge import judge_identity_set
+
+
+def _evidences(claims):
+    out = []
+    for platform, claimed, public in claims:
+        ev = IdentityEvidence(claim=IdentityClaim(platform=platform, claimed=claimed, ui={"display_name": "Jane"}))
+        if public:
+            ev.public = PublicEvidence(display_name="Jane", bio="hi")
+        out.append(ev)
+    return out
+
+
+def _claims(n, seed):
+    rng = random.Random(seed)
+    handles = ["".join(rng.choice(string.ascii_lowercase + "01") for _ in range(rng.randint(13, 16))) for _ in range(n)]
+    claims = []
+    for k, h in enumerate(handles):
+        if k % 5 == 1:  # near-duplicate of the previous handle
+            h = handles[k - 1][:-1] + rng.choice("ol5")
+        # URL-style claims (their handle is not the claimed string) in every other group
+        url = (k // 5) % 2 == 1
+        claims.append(("github", f"https://github.com/{h}", k % 2 == 0) if url else ("x", h, k % 2 == 0))
+    return claims
+
+
+def _judged_both_ways(evs, graph_kwargs=None):
+    per_identity = _evidence_to_per_identity(evs)
+    features = build_features(per_identity)
+    graph = build_evidence_graph_v2(per_identity, enrichment=EnrichmentResult(), features=features, **(graph_kwargs or {}))
+    assert list(graph.node_ids) == [e.claim.claimed for e in evs]  # judge takes the graph path
+    with_graph = judge_identity_set(evs, features=features, graph=graph)
+    return with_graph, judge_identity_set(evs), (per_identity, features, graph)
+
+
+def test_judge_reusing_graph_matches_standalone_judge():
+    for n in (12, 80):  # below and above BLOCKING_MIN_IDENTITIES
+        evs = _evidences(_claims(n, seed=n))
+        with_graph, standalone, _ = _judged_both_ways(evs)
+        hits = [r.message for r in standalone.reasons if r.code == "IDENTIFIERS_CONFUSABLE"]
+        assert any("https://" in m for m in hits) and any("https://" not in m for m in hits)
+        assert with_graph.model_dump() == standalone.model_dump()
+
+
+def test_judge_matches_on_session_reused_edges():
+    claims = _claims(12, seed=3)
+    evs = _evidences(claims)
+    _, _, (_, _, graph) = _judged_both_ways(evs)
+
+    # Follow-up round: one identity changed, edges between the others copied from the graph.
+    changed = claims[:-1] + [("x", claims[-2][1] + "x", False)]
+    evs2 = _evidences(changed)
+    reuse = {c for _, c, _ in claims[:-1]}
+    with_graph, standalone, _ = _judged_both_ways(evs2, {"previous": graph, "reuse": reuse})
+    assert len([r for r in standalone.reasons if r.code == "IDENTIFIERS_CONFUSABLE"]) == 3
+    assert with_graph.model_dump() == standalone.model_dump()
@@ -0,0 +1,37 @@
+from siva_guard.connectors.page_analysis import analyze_page
+
+
+_HTML = """
+<html>
+  <head>
+    <title> Jane &amp; Co </title>
+    <meta property="og:title" content=" Jane D ">
+    <meta property="og:description" content="">
+    <meta name="description" content="Builder">
+  </head>
+  <body>
+    <a href="#top">top</a>
+    <a href="https://x.com/jane#frag">x</a>
+    <a href="/about">about</a>
+    <a href="mailto:j@site.com">mail</a>
+    <p>Also at https://jane.dev/blog</p>
+  </body>
+</html>
+"""
+
+
+def test_analyze_page_single_pass_fields():
+    page = analyze_page(_HTML, base_url="https://site.com/jane")
+    assert page.title == "Jane & Co"
+    assert page.og("og:title") == "Jane D"
+    assert page.og("og:description") is None
+    assert page.meta("description") == "Builder"
+    assert page.links() == ["https://x.com/jane", "https://site.com/about"]
+    assert page.external_links(cap=50) == ["https://x.com/jane"]
+    assert page.absolute_hrefs() == ["https://x.com/jane#frag"]
+    assert "https://jane.dev/blog" in page.text_urls
+
+
+def test_analyze_page_empty_safe():
+    page = analyze_page("", base_url="https://site.com/")
+    assert page.title is None and page.links() == [] and page.text_urls == []
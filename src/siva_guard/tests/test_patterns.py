@@ -0,0 +1,36 @@
+import json
+import random
+
+import pytest
+
+from siva_guard.pipeline.patterns import PATTERN_PACK_VERSION, PatternMatcher, get_pattern_pack, load_pattern_pack
+from siva_guard.pipeline.single_identity_risk import score_single_identity
+
+
+def test_automaton_finds_every_occurrence():
+    rng = random.Random(3)
+    words = ["".join(rng.choice("abcd") for _ in range(rng.randint(1, 5))) for _ in range(300)]
+    pm = PatternMatcher(words, min_patterns=0)
+    small = PatternMatcher(words, min_patterns=len(words) + 1)
+    assert pm.use_automaton and not small.use_automaton
+
+    for _ in range(300):
+        text = "".join(rng.choice("abcde") for _ in range(rng.randint(0, 40)))
+        expected = sorted((i, w) for w in set(words) for i in range(len(text)) if text.startswith(w, i))
+        assert sorted(pm.finditer(text)) == expected
+        assert pm.search(text) == small.search(text)
+        assert pm.leftmost(text) == small.leftmost(text)
+
+
+def test_generic_bio_reason_reports_pattern():
+    r = score_single_identity({"platform": "facebook", "public": {"bio": "Jane Doe is on Facebook. Join Facebook to connect with Jane"}})
+    reason = next(x for x in r.reasons if x["code"] == "generic_platform_bio")
+    assert reason["pattern"] == "is on facebook. join facebook to connect with"
+    assert get_pattern_pack().version == PATTERN_PACK_VERSION
+
+
+def test_pattern_pack_version_is_checked(tmp_path):
+    path = tmp_path / "pack.json"
+    path.write_text(json.dumps({"version": PATTERN_PACK_VERSION + 1, "generic_bio": ["x"]}))
+    with pytest.raises(ValueError):
+        load_pattern_pack(str(path))
@@ -0,0 +1,59 @@
+from siva_guard.agent.session import CeremonySession, SessionStore
+from siva_guard.agent.state import CeremonyState
+from siva_guard.core.schema import IdentityClaim, IdentityEvidence
+
+
+def _claim(claimed, name="Jane"):
+    return IdentityClaim(platform="github", claimed=claimed, ui={"display_name": name})
+
+
+def _round(session, claims, errors=None):
+    st = CeremonyState(request={})
+    st.claims = claims
+    st.evidences = [IdentityEvidence(claim=c) for c in claims]
+    st.per_identity = {c.claimed: {"claimed": c.claimed, "errors": list((errors or {}).get(c.claimed, []))} for c in claims}
+    session.commit(st)
+
+
+def test_session_reuses_only_unchanged_identities():
+    s = CeremonySession(session_id="s1")
+    _round(s, [_claim("jane"), _claim("jdoe"), _claim("slow")], errors={"slow": ["budget_exhausted:collect"]})
+
+    follow_up = [_claim("jane"), _claim("jdoe", name="J. Doe"), _claim("slow"), _claim("new")]
+    assert s.reusable(follow_up) == {"jane"}
+
+
+def test_session_store_expires_and_evicts():
+    store = SessionStore(max_sessions=2, ttl_s=60)
+    a = store.get_or_create()
+    assert store.get_or_create(a.session_id) is a
+    assert store.get_or_create("unknown").session_id != "unknown"
+
+    a.updated_at -= 120
+    assert store.get_or_create(a.session_id) is not a
+    assert len(store) == 2
+
+
+def test_session_refetches_after_profile_edit_steps():
+    s = CeremonySession(session_id="s1")
+    claims = [_claim("jane"), _claim("jdoe")]
+    _round(s, claims)
+    assert s.reusable(claims) == {"jane", "jdoe"}
+    assert s.reusable(claims, refresh=True) == set()
+
+    st = CeremonyState(request={})
+    st.claims = claims
+    st.evidences = [IdentityEvidence(claim=c) for c in claims]
+    st.per_identity = {c.claimed: {"claimed": c.claimed, "errors": []} for c in claims}
+    st.result = {"next_steps": [{"code": "temporary_mutual_crosslink"}]}
+    s.commit(st)
+    assert s.refresh_pending and s.reusable(claims) == set()
+
+
+def test_session_store_bounded_by_size():
+    store = SessionStore(max_sessions=10, ttl_s=60, max_bytes=1000)
+    a, b = store.get_or_create(), store.get_or_create()
+    a.size_bytes = b.size_bytes = 600
+    c = store.get_or_create()
+    assert len(store) == 2 and store.get_or_create(a.session_id) is not a
+    assert store.get_or_create(c.session_id) is c
@@ -0,0 +1,31 @@
+import threading
+import time
+
+from siva_guard.connectors.http_client import canonical_url
+from siva_guard.connectors.singleflight import SingleFlight
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    sf = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.1)
+        return "body"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(sf.do("k", fetch))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert [v for v, _ in results] == ["body"] * 5
+    assert sf.stats() == {"original": 1, "coalesced": 4, "in_flight": 0}
+
+
+def test_canonical_url_normalizes_host_port_and_fragment():
+    assert canonical_url("HTTPS://GitHub.com:443#x") == "https://github.com/"
+    assert canonical_url("http://a.com:8080/p?q=1") == "http://a.com:8080/p?q=1"
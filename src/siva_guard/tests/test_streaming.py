@@ -0,0 +1,96 @@
+import io
+import time
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from siva_guard.connectors.streaming import DEADLINE_HEADER, CappedHTTPAdapter, FetchLimits, _read_capped
+from siva_guard.core.deadline import BudgetExhausted
+
+
+class _Raw:
+    def __init__(self):
+        self.pos = 0
+
+    def tell(self):
+        return self.pos
+
+
+class _FakeResponse:
+    def __init__(self, body, content_type="text/html", status_code=200):
+        self.body = body
+        self.status_code = status_code
+        self.headers = {"Content-Type": content_type}
+        self.raw = _Raw()
+        self.closed = False
+        self.read = 0
+
+    def iter_content(self, size):
+        for i in range(0, len(self.body), size):
+            chunk = self.body[i:i + size]
+            self.read += len(chunk)
+            self.raw.pos += len(chunk)
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+def test_read_capped_stops_after_head_window():
+    body = b"<html><head><title>x</title></head><body>" + b"a" * 200_000
+    r = _FakeResponse(body)
+    status = _read_capped(r, FetchLimits(max_bytes=150_000, html_only=True, head_window=1_000))
+    assert status == "truncated:head"
+    assert r._content.endswith(b"a" * 100) and len(r._content) < 2_000
+    assert r.read < 40_000 and r.closed
+
+
+def test_read_capped_skips_non_html_before_download():
+    r = _FakeResponse(b"\x89PNG" * 100, content_type="image/png")
+    assert _read_capped(r, FetchLimits(max_bytes=10, html_only=True)) == "skipped:content_type"
+    assert r.read == 0 and r._content == b""
+
+
+class _Drip(io.RawIOBase):
+    """Body that trickles in: one 16 KiB piece every `delay` seconds."""
+
+    def __init__(self, pieces, delay):
+        self.pieces = pieces
+        self.delay = delay
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if not self.pieces:
+            return 0
+        time.sleep(self.delay)
+        self.pieces -= 1
+        n = min(len(b), 16 * 1024)
+        b[:n] = b"a" * n
+        return n
+
+
+def test_deadline_bounds_slow_drip_body_and_redirect_hops(monkeypatch):
+    sent = []
+
+    def slow_drip(self, request, stream=False, **kwargs):
+        sent.append(request.url)
+        raw = HTTPResponse(body=_Drip(100, 0.02), headers={"Content-Type": "text/html"}, status=200, preload_content=False)
+        return self.build_response(request, raw)
+
+    monkeypatch.setattr(HTTPAdapter, "send", slow_drip)
+    sess = requests.Session()
+    sess.mount("http://", CappedHTTPAdapter())
+
+    started = time.monotonic()
+    with pytest.raises(BudgetExhausted):
+        sess.get("http://drip.invalid/", timeout=30, headers={DEADLINE_HEADER: repr(started + 0.5)})
+    assert time.monotonic() - started < 1.0  # the whole body would take 2s
+
+    # A hop (e.g. the next redirect) is refused outright once the budget is spent.
+    with pytest.raises(BudgetExhausted):
+        sess.get("http://drip.invalid/next", timeout=30, headers={DEADLINE_HEADER: repr(time.monotonic())})
+    assert sent == ["http://drip.invalid/"]